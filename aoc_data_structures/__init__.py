@@ -1,5 +1,48 @@
 """
 Convenience imports.
+
+Data structures are imported lazily on first attribute access, see
+data_structures/__init__.py.
 """
 
-from .data_structures import VectorTuple, IntegerSet, IntervalSortAdapter, Interval
+import os
+from . import data_structures
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .data_structures import (
+        VectorTuple,
+        IntegerSet,
+        IntervalSortAdapter,
+        FrozenIntegerSet,
+        HybridIntegerSet,
+        PersistentIntegerSet,
+        LazyIntegerSet,
+        BlockAllocator,
+        Interval,
+        Grid,
+        GridView,
+        GridIndex,
+        ArrayHash,
+        SparseGrid,
+    )
+
+__all__ = list(data_structures.__all__)
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(data_structures, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.environ.get("AOC_DATA_STRUCTURES_STATS"):
+    from . import instrumentation
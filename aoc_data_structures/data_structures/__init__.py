@@ -1,7 +1,58 @@
 """
 Convenience imports.
+
+Submodules are imported lazily on first attribute access, so importing one data
+structure doesn't pay for the dependencies (numpy, sortedcontainers) of the
+others.
 """
 
-from .vector_tuple import VectorTuple
-from .integer_set import IntegerSet, IntervalSortAdapter
-from .interval import Interval
+from importlib import import_module
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .vector_tuple import VectorTuple
+    from .integer_set import IntegerSet, IntervalSortAdapter
+    from .frozen_integer_set import FrozenIntegerSet
+    from .hybrid_integer_set import HybridIntegerSet
+    from .persistent_integer_set import PersistentIntegerSet
+    from .lazy_integer_set import LazyIntegerSet
+    from .block_allocator import BlockAllocator
+    from .interval import Interval
+    from .grid import Grid
+    from .grid_view import GridView
+    from .grid_index import GridIndex
+    from .array_hash import ArrayHash
+    from .sparse_grid import SparseGrid
+
+_EXPORTS = {
+    "VectorTuple": ".vector_tuple",
+    "IntegerSet": ".integer_set",
+    "IntervalSortAdapter": ".integer_set",
+    "FrozenIntegerSet": ".frozen_integer_set",
+    "HybridIntegerSet": ".hybrid_integer_set",
+    "PersistentIntegerSet": ".persistent_integer_set",
+    "LazyIntegerSet": ".lazy_integer_set",
+    "BlockAllocator": ".block_allocator",
+    "Interval": ".interval",
+    "Grid": ".grid",
+    "GridView": ".grid_view",
+    "GridIndex": ".grid_index",
+    "ArrayHash": ".array_hash",
+    "SparseGrid": ".sparse_grid",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
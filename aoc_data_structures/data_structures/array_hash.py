@@ -0,0 +1,128 @@
+"""
+ArrayHash datastructure.  An incrementally updated hash of a numpy array.
+"""
+
+from functools import lru_cache
+import numpy as np
+
+
+class ArrayHash:
+    """
+    Maintain a hash of a numpy array that can be updated in time proportional
+    to the number of changed cells rather than the size of the array.
+
+    The hash is a weighted sum of the cell values, modulo 2**64, where each cell
+    has a fixed pseudo-random odd weight.  Changing a cell from old to new
+    adjusts the hash by weight * (new - old), so the array is never rehashed.
+    Arrays of the same shape and dtype hash consistently, as long as the same
+    seed is used.
+
+    >>> tracked = ArrayHash(parse(["#.", ".."], compact=True))
+    >>> before = tracked.value
+    >>> tracked[0, 0] = ord(".")
+    >>> tracked[0, 0] = ord("#")
+    >>> tracked.value == before
+    True
+    """
+
+    def __init__(self, array, seed=0):
+        self.array = array
+        self.seed = seed
+        self._weights = _weights(array.shape, seed)
+        self.value = self._weighted_sum(self._weights, _as_words(array))
+
+    def __repr__(self):
+        return f"ArrayHash({self.value:#018x})"
+
+    def __getitem__(self, index):
+        return self.array[index]
+
+    def __setitem__(self, index, value):
+        """
+        Assign into the tracked array and update the hash with the difference.
+        Any numpy index is supported, including slices and fancy indexing.
+        A fancy index may repeat a cell, which numpy writes once, so the
+        changed cells are deduplicated before taking the difference.
+        """
+        if _is_basic(index):
+            cells = index
+            weights = self._weights[index]
+        else:
+            cells = np.unique(_positions(self.array.shape)[index])
+            weights = self._weights.flat[cells]
+
+        old = _as_words(np.array(self._cells(cells)))
+        self.array[index] = value
+        new = _as_words(np.array(self._cells(cells)))
+        delta = self._weighted_sum(weights, new - old)
+        self.value = (self.value + delta) % (1 << 64)
+
+    def _cells(self, cells):
+        """
+        Read cells, a basic index or an array of flat positions.
+        """
+        if isinstance(cells, np.ndarray):
+            return self.array.flat[cells]
+        return self.array[cells]
+
+    def rehash(self):
+        """
+        Recompute the hash from scratch, for use after the array was modified
+        without going through this object.
+        """
+        self.value = self._weighted_sum(self._weights, _as_words(self.array))
+        return self.value
+
+    @staticmethod
+    def _weighted_sum(weights, words):
+        """
+        Sum weights * words with 64 bit wrap-around.
+        """
+        with np.errstate(over="ignore"):
+            return int(np.sum(weights * words, dtype=np.uint64))
+
+
+def _as_words(array):
+    """
+    Reinterpret array elements as unsigned 64 bit integers, based on their raw
+    bit patterns.
+    """
+    array = np.asarray(array)
+    if array.dtype.hasobject or array.dtype.itemsize not in (1, 2, 4, 8):
+        raise TypeError(f"Unsupported dtype {array.dtype}.")
+    unsigned = array.view(np.dtype(f"u{array.dtype.itemsize}"))
+    return unsigned.astype(np.uint64)
+
+
+@lru_cache(maxsize=16)
+def _weights(shape, seed):
+    """
+    Generate the per-cell odd weights, shared between arrays of the same shape.
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(0, 1 << 63, size=shape, dtype=np.uint64)
+    weights = weights * np.uint64(2) + np.uint64(1)
+    weights.flags.writeable = False
+    return weights
+
+
+@lru_cache(maxsize=16)
+def _positions(shape):
+    """
+    Return the flat position of every cell, used to deduplicate fancy indices.
+    """
+    positions = np.arange(np.prod(shape, dtype=np.int64)).reshape(shape)
+    positions.flags.writeable = False
+    return positions
+
+
+def _is_basic(index):
+    """
+    Check if index only uses integers, slices, Ellipsis and None, which can't
+    select a cell twice.
+    """
+    indices = index if isinstance(index, tuple) else (index,)
+    return all(
+        item is None or item is Ellipsis or isinstance(item, (int, np.integer, slice))
+        for item in indices
+    )
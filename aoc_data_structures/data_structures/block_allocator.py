@@ -0,0 +1,118 @@
+"""
+BlockAllocator datastructure.  Allocates contiguous blocks of integers, such
+as disk or memory blocks, from a set of free runs.
+"""
+
+from sortedcontainers import SortedList
+from .persistent_integer_set import PersistentIntegerSet
+
+POLICIES = ("first", "best")
+
+
+class BlockAllocator:
+    """
+    Contiguous-block allocator over a set of free integers.  The free runs are
+    kept in a PersistentIntegerSet, whose treap nodes record the longest run in
+    their subtree, so the leftmost run that fits a request (first fit) is found
+    by a single O(log n) descent.  A SortedList of (length, start) pairs indexes
+    the same runs by length, so the shortest run that fits (best fit) is one
+    O(log n) bisection.
+
+    >>> allocator = BlockAllocator((0, 99))
+    >>> allocator.allocate(10)
+    (0, 9)
+    >>> allocator.allocate(5)
+    (10, 14)
+    >>> allocator.free((0, 9))
+    >>> allocator.allocate(8, policy="best")
+    (0, 7)
+    """
+
+    def __init__(self, *intervals):
+        self._free = PersistentIntegerSet(*intervals)
+        self._lengths = SortedList(
+            (end - start + 1, start) for start, end in self._free.runs()
+        )
+
+    def __repr__(self):
+        intervals = ", ".join(str(run) for run in self._free.runs())
+        return f"BlockAllocator({intervals})"
+
+    def __len__(self):
+        return len(self._free)
+
+    def __contains__(self, element):
+        return element in self._free
+
+    def allocate(self, size, policy="first"):
+        """
+        Allocate size contiguous integers, returning the inclusive (start, end)
+        block.  The block is taken from the start of the leftmost run that fits
+        (policy "first") or of the shortest run that fits (policy "best").
+        Raise ValueError if no free run is long enough.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unsupported policy {policy!r}.")
+        if size < 1:
+            raise ValueError("Block size must be positive.")
+
+        if policy == "first":
+            run = self._free.first_run(size)
+        else:
+            index = self._lengths.bisect_left((size,))
+            if index < len(self._lengths):
+                length, start = self._lengths[index]
+                run = start, start + length - 1
+            else:
+                run = None
+
+        if run is None:
+            raise ValueError(f"No free block of size {size}.")
+
+        start, end = run
+        block = start, start + size - 1
+        self._lengths.remove((end - start + 1, start))
+        if end > block[1]:
+            self._lengths.add((end - block[1], block[1] + 1))
+        self._free = self._free.discard_range(*block)
+        return block
+
+    def free(self, interval):
+        """
+        Return an inclusive (start, end) block to the free space, merging it
+        with adjacent free runs.  Raise ValueError if any of it is already
+        free.
+        """
+        start, end = min(interval), max(interval)
+        successor = self._free.successor(start)
+        if successor is not None and successor <= end:
+            raise ValueError(f"Block {interval} overlaps free space.")
+
+        for neighbor in (self._free.run(start - 1), self._free.run(end + 1)):
+            if neighbor is not None:
+                self._lengths.remove((neighbor[1] - neighbor[0] + 1, neighbor[0]))
+
+        self._free = self._free.add_range(start, end)
+        start, end = self._free.run(start)
+        self._lengths.add((end - start + 1, start))
+
+    def largest(self):
+        """
+        Return the length of the longest free run, the largest block that can
+        be allocated.
+        """
+        root = self._free.root()
+        return 0 if root is None else root.longest
+
+    def runs(self):
+        """
+        Return the free space as a list of ascending (start, end) pairs.
+        """
+        return self._free.runs()
+
+    def free_space(self):
+        """
+        Return the free space as a PersistentIntegerSet.  Snapshots are O(1) and
+        unaffected by later allocations.
+        """
+        return self._free
@@ -0,0 +1,17 @@
+"""
+Direction table shared by the grid data structures and helpers.
+"""
+
+# direction name, arrow or (row, column) delta -> (axis, increasing)
+DIRECTIONS = {
+    "north": (0, False),
+    "south": (0, True),
+    "west": (1, False),
+    "east": (1, True),
+    (-1, 0): (0, False),
+    (1, 0): (0, True),
+    (0, -1): (1, False),
+    (0, 1): (1, True),
+}
+DIRECTIONS.update({"^": DIRECTIONS["north"], "v": DIRECTIONS["south"]})
+DIRECTIONS.update({"<": DIRECTIONS["west"], ">": DIRECTIONS["east"]})
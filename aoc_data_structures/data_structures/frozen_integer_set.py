@@ -0,0 +1,168 @@
+"""
+FrozenIntegerSet datastructure.  A hashable, immutable IntegerSet.
+"""
+
+from functools import lru_cache, reduce
+from .integer_set import IntegerSet
+
+MEMO_SIZE = 1024
+
+
+class FrozenIntegerSet(IntegerSet):
+    """
+    Immutable IntegerSet, usable as a dict key or set member.  The runs and
+    their hash are computed once at construction, so hashing is O(1) and sets
+    with different hashes compare unequal in O(1).  Binary operations between
+    two frozen sets are memoized in a bounded LRU cache shared by all
+    instances.
+
+    In-place operators return a new set, like frozenset, and the mutating
+    methods raise TypeError.
+
+    >>> seen = {FrozenIntegerSet((0, 10)): 1}
+    >>> FrozenIntegerSet((0, 5), (6, 10)) in seen
+    True
+    """
+
+    def __init__(self, *intervals):
+        super().__init__(*intervals)
+        self._runs = tuple(super().runs())
+        self._hash = hash(self._runs)
+
+    def __repr__(self):
+        intervals = ", ".join(str(run) for run in self._runs)
+        return f"FrozenIntegerSet({intervals})"
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenIntegerSet):
+            return self._hash == other._hash and self._runs == other._runs
+        if isinstance(other, IntegerSet):
+            return list(self._runs) == other.runs()
+        return NotImplemented
+
+    def __or__(self, other):
+        return _combine("__ior__", self, other)
+
+    def __and__(self, other):
+        return _combine("__iand__", self, other)
+
+    def __sub__(self, other):
+        return _combine("__isub__", self, other)
+
+    def __xor__(self, other):
+        return _combine("__ixor__", self, other)
+
+    __ior__ = __or__
+    __iand__ = __and__
+    __isub__ = __sub__
+    __ixor__ = __xor__
+
+    def union(self, *others):
+        """
+        self | other_0 | other_1 | ...
+        """
+        return reduce(FrozenIntegerSet.__or__, others, self)
+
+    def intersection(self, *others):
+        """
+        self & other_0 & other_1 & ...
+        """
+        return reduce(FrozenIntegerSet.__and__, others, self)
+
+    def difference(self, *others):
+        """
+        self - other_0 - other_1 - ...
+        """
+        return reduce(FrozenIntegerSet.__sub__, others, self)
+
+    def symmetric_difference(self, other):
+        """
+        self ^ other
+        """
+        return self ^ other
+
+    def runs(self):
+        """
+        Return the set as a list of ascending (start, end) pairs.
+        """
+        return list(self._runs)
+
+    def copy(self):
+        """
+        Return self, frozen sets don't need copying.
+        """
+        return self
+
+    def thaw(self):
+        """
+        Return a mutable IntegerSet copy.
+        """
+        return IntegerSet.from_runs(self._runs)
+
+    @classmethod
+    def from_runs(cls, runs):
+        """
+        Build a frozen set from ascending, disjoint, non-adjacent (start, end)
+        pairs, such as those returned by IntegerSet.runs().
+        """
+        runs = tuple(map(tuple, runs))
+        frozen = super().from_runs(runs)
+        frozen._runs = runs
+        frozen._hash = hash(runs)
+        return frozen
+
+    @staticmethod
+    def memo_info():
+        """
+        Return the hit/miss statistics of the binary operation memo.
+        """
+        return _memoized.cache_info()  # pylint: disable=no-value-for-parameter
+
+    @staticmethod
+    def memo_clear():
+        """
+        Empty the binary operation memo.
+        """
+        _memoized.cache_clear()
+
+    def _immutable(self, *_):
+        """
+        Reject mutation.
+        """
+        raise TypeError("FrozenIntegerSet is immutable.")
+
+    add = remove = discard = pop = clear = _immutable
+    update = intersection_update = difference_update = _immutable
+    symmetric_difference_update = _immutable
+
+
+def _combine(operator, set_0, set_1):
+    """
+    Apply an in-place IntegerSet operator to a mutable copy of set_0, and
+    freeze the result.  Results for two frozen operands are memoized.  Other
+    operand types are left to their reflected operators.
+    """
+    if not isinstance(set_1, IntegerSet):
+        return NotImplemented
+    if isinstance(set_1, FrozenIntegerSet):
+        return _memoized(operator, set_0, set_1)
+    return _compute(operator, set_0, set_1)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _memoized(operator, set_0, set_1):
+    """
+    LRU cached _compute, for hashable operands.
+    """
+    return _compute(operator, set_0, set_1)
+
+
+def _compute(operator, set_0, set_1):
+    """
+    Apply the operator without memoization.
+    """
+    result = getattr(set_0.thaw(), operator)(set_1)
+    return FrozenIntegerSet.from_runs(result.runs())
@@ -0,0 +1,132 @@
+"""
+Grid datastructure.  A thin wrapper around a numpy array with cached bounds.
+"""
+
+from itertools import product
+import numpy as np
+from .vector_tuple import VectorTuple
+
+# marks an omitted take() default, so None can be a default on object grids
+_RAISE = object()
+
+
+class Grid:
+    """
+    Wrap an n-dimensional numpy array so that VectorTuple coordinates can be
+    bounds checked and looked up in a single step.  The bounds are computed
+    once at construction rather than on every lookup.
+
+    >>> grid = Grid(parse(["#.", ".."]))
+    >>> grid.get(VectorTuple(0, 0))
+    '#'
+    >>> grid.get(VectorTuple(-1, 0), "#")
+    '#'
+    """
+
+    def __init__(self, array):
+        self.array = np.asarray(array)
+        self.shape = self.array.shape
+        self.ndim = self.array.ndim
+        self._orthogonal_deltas = self._deltas(diagonals=False)
+        self._adjacency_deltas = self._deltas(diagonals=True)
+
+    def __repr__(self):
+        return f"Grid(shape={self.shape}, dtype={self.array.dtype})"
+
+    def __contains__(self, pos):
+        """
+        Check if pos is within the bounds of the grid.
+        """
+        if len(pos) != self.ndim:
+            return False
+
+        for element, size in zip(pos, self.shape):
+            if not 0 <= element < size:
+                return False
+
+        return True
+
+    def __getitem__(self, pos):
+        """
+        Index the underlying array directly, without a bounds check.
+        """
+        return self.array[pos]
+
+    def __setitem__(self, pos, value):
+        self.array[pos] = value
+
+    def __iter__(self):
+        """
+        Yield every coordinate of the grid.
+        """
+        for pos in product(*(range(size) for size in self.shape)):
+            yield VectorTuple(*pos)
+
+    def __len__(self):
+        return self.array.size
+
+    def get(self, pos, default=None):
+        """
+        Return the value at pos, or default if pos is out of bounds.
+        """
+        if pos in self:
+            return self[tuple(pos)]
+        return default
+
+    def neighbors(self, pos, diagonals=False):
+        """
+        Generate the in-bounds orthogonal neighbors of pos.  If diagonals is
+        set, generate the square/cube/hyper-cube adjacencies instead.
+        """
+        deltas = self._adjacency_deltas if diagonals else self._orthogonal_deltas
+        for delta in deltas:
+            next_pos = VectorTuple(
+                element + offset for element, offset in zip(pos, delta)
+            )
+            if next_pos in self:
+                yield next_pos
+
+    def take(self, coords, default=_RAISE):
+        """
+        Look up a batch of coordinates given as an (N, ndim) array.  Out of
+        bounds coordinates produce default, or raise IndexError if no default
+        is given.
+        """
+        coords = np.asarray(coords, dtype=np.intp).reshape(-1, self.ndim)
+        in_bounds = self._in_bounds(coords)
+
+        if default is _RAISE:
+            if not in_bounds.all():
+                raise IndexError("Coordinates out of bounds.")
+            return self._take(coords)
+
+        result = np.full(len(coords), default, dtype=self.array.dtype)
+        result[in_bounds] = self._take(coords[in_bounds])
+        return result
+
+    def find(self, value):
+        """
+        Return the coordinates of every cell equal to value.
+        """
+        return [VectorTuple(pos) for pos in np.argwhere(self.array == value).tolist()]
+
+    def _in_bounds(self, coords):
+        """
+        Return a boolean mask of the in-bounds rows of an (N, ndim) array.
+        """
+        return np.all((coords >= 0) & (coords < self.shape), axis=1)
+
+    def _take(self, coords):
+        """
+        Look up an (N, ndim) array of in-bounds coordinates.
+        """
+        return self.array[tuple(coords.T)]
+
+    def _deltas(self, diagonals):
+        """
+        Build the neighbor deltas for this grid's dimensionality.
+        """
+        origin = VectorTuple(0 for _ in self.shape)
+        if diagonals:
+            return tuple(origin.adjacencies(None))
+        return tuple(origin.orthogonals(None))
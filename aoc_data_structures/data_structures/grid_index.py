@@ -0,0 +1,159 @@
+"""
+GridIndex datastructure.  A per-symbol coordinate index of a 2-D grid.
+"""
+
+import numpy as np
+from .integer_set import IntegerSet
+from .directions import DIRECTIONS
+from .vector_tuple import VectorTuple
+
+
+class GridIndex:
+    """
+    Index the coordinates of every symbol of a 2-D grid, so repeated queries
+    don't rescan the grid.  The index is built once with a single stable sort
+    of the grid, and holds each symbol's coordinates sorted both row-major and
+    column-major.  Row and column queries bisect those arrays, so they take
+    O(log n) time.  The grid isn't referenced after construction, so later
+    changes to it aren't reflected.
+
+    >>> index = GridIndex(parse(["#..#", "....", ".#.."]))
+    >>> index.nearest("#", VectorTuple(0, 1), "east")
+    (0, 3)
+    >>> index.in_column("#", 1, 0, 2)
+    IntegerSet((2, 2))
+    """
+
+    def __init__(self, grid):
+        grid = np.asarray(grid)
+        if grid.ndim != 2:
+            raise ValueError("GridIndex only supports 2-D grids.")
+
+        self.shape = grid.shape
+        self.dtype = grid.dtype
+        self._by_row = {}
+        self._by_column = {}
+        self._sets = {}
+
+        order = np.argsort(grid.ravel(), kind="stable")
+        values, starts = np.unique(grid.ravel()[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+
+        for value, start, end in zip(values.tolist(), starts, ends):
+            rows, columns = np.divmod(order[start:end], max(self.shape[1], 1))
+            self._by_row[value] = np.stack((rows, columns), axis=1)
+            column_order = np.lexsort((rows, columns))
+            self._by_column[value] = np.stack(
+                (columns[column_order], rows[column_order]), axis=1
+            )
+
+    def __repr__(self):
+        return f"GridIndex(shape={self.shape}, symbols={self.symbols()})"
+
+    def __contains__(self, symbol):
+        return self._key(symbol) in self._by_row
+
+    def symbols(self):
+        """
+        Return the symbols present in the grid.
+        """
+        return list(self._by_row)
+
+    def count(self, symbol):
+        """
+        Return the number of occurrences of symbol.
+        """
+        return len(self._by_row.get(self._key(symbol), ()))
+
+    def positions(self, symbol):
+        """
+        Return an (N, 2) array of the coordinates of symbol, in row-major order.
+        """
+        return self._by_row.get(self._key(symbol), np.empty((0, 2), dtype=np.intp))
+
+    def in_row(self, symbol, row, start=None, end=None):
+        """
+        Return an IntegerSet of the columns of symbol in row, optionally
+        restricted to the inclusive column range [start, end].
+        """
+        return self._line_set(self._by_row, symbol, row, start, end)
+
+    def in_column(self, symbol, column, start=None, end=None):
+        """
+        Return an IntegerSet of the rows of symbol in column, optionally
+        restricted to the inclusive row range [start, end].
+        """
+        return self._line_set(self._by_column, symbol, column, start, end)
+
+    def nearest(self, symbol, pos, direction):
+        """
+        Return the coordinate of the nearest occurrence of symbol strictly
+        beyond pos in direction, or None if there isn't one.
+
+        direction:  "north", "south", "east", "west", "^", "v", "<", ">" or a
+                    delta such as VectorTuple(-1, 0)
+        """
+        key = tuple(direction) if len(direction) == 2 else direction
+        axis, increasing = DIRECTIONS[key]
+        line, offset = (pos[1], pos[0]) if axis == 0 else (pos[0], pos[1])
+        table = self._by_column if axis == 0 else self._by_row
+        offsets = self._line(table, symbol, line)
+
+        if increasing:
+            idx = np.searchsorted(offsets, offset, side="right")
+            if idx == len(offsets):
+                return None
+        else:
+            idx = np.searchsorted(offsets, offset, side="left") - 1
+            if idx < 0:
+                return None
+
+        found = int(offsets[idx])
+        return VectorTuple(found, line) if axis == 0 else VectorTuple(line, found)
+
+    def _key(self, symbol):
+        """
+        Accept single character symbols for compact uint8 grids.
+        """
+        if self.dtype == np.uint8 and isinstance(symbol, str):
+            return ord(symbol)
+        return symbol
+
+    def _line(self, table, symbol, line):
+        """
+        Return the sorted offsets of symbol along a single row or column.
+        """
+        coords = table.get(self._key(symbol))
+        if coords is None:
+            return np.empty(0, dtype=np.intp)
+        start, end = np.searchsorted(coords[:, 0], (line, line + 1))
+        return coords[start:end, 1]
+
+    def _line_set(self, table, symbol, line, start, end):
+        """
+        Return the offsets of symbol along a row or column as an IntegerSet,
+        caching the full line's set.  Range queries bisect the line's sorted
+        offsets and only convert the ones in range.
+        """
+        if start is None and end is None:
+            cache_key = (table is self._by_row, self._key(symbol), line)
+            if cache_key not in self._sets:
+                self._sets[cache_key] = _runs(self._line(table, symbol, line))
+            return self._sets[cache_key].copy()
+
+        offsets = self._line(table, symbol, line)
+        first = 0 if start is None else np.searchsorted(offsets, start, side="left")
+        last = len(offsets) if end is None else np.searchsorted(offsets, end, "right")
+        return _runs(offsets[first:last])
+
+
+def _runs(offsets):
+    """
+    Convert sorted unique offsets to an IntegerSet of contiguous runs.
+    """
+    if len(offsets) == 0:
+        return IntegerSet()
+    breaks = np.flatnonzero(np.diff(offsets) != 1) + 1
+    starts = offsets[np.append(0, breaks)].tolist()
+    ends = offsets[np.append(breaks - 1, len(offsets) - 1)].tolist()
+    return IntegerSet.from_runs(zip(starts, ends))
@@ -0,0 +1,138 @@
+"""
+GridView datastructure.  A virtual scaled and/or tiled view of a grid.
+"""
+
+from itertools import product
+import numpy as np
+from .grid import Grid
+from .vector_tuple import VectorTuple
+
+
+class GridView(Grid):
+    """
+    Present a grid scaled up and/or repeated, without allocating the result.
+    Each cell of the source array becomes a block of scale cells along every
+    axis, as with expand_grid, and the scaled grid is then tiled reps times
+    along every axis.  If reps is None, the grid is tiled infinitely in every
+    direction, including negative coordinates.
+
+    Lookups are mapped back to the source array with integer division and
+    modulo arithmetic, so memory stays proportional to the source array.
+    Assignments write through to the source cell, and are visible in every
+    repetition of it.
+
+    >>> view = GridView(parse(["#.", ".."]), reps=5)
+    >>> view.shape
+    (10, 10)
+    >>> view[VectorTuple(8, 4)]
+    '#'
+    """
+
+    def __init__(self, array, scale=1, reps=1):
+        super().__init__(array)
+        self.base_shape = self.array.shape
+        self.scale = _per_axis(scale, self.ndim)
+        self.reps = None if reps is None else _per_axis(reps, self.ndim)
+        self._period = tuple(
+            size * scale for size, scale in zip(self.base_shape, self.scale)
+        )
+
+        if self.reps is None:
+            self.shape = None
+        else:
+            self.shape = tuple(
+                period * reps for period, reps in zip(self._period, self.reps)
+            )
+
+    def __repr__(self):
+        return (
+            f"GridView(base_shape={self.base_shape}, scale={self.scale}, "
+            f"reps={self.reps}, dtype={self.array.dtype})"
+        )
+
+    def __contains__(self, pos):
+        if self.shape is None:
+            return len(pos) == self.ndim
+        return super().__contains__(pos)
+
+    def __getitem__(self, pos):
+        return self.array[self.source(pos)]
+
+    def __setitem__(self, pos, value):
+        self.array[self.source(pos)] = value
+
+    def __iter__(self):
+        if self.shape is None:
+            raise TypeError("Can't iterate over an infinitely tiled GridView.")
+        return super().__iter__()
+
+    def __len__(self):
+        if self.shape is None:
+            raise TypeError("An infinitely tiled GridView has no length.")
+        return int(np.prod(self.shape))
+
+    def source(self, pos):
+        """
+        Map a view coordinate to the corresponding source array coordinate.
+        """
+        return tuple(
+            (element % period) // scale
+            for element, period, scale in zip(pos, self._period, self.scale)
+        )
+
+    def find(self, value):
+        """
+        Return the view coordinates of every cell equal to value.  Only
+        supported for finite views.
+        """
+        if self.shape is None:
+            raise TypeError("Can't find values in an infinitely tiled GridView.")
+
+        sources = np.argwhere(self.array == value)
+        offsets = [
+            np.arange(0, period * reps, period) + np.arange(scale)[:, np.newaxis]
+            for period, reps, scale in zip(self._period, self.reps, self.scale)
+        ]
+
+        coords = []
+        for source in sources:
+            axes = (
+                (source[axis] * self.scale[axis] + offsets[axis]).ravel().tolist()
+                for axis in range(self.ndim)
+            )
+            coords.extend(VectorTuple(*pos) for pos in product(*axes))
+        return sorted(coords)
+
+    def materialize(self):
+        """
+        Return the view as a dense numpy array.  Only supported for finite views.
+        """
+        if self.shape is None:
+            raise TypeError("Can't materialize an infinitely tiled GridView.")
+
+        array = self.array
+        for axis, scale in enumerate(self.scale):
+            array = np.repeat(array, scale, axis=axis)
+        return np.tile(array, self.reps)
+
+    def _in_bounds(self, coords):
+        if self.shape is None:
+            return np.ones(len(coords), dtype=bool)
+        return super()._in_bounds(coords)
+
+    def _take(self, coords):
+        coords = (coords % self._period) // self.scale
+        return self.array[tuple(coords.T)]
+
+
+def _per_axis(value, ndim):
+    """
+    Broadcast an int to a per-axis tuple.
+    """
+    if isinstance(value, int):
+        return (value,) * ndim
+
+    value = tuple(value)
+    if len(value) != ndim:
+        raise ValueError(f"Expected {ndim} values, got {value}.")
+    return value
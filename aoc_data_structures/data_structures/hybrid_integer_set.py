@@ -0,0 +1,497 @@
+"""
+HybridIntegerSet datastructure.  A roaring-style set of integers, split into
+fixed size chunks that each use the most compact of three containers.
+"""
+
+from collections import Counter
+from types import MappingProxyType
+import numpy as np
+from ..run_helpers import combine, concatenate, normalize, sorted_unique
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+
+RUNS = "runs"
+ARRAY = "array"
+BITMAP = "bitmap"
+
+_BITMAP_BYTES = CHUNK_SIZE // 8
+
+_ARRAY_OPERATIONS = {
+    "union": np.union1d,
+    "intersection": lambda values_0, values_1: np.intersect1d(
+        values_0, values_1, assume_unique=True
+    ),
+    "difference": lambda values_0, values_1: np.setdiff1d(
+        values_0, values_1, assume_unique=True
+    ),
+    "symmetric_difference": lambda values_0, values_1: np.setxor1d(
+        values_0, values_1, assume_unique=True
+    ),
+}
+
+_BITMAP_OPERATIONS = {
+    "union": np.bitwise_or,
+    "intersection": np.bitwise_and,
+    "difference": lambda bits_0, bits_1: bits_0 & ~bits_1,
+    "symmetric_difference": np.bitwise_xor,
+}
+
+
+class HybridIntegerSet:
+    """
+    Set of integers partitioned into chunks of 2**16 values.  Each non-empty
+    chunk holds its members' low 16 bits in whichever container is smallest:
+
+    runs:    (N, 2) uint16 array of inclusive runs, 4 bytes per run
+    array:   sorted uint16 array, 2 bytes per member
+    bitmap:  8 KiB bitmap of the whole chunk
+
+    Set operations only visit the chunks present in the operands, and combine
+    chunk pairs with a kernel chosen by container type: array merges for two
+    arrays, a run sweep for two runs, and bitwise operations otherwise.  This
+    keeps scattered members at about 2 bytes each, where an IntegerSet needs
+    an Interval object per member, while long runs stay compact.  Ranges
+    spanning many chunks are stored once per chunk, so for a few huge
+    intervals IntegerSet remains the better choice.
+
+    The interface follows IntegerSet, with constructor arguments being
+    inclusive (start, end) intervals.
+
+    >>> iset = HybridIntegerSet.from_values(range(0, 300000, 50))
+    >>> iset.container_counts()
+    Counter({'array': 5})
+    >>> (iset | HybridIntegerSet((0, 65535))).container_counts()
+    Counter({'array': 4, 'runs': 1})
+    """
+
+    def __init__(self, *intervals):
+        chunk_runs = {}
+
+        for interval in intervals:
+            start, end = min(interval), max(interval)
+            for key in range(start >> CHUNK_BITS, (end >> CHUNK_BITS) + 1):
+                base = key << CHUNK_BITS
+                run = (max(start, base) - base, min(end, base + CHUNK_SIZE - 1) - base)
+                chunk_runs.setdefault(key, []).append(run)
+
+        self._chunks = {
+            key: _from_runs(normalize(chunk_runs[key])) for key in sorted(chunk_runs)
+        }
+
+    def __repr__(self):
+        intervals = ", ".join(str(run) for run in self.runs())
+        return f"HybridIntegerSet({intervals})"
+
+    def __iter__(self):
+        for key, container in self._chunks.items():
+            yield from (_values(container) + (key << CHUNK_BITS)).tolist()
+
+    def __len__(self):
+        return sum(_cardinality(container) for container in self._chunks.values())
+
+    def __contains__(self, element):
+        container = self._chunks.get(element >> CHUNK_BITS)
+        if container is None:
+            return False
+        return bool(_contains(container, np.array([element & (CHUNK_SIZE - 1)]))[0])
+
+    def __eq__(self, other):
+        """
+        Containers are chosen deterministically from their contents, so equal
+        sets have identical chunks.
+        """
+        if not isinstance(other, HybridIntegerSet):
+            return NotImplemented
+        chunks = other.chunks()
+        return self._chunks.keys() == chunks.keys() and all(
+            _equal(container, chunks[key]) for key, container in self._chunks.items()
+        )
+
+    def __or__(self, other):
+        return self._combine(other, "union")
+
+    def __and__(self, other):
+        return self._combine(other, "intersection")
+
+    def __sub__(self, other):
+        return self._combine(other, "difference")
+
+    def __xor__(self, other):
+        return self._combine(other, "symmetric_difference")
+
+    def __ior__(self, other):
+        self._chunks = (self | other)._chunks
+        return self
+
+    def __iand__(self, other):
+        self._chunks = (self & other)._chunks
+        return self
+
+    def __isub__(self, other):
+        self._chunks = (self - other)._chunks
+        return self
+
+    def __ixor__(self, other):
+        self._chunks = (self ^ other)._chunks
+        return self
+
+    def __le__(self, other):
+        return len(self - other) == 0
+
+    def __ge__(self, other):
+        return len(other - self) == 0
+
+    def __lt__(self, other):
+        return self <= other and self != other
+
+    def __gt__(self, other):
+        return self >= other and self != other
+
+    def union(self, *others):
+        """
+        self | other_0 | other_1 | ...
+        """
+        result = self.copy()
+        for other in others:
+            result |= other
+        return result
+
+    def intersection(self, *others):
+        """
+        self & other_0 & other_1 & ...
+        """
+        result = self.copy()
+        for other in others:
+            result &= other
+        return result
+
+    def difference(self, *others):
+        """
+        self - other_0 - other_1 - ...
+        """
+        result = self.copy()
+        for other in others:
+            result -= other
+        return result
+
+    def symmetric_difference(self, other):
+        """
+        self ^ other
+        """
+        return self ^ other
+
+    def isdisjoint(self, other):
+        """
+        Return true if self has no common elements with other.
+        """
+        return len(self & other) == 0
+
+    def add(self, element):
+        """
+        Add a new integer to the set.
+        """
+        self |= HybridIntegerSet((element, element))
+
+    def remove(self, element):
+        """
+        Remove an integer from the set.  Raise KeyError if it isn't present.
+        """
+        if element not in self:
+            raise KeyError(element)
+        self.discard(element)
+
+    def discard(self, element):
+        """
+        Remove an integer from the set if present.
+        """
+        self -= HybridIntegerSet((element, element))
+
+    def clear(self):
+        """
+        Remove all elements.
+        """
+        self._chunks = {}
+
+    def copy(self):
+        """
+        Return a copy.  Containers are never modified in place, so they're
+        shared with the copy.
+        """
+        return self._from_chunks(dict(self._chunks))
+
+    def runs(self):
+        """
+        Return the set as a list of ascending (start, end) pairs, like
+        IntegerSet.runs().
+        """
+        return [tuple(run) for run in self._run_array().tolist()]
+
+    def chunks(self):
+        """
+        Return a read-only view of the {chunk: (container type, data)} map,
+        in ascending chunk order.  A chunk holds the values chunk << 16 to
+        (chunk << 16) + 65535.
+        """
+        return MappingProxyType(self._chunks)
+
+    def container_counts(self):
+        """
+        Return a Counter of the container types in use.
+        """
+        return Counter(kind for kind, _ in self._chunks.values())
+
+    @property
+    def nbytes(self):
+        """
+        Return the bytes used by the container arrays.
+        """
+        return sum(data.nbytes for _, data in self._chunks.values())
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Build a set from an iterable or array of integers, in any order and
+        with duplicates.
+        """
+        if not isinstance(values, np.ndarray):
+            values = np.fromiter(values, dtype=np.int64)
+        values = sorted_unique(values.astype(np.int64))
+        keys = values >> CHUNK_BITS
+        splits = np.flatnonzero(np.diff(keys)) + 1
+        chunks = {}
+
+        for chunk in np.split(values, splits) if len(values) else ():
+            lows = (chunk & (CHUNK_SIZE - 1)).astype(np.uint16)
+            chunks[int(chunk[0]) >> CHUNK_BITS] = _from_values(lows)
+
+        return cls._from_chunks(chunks)
+
+    @classmethod
+    def from_runs(cls, runs):
+        """
+        Build a set from inclusive (start, end) pairs, such as those returned
+        by IntegerSet.runs().
+        """
+        return cls(*runs)
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        """
+        Build a set around a dict of containers keyed by ascending chunk.
+        """
+        iset = cls()
+        iset._chunks = chunks
+        return iset
+
+    def _combine(self, other, operation):
+        """
+        Combine the chunks of self and other.  Chunks present in only one
+        operand are shared, or dropped if the operation excludes them.
+        """
+        chunks_0, chunks_1 = self._chunks, other.chunks()
+        keys = chunks_0.keys() | chunks_1.keys()
+        if operation == "intersection":
+            keys = chunks_0.keys() & chunks_1.keys()
+        elif operation == "difference":
+            keys = chunks_0.keys()
+
+        chunks = {}
+        for key in sorted(keys):
+            container_0 = chunks_0.get(key)
+            container_1 = chunks_1.get(key)
+
+            if container_1 is None or container_0 is None:
+                chunks[key] = container_0 or container_1
+                continue
+
+            container = _combine_containers(container_0, container_1, operation)
+            if container is not None:
+                chunks[key] = container
+
+        return self._from_chunks(chunks)
+
+    def _run_array(self):
+        """
+        Return the whole set as an int64 run array.
+        """
+        return concatenate(
+            [
+                _runs(container) + (key << CHUNK_BITS)
+                for key, container in self._chunks.items()
+            ]
+        )
+
+
+def _combine_containers(container_0, container_1, operation):
+    """
+    Combine two containers of the same chunk.  Return None if the result is
+    empty.
+    """
+    (kind_0, data_0), (kind_1, data_1) = container_0, container_1
+
+    if kind_0 == kind_1 == ARRAY:
+        return _from_values(_ARRAY_OPERATIONS[operation](data_0, data_1))
+
+    if kind_0 == ARRAY and operation in ("intersection", "difference"):
+        inside = _contains(container_1, data_0)
+        return _from_values(data_0[inside if operation == "intersection" else ~inside])
+
+    if kind_1 == ARRAY and operation == "intersection":
+        return _from_values(data_1[_contains(container_0, data_1)])
+
+    if kind_0 == kind_1 == RUNS:
+        return _from_runs(combine(_runs(container_0), _runs(container_1), operation))
+
+    bits = _BITMAP_OPERATIONS[operation](_bitmap(container_0), _bitmap(container_1))
+    return _from_bitmap(bits)
+
+
+def _from_runs(runs):
+    """
+    Build the smallest container holding the int64 run array runs.
+    """
+    count = int((runs[:, 1] - runs[:, 0] + 1).sum())
+    if count == 0:
+        return None
+
+    kind = _best(len(runs), count)
+    if kind == RUNS:
+        return RUNS, runs.astype(np.uint16)
+    if kind == ARRAY:
+        return ARRAY, _values((RUNS, runs)).astype(np.uint16)
+    return BITMAP, _bitmap((RUNS, runs))
+
+
+def _from_values(values):
+    """
+    Build the smallest container holding the sorted uint16 array values.
+    """
+    if len(values) == 0:
+        return None
+
+    starts = np.flatnonzero(np.diff(values.astype(np.int64)) != 1) + 1
+    if _best(len(starts) + 1, len(values)) == ARRAY:
+        return ARRAY, values.astype(np.uint16)
+
+    starts = np.append(0, starts)
+    ends = np.append(starts[1:] - 1, len(values) - 1)
+    runs = np.stack((values[starts], values[ends]), axis=1).astype(np.int64)
+    return _from_runs(runs)
+
+
+def _from_bitmap(bits):
+    """
+    Build the smallest container holding the packed bitmap bits.
+    """
+    count = int(np.bitwise_count(bits).sum())
+    if count == 0:
+        return None
+
+    mask = np.unpackbits(bits, bitorder="little").view(bool)
+    changes = np.diff(mask.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    if _best(int(np.count_nonzero(changes == 1)), count) == BITMAP:
+        return BITMAP, bits
+
+    starts = np.flatnonzero(changes == 1)
+    ends = np.flatnonzero(changes == -1) - 1
+    return _from_runs(np.stack((starts, ends), axis=1))
+
+
+def _best(run_count, count):
+    """
+    Choose the container type using the fewest bytes, preferring runs, then
+    arrays, on ties.
+    """
+    sizes = {RUNS: 4 * run_count, ARRAY: 2 * count, BITMAP: _BITMAP_BYTES}
+    return min(sizes, key=sizes.get)
+
+
+def _runs(container):
+    """
+    Return a container's members as an int64 run array.
+    """
+    kind, data = container
+    if kind == RUNS:
+        return data.astype(np.int64)
+
+    values = _values(container).astype(np.int64)
+    starts = np.flatnonzero(np.diff(values) != 1) + 1
+    starts = np.append(0, starts)
+    ends = np.append(starts[1:] - 1, len(values) - 1)
+    return np.stack((values[starts], values[ends]), axis=1)
+
+
+def _values(container):
+    """
+    Return a container's members as a sorted int64 array.
+    """
+    kind, data = container
+    if kind == ARRAY:
+        return data.astype(np.int64)
+    if kind == BITMAP:
+        return np.flatnonzero(np.unpackbits(data, bitorder="little"))
+
+    runs = data.astype(np.int64)
+    lengths = runs[:, 1] - runs[:, 0] + 1
+    offsets = np.repeat(runs[:, 0] - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(lengths.sum())
+
+
+def _bitmap(container):
+    """
+    Return a container's members as a packed bitmap.
+    """
+    kind, data = container
+    if kind == BITMAP:
+        return data
+
+    mask = np.zeros(CHUNK_SIZE, dtype=bool)
+    if kind == ARRAY:
+        mask[data] = True
+    else:
+        runs = data.astype(np.int64)
+        delta = np.zeros(CHUNK_SIZE + 1, dtype=np.int8)
+        delta[runs[:, 0]] = 1
+        delta[runs[:, 1] + 1] = -1
+        mask = np.cumsum(delta[:-1]) > 0
+
+    return np.packbits(mask, bitorder="little")
+
+
+def _contains(container, lows):
+    """
+    Return a boolean array, True where the low values are in the container.
+    """
+    kind, data = container
+    if kind == BITMAP:
+        return (data[lows >> 3] >> (lows & 7).astype(np.uint8)) & 1 == 1
+
+    if kind == ARRAY:
+        idx = np.searchsorted(data, lows)
+        return (idx < len(data)) & (data[np.minimum(idx, len(data) - 1)] == lows)
+
+    started = np.searchsorted(data[:, 0], lows, side="right")
+    ended = np.searchsorted(data[:, 1], lows, side="left")
+    return started > ended
+
+
+def _cardinality(container):
+    """
+    Return the number of members of a container.
+    """
+    kind, data = container
+    if kind == ARRAY:
+        return len(data)
+    if kind == BITMAP:
+        return int(np.bitwise_count(data).sum())
+    return int((data[:, 1].astype(np.int64) - data[:, 0] + 1).sum())
+
+
+def _equal(container_0, container_1):
+    """
+    Check if two canonical containers are identical.
+    """
+    return container_0[0] == container_1[0] and np.array_equal(
+        container_0[1], container_1[1]
+    )
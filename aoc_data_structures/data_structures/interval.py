@@ -201,7 +201,7 @@ class Interval:
         """
         Checks to see if the instance's values are increasing.
         """
-        return self.end > self.start
+        return self.end >= self.start
 
     @staticmethod
     def swap(value_0, value_1):
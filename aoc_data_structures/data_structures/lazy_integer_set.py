@@ -0,0 +1,222 @@
+"""
+LazyIntegerSet datastructure.  A set expression over IntegerSets, evaluated
+when its result is needed.
+"""
+
+from functools import reduce
+import numpy as np
+from ..run_helpers import (
+    OPERATIONS,
+    as_runs,
+    cardinality,
+    covered,
+    from_flags,
+    sorted_unique,
+    to_integer_set,
+)
+
+_SYMBOLS = {
+    "union": "|",
+    "intersection": "&",
+    "difference": "-",
+    "symmetric_difference": "^",
+}
+
+
+class LazyIntegerSet:
+    """
+    Lazy set expression.  Operators on a LazyIntegerSet build an expression
+    tree instead of copying an intermediate set per operator.  When the result
+    is consumed the whole tree is evaluated in one sweep: every leaf's run
+    boundaries are merged into one sorted array of points, each leaf's
+    membership at every point is found by bisection, and the tree is applied
+    to the membership flags.
+
+    IntegerSet operands may appear on either side of an operator, so
+    IntegerSet | LazyIntegerSet is lazy too.
+
+    len() and `in` don't build the result.  Iteration, runs() and
+    materialize() build it once and cache it.  Leaves are snapshots of their
+    sets, so mutating a set after wrapping it doesn't change the expression.
+
+    >>> a, b, c = IntegerSet((0, 9)), IntegerSet((5, 14)), IntegerSet((8, 8))
+    >>> expression = (a.lazy() | b) - c
+    >>> len(expression)
+    14
+    >>> expression.materialize()
+    IntegerSet((0, 7), (9, 14))
+    """
+
+    # make numpy defer to the reflected operators for run array operands
+    __array_ufunc__ = None
+
+    def __init__(self, iset=None):
+        self.operation = None
+        self.operands = ()
+        self._result = as_runs([] if iset is None else iset)
+
+    def __repr__(self):
+        expression = _expression(self)
+        if self.operation is not None:
+            expression = expression[1:-1]
+        return f"LazyIntegerSet({expression})"
+
+    def __len__(self):
+        if self._result is not None:
+            return cardinality(self._result)
+
+        points, inside = _sweep(self)
+        return int(np.diff(points)[inside[:-1]].sum())
+
+    def __iter__(self):
+        for start, end in self.runs().tolist():
+            yield from range(start, end + 1)
+
+    def __contains__(self, element):
+        return bool(_evaluate(self, np.array([element], dtype=np.int64), {})[0])
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __xor__(self, other):
+        return self.symmetric_difference(other)
+
+    def __ror__(self, other):
+        return _lazy(other).union(self)
+
+    def __rand__(self, other):
+        return _lazy(other).intersection(self)
+
+    def __rsub__(self, other):
+        return _lazy(other).difference(self)
+
+    def __rxor__(self, other):
+        return _lazy(other).symmetric_difference(self)
+
+    def union(self, *others):
+        """
+        self | other_0 | other_1 | ...
+        """
+        return self._extend("union", others)
+
+    def intersection(self, *others):
+        """
+        self & other_0 & other_1 & ...
+        """
+        return self._extend("intersection", others)
+
+    def difference(self, *others):
+        """
+        self - other_0 - other_1 - ...
+        """
+        return self._extend("difference", others)
+
+    def symmetric_difference(self, other):
+        """
+        self ^ other
+        """
+        return self._extend("symmetric_difference", (other,))
+
+    def runs(self):
+        """
+        Evaluate the expression, returning the result as a run array.  The
+        result is cached.
+        """
+        if self._result is None:
+            self._result = from_flags(*_sweep(self))
+        return self._result
+
+    def materialize(self):
+        """
+        Evaluate the expression, returning the result as an IntegerSet.
+        """
+        return to_integer_set(self.runs())
+
+    @classmethod
+    def _build(cls, operation, operands):
+        """
+        Build an expression node applying operation to the operands.
+        """
+        node = cls()
+        node.operation = operation
+        node.operands = tuple(operands)
+        node._result = None
+        return node
+
+    def _extend(self, operation, others):
+        """
+        Return a node applying operation to self and others.  Left-deep chains
+        of one operation, such as a | b | c, become a single node.
+        """
+        others = tuple(map(_lazy, others))
+        if self.operation == operation and operation != "symmetric_difference":
+            return self._build(operation, self.operands + others)
+        return self._build(operation, (self, *others))
+
+
+def _lazy(operand):
+    """
+    Wrap an IntegerSet or run array as a leaf, passing LazyIntegerSets through.
+    """
+    return operand if isinstance(operand, LazyIntegerSet) else LazyIntegerSet(operand)
+
+
+def _leaves(node, leaves):
+    """
+    Collect the distinct leaves of a tree into leaves, a dict keyed by id.
+    """
+    if node.operation is None:
+        leaves[id(node)] = node.runs()
+    for operand in node.operands:
+        _leaves(operand, leaves)
+    return leaves
+
+
+def _sweep(node):
+    """
+    Evaluate a tree at every leaf run boundary.  Return the points and the
+    result's membership from each point up to the next.
+    """
+    leaves = _leaves(node, {})
+    points = sorted_unique(
+        np.concatenate(
+            [np.empty(0, dtype=np.int64)]
+            + [runs[:, 0] for runs in leaves.values()]
+            + [runs[:, 1] + 1 for runs in leaves.values()]
+        )
+    )
+    flags = {key: covered(runs, points) for key, runs in leaves.items()}
+    return points, _evaluate(node, points, flags)
+
+
+def _evaluate(node, points, flags):
+    """
+    Return the membership of points in a tree, using and filling flags, the
+    leaf memberships keyed by id.
+    """
+    if node.operation is None:
+        if id(node) not in flags:
+            flags[id(node)] = covered(node.runs(), points)
+        return flags[id(node)]
+
+    return reduce(
+        OPERATIONS[node.operation],
+        (_evaluate(operand, points, flags) for operand in node.operands),
+    )
+
+
+def _expression(node):
+    """
+    Return a readable form of a tree.
+    """
+    if node.operation is None:
+        return f"<{len(node.runs())} runs>"
+
+    symbol = f" {_SYMBOLS[node.operation]} "
+    return "(" + symbol.join(_expression(operand) for operand in node.operands) + ")"
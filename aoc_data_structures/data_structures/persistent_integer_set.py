@@ -0,0 +1,393 @@
+"""
+PersistentIntegerSet datastructure.  An immutable set of integers whose
+updates return new versions sharing structure with the old.
+"""
+
+import random
+from collections import namedtuple
+from .integer_set import IntegerSet
+
+_Node = namedtuple(
+    "_Node", ["start", "end", "priority", "left", "right", "count", "longest"]
+)
+
+
+class PersistentIntegerSet:
+    """
+    Immutable set of integers stored as a treap of inclusive runs, ordered by
+    start and heap ordered by random priority.  Updates split and merge the
+    treap with path copying, so each new version costs O(log n) time and
+    nodes, and shares every other node with the version it was derived from.
+    This makes it cheap to keep a version per search branch, where an
+    IntegerSet would have to be copied.
+
+    Like frozenset, the update methods and operators return new sets and
+    leave the original unchanged.
+
+    >>> free = PersistentIntegerSet((0, 99))
+    >>> branch = free.discard_range(10, 19)
+    >>> len(free), len(branch)
+    (100, 90)
+    """
+
+    def __init__(self, *intervals):
+        runs = sorted((min(interval), max(interval)) for interval in intervals)
+        merged = []
+        for start, end in runs:
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        self._root = _build(merged, 0, len(merged), 1.0)
+        self._hash = None
+
+    def __repr__(self):
+        intervals = ", ".join(str(run) for run in self.runs())
+        return f"PersistentIntegerSet({intervals})"
+
+    def __len__(self):
+        return _count(self._root)
+
+    def __iter__(self):
+        for start, end in self.runs():
+            yield from range(start, end + 1)
+
+    def __contains__(self, element):
+        node = self._root
+        while node is not None:
+            if element < node.start:
+                node = node.left
+            elif element > node.end:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def __eq__(self, other):
+        if not isinstance(other, PersistentIntegerSet):
+            return NotImplemented
+        if self._root is other.root():
+            return True
+        return hash(self) == hash(other) and self.runs() == other.runs()
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self.runs()))
+        return self._hash
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __xor__(self, other):
+        return self.symmetric_difference(other)
+
+    def root(self):
+        """
+        Return the root node of the treap, or None if the set is empty.  Nodes
+        are namedtuples (start, end, priority, left, right, count, longest),
+        where count is the number of integers in the subtree and longest is
+        the length of its longest run.
+        """
+        return self._root
+
+    def runs(self):
+        """
+        Return the set as a list of ascending (start, end) pairs.
+        """
+        runs = []
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            runs.append((node.start, node.end))
+            node = node.right
+        return runs
+
+    def successor(self, element):
+        """
+        Return the smallest member >= element, or None if there isn't one.
+        """
+        found = None
+        node = self._root
+        while node is not None:
+            if node.end < element:
+                node = node.right
+            else:
+                found = max(element, node.start)
+                node = node.left
+        return found
+
+    def run(self, element):
+        """
+        Return the (start, end) run containing element, or None.
+        """
+        node = _find(self._root, element)
+        return None if node is None else (node.start, node.end)
+
+    def first_run(self, length):
+        """
+        Return the leftmost (start, end) run with at least length members, or
+        None.  Subtrees whose longest run is too short are skipped, so this
+        takes O(log n) time.
+        """
+        node = self._root
+        if node is None or node.longest < length:
+            return None
+
+        while True:
+            if node.left is not None and node.left.longest >= length:
+                node = node.left
+            elif node.end - node.start + 1 >= length:
+                return node.start, node.end
+            else:
+                node = node.right
+
+    def add(self, element):
+        """
+        Return a new set with element added.
+        """
+        return self.add_range(element, element)
+
+    def discard(self, element):
+        """
+        Return a new set without element.
+        """
+        return self.discard_range(element, element)
+
+    def remove(self, element):
+        """
+        Return a new set without element.  Raise KeyError if it isn't present.
+        """
+        if element not in self:
+            raise KeyError(element)
+        return self.discard(element)
+
+    def add_range(self, start, end):
+        """
+        Return a new set with the inclusive range [start, end] added.  Runs
+        overlapping or adjacent to the range are merged with it.
+        """
+        run = _find(self._root, start)
+        if run is not None and run.end >= end:
+            return self
+
+        left, right = _split(self._root, start)
+        if left is not None and _last(left).end >= start - 1:
+            left, last = _pop_last(left)
+            start, end = last.start, max(end, last.end)
+
+        middle, right = _split(right, end + 2)
+        if middle is not None:
+            end = max(end, _last(middle).end)
+
+        return self._derive(_merge(_merge(left, _leaf(start, end)), right))
+
+    def discard_range(self, start, end):
+        """
+        Return a new set without the inclusive range [start, end].
+        """
+        left, right = _split(self._root, start)
+        middle, right = _split(right, end + 1)
+        pieces = []
+
+        if left is not None and _last(left).end >= start:
+            left, last = _pop_last(left)
+            pieces.append((last.start, start - 1))
+            pieces.append((end + 1, last.end))
+        elif middle is None:
+            return self
+
+        if middle is not None:
+            pieces.append((end + 1, _last(middle).end))
+
+        root = left
+        for piece_start, piece_end in pieces:
+            if piece_start <= piece_end:
+                root = _merge(root, _leaf(piece_start, piece_end))
+        return self._derive(_merge(root, right))
+
+    def union(self, *others):
+        """
+        self | other_0 | other_1 | ...  Each run of the others is added in
+        O(log n).
+        """
+        result = self
+        for other in others:
+            for start, end in other.runs():
+                result = result.add_range(start, end)
+        return result
+
+    def difference(self, *others):
+        """
+        self - other_0 - other_1 - ...  Each run of the others is removed in
+        O(log n).
+        """
+        result = self
+        for other in others:
+            for start, end in other.runs():
+                result = result.discard_range(start, end)
+        return result
+
+    def intersection(self, *others):
+        """
+        self & other_0 & other_1 & ...
+        """
+        result = self
+        for other in others:
+            result = result - (result - other)
+        return result
+
+    def symmetric_difference(self, other):
+        """
+        self ^ other
+        """
+        return (self - other) | (other - self)
+
+    def isdisjoint(self, other):
+        """
+        Return true if self has no common elements with other.
+        """
+        return len(self & other) == 0
+
+    def thaw(self):
+        """
+        Return a mutable IntegerSet copy.
+        """
+        return IntegerSet.from_runs(self.runs())
+
+    @classmethod
+    def _derive(cls, root):
+        """
+        Build a new version around root.
+        """
+        derived = cls()
+        derived._root = root
+        return derived
+
+
+def _build(runs, start, end, bound):
+    """
+    Build a treap from the sorted runs[start:end] in O(n), rooted at the middle
+    run.  The priority of each root is drawn from the distribution of the
+    largest of its subtree's priorities, below the parent's, so the result is
+    distributed like a treap built by insertion.
+    """
+    if start == end:
+        return None
+
+    middle = (start + end) // 2
+    priority = bound * random.random() ** (1 / (end - start))
+    return _node(
+        *runs[middle],
+        priority,
+        _build(runs, start, middle, priority),
+        _build(runs, middle + 1, end, priority),
+    )
+
+
+def _node(start, end, priority, left, right):
+    """
+    Build a node, computing its subtree count and longest run.
+    """
+    length = end - start + 1
+    count = length + _count(left) + _count(right)
+    longest = max(length, _longest(left), _longest(right))
+    return _Node(start, end, priority, left, right, count, longest)
+
+
+def _leaf(start, end):
+    """
+    Build a childless node with a random priority.
+    """
+    return _node(start, end, random.random(), None, None)
+
+
+def _count(node):
+    """
+    Return the number of integers in a subtree.
+    """
+    return 0 if node is None else node.count
+
+
+def _longest(node):
+    """
+    Return the length of the longest run in a subtree.
+    """
+    return 0 if node is None else node.longest
+
+
+def _find(node, element):
+    """
+    Return the node whose run contains element, or None.
+    """
+    while node is not None:
+        if element < node.start:
+            node = node.left
+        elif element > node.end:
+            node = node.right
+        else:
+            return node
+    return None
+
+
+def _last(node):
+    """
+    Return the node with the greatest start in a subtree.
+    """
+    while node.right is not None:
+        node = node.right
+    return node
+
+
+def _split(node, key):
+    """
+    Split a subtree into the runs starting before key and the runs starting at
+    or after key, copying only the nodes on the search path.
+    """
+    if node is None:
+        return None, None
+
+    if node.start < key:
+        left, right = _split(node.right, key)
+        return _node(node.start, node.end, node.priority, node.left, left), right
+
+    left, right = _split(node.left, key)
+    return left, _node(node.start, node.end, node.priority, right, node.right)
+
+
+def _merge(left, right):
+    """
+    Join two subtrees, where every run of left precedes every run of right.
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if left.priority > right.priority:
+        merged = _merge(left.right, right)
+        return _node(left.start, left.end, left.priority, left.left, merged)
+
+    merged = _merge(left, right.left)
+    return _node(right.start, right.end, right.priority, merged, right.right)
+
+
+def _pop_last(node):
+    """
+    Remove the node with the greatest start.  Return (subtree, removed node).
+    """
+    if node.right is None:
+        return node.left, node
+
+    rest, last = _pop_last(node.right)
+    return _node(node.start, node.end, node.priority, node.left, rest), last
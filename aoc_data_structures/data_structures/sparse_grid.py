@@ -0,0 +1,257 @@
+"""
+SparseGrid datastructure.  An unbounded grid backed by a hash map.
+"""
+
+from functools import lru_cache
+import numpy as np
+from ..grid_helpers import grid_str, symbol_code
+from .vector_tuple import VectorTuple
+
+
+class SparseGrid:
+    """
+    Unbounded n-dimensional grid storing only the cells that have been set.
+    Coordinates are packed into a single 64 bit integer key with up to 32 bits
+    per coordinate, so 2-d coordinates range over +/- 2**31 and 4-d coordinates
+    over +/- 2**15.  The bounding box of the set cells is maintained as cells
+    are added.  Removing a cell on the edge of the bounding box marks it stale,
+    and it is recomputed on next use.
+
+    >>> grid = SparseGrid.from_dense(parse(["#.", ".#"]), background=".")
+    >>> grid[VectorTuple(-5, 3)] = "#"
+    >>> grid.bounds
+    ((-5, 0), (1, 3))
+    """
+
+    def __init__(self, ndim=2, cells=None, dtype=None):
+        self.ndim = ndim
+        self.dtype = dtype
+        self._cells = {}
+        self._mins = None
+        self._maxs = None
+        self._stale = False
+
+        for pos, value in (cells or {}).items():
+            self[pos] = value
+
+    def __repr__(self):
+        return f"SparseGrid(ndim={self.ndim}, cells={len(self)}, bounds={self.bounds})"
+
+    def __str__(self):
+        return grid_str(self.to_dense()[0])
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __contains__(self, pos):
+        return self.pack(pos) in self._cells
+
+    def __getitem__(self, pos):
+        return self._cells[self.pack(pos)]
+
+    def __setitem__(self, pos, value):
+        self._cells[self.pack(pos)] = value
+
+        if self._mins is None:
+            self._mins = list(map(int, pos))
+            self._maxs = list(map(int, pos))
+            return
+
+        for axis, element in enumerate(pos):
+            if element < self._mins[axis]:
+                self._mins[axis] = element
+            elif element > self._maxs[axis]:
+                self._maxs[axis] = element
+
+    def __delitem__(self, pos):
+        del self._cells[self.pack(pos)]
+
+        if not self._cells:
+            self._mins = self._maxs = None
+            self._stale = False
+            return
+
+        for axis, element in enumerate(pos):
+            if element in (self._mins[axis], self._maxs[axis]):
+                self._stale = True
+
+    def __iter__(self):
+        for key in self._cells:
+            yield self.unpack(key)
+
+    def items(self):
+        """
+        Yield (position, value) pairs.
+        """
+        for key, value in self._cells.items():
+            yield self.unpack(key), value
+
+    def get(self, pos, default=None):
+        """
+        Return the value at pos, or default if the cell isn't set.
+        """
+        return self._cells.get(self.pack(pos), default)
+
+    def pop(self, pos, *default):
+        """
+        Remove and return the value at pos.
+        """
+        if pos not in self and default:
+            return default[0]
+        value = self[pos]
+        del self[pos]
+        return value
+
+    def neighbors(self, pos, diagonals=False):
+        """
+        Generate the set neighbors of pos.  If diagonals is set, generate the
+        square/cube/hyper-cube adjacencies instead of the orthogonals.
+        """
+        for delta in _deltas(self.ndim, diagonals):
+            next_pos = VectorTuple(
+                element + offset for element, offset in zip(pos, delta)
+            )
+            if self.pack(next_pos) in self._cells:
+                yield next_pos
+
+    @property
+    def bounds(self):
+        """
+        Return the inclusive bounding box of the set cells as a pair of
+        VectorTuples (mins, maxs), or None if the grid is empty.
+        """
+        if self._mins is None:
+            return None
+
+        if self._stale:
+            coords = self._coords()
+            self._mins = coords.min(axis=0).tolist()
+            self._maxs = coords.max(axis=0).tolist()
+            self._stale = False
+
+        return VectorTuple(self._mins), VectorTuple(self._maxs)
+
+    def pack(self, pos):
+        """
+        Pack a coordinate into a single integer key.  Elements are converted to
+        Python ints first, numpy integers would overflow while shifting.
+        """
+        if len(pos) != self.ndim:
+            raise IndexError(f"Expected a {self.ndim}-d coordinate, got {pos}.")
+
+        bits, offset, _ = _packing(self.ndim)
+        key = 0
+        for element in map(int, pos):
+            if not -offset <= element < offset:
+                raise IndexError(f"Coordinate {pos} out of range.")
+            key = (key << bits) | (element + offset)
+        return key
+
+    def unpack(self, key):
+        """
+        Unpack an integer key into a coordinate.
+        """
+        bits, offset, mask = _packing(self.ndim)
+        elements = []
+        for _ in range(self.ndim):
+            elements.append((key & mask) - offset)
+            key >>= bits
+        return VectorTuple(reversed(elements))
+
+    def to_dense(self, background=".", dtype=None):
+        """
+        Convert to a dense numpy array covering the bounding box, filling unset
+        cells with background.  Return (array, origin), where origin is the
+        coordinate of array[0, 0, ...].  The array can be passed to grid_str and
+        hash_array.  dtype defaults to the dtype of the array the grid was built
+        from, if any.  For compact uint8 arrays a str background is converted to
+        its ASCII code.
+        """
+        dtype = self.dtype if dtype is None else dtype
+        background = _background(background, dtype)
+
+        if not self._cells:
+            return np.full((0,) * self.ndim, background, dtype=dtype), None
+
+        mins, maxs = self.bounds
+        shape = tuple(high - low + 1 for low, high in zip(mins, maxs))
+        values = np.array(list(self._cells.values()), dtype=dtype)
+
+        if dtype is None:
+            dtype = np.result_type(values, np.array(background))
+
+        array = np.full(shape, background, dtype=dtype)
+        array[tuple((self._coords() - mins).T)] = values
+        return array, mins
+
+    @classmethod
+    def from_dense(cls, array, background=".", origin=None):
+        """
+        Build a SparseGrid from a dense numpy array, skipping cells equal to
+        background.  origin is the coordinate of array[0, 0, ...].  For compact
+        uint8 arrays a str background is converted to its ASCII code.
+        """
+        grid = cls(array.ndim, dtype=array.dtype)
+        background = _background(background, array.dtype)
+        bits, offset, _ = _packing(array.ndim)
+        origin = np.zeros(array.ndim, dtype=np.int64) if origin is None else origin
+        coords = np.argwhere(array != background)
+        values = array[tuple(coords.T)].tolist()
+        coords = coords + np.asarray(origin, dtype=np.int64)
+
+        if len(coords):
+            if coords.min() < -offset or coords.max() >= offset:
+                raise IndexError("Coordinates out of range.")
+            grid._mins = coords.min(axis=0).tolist()
+            grid._maxs = coords.max(axis=0).tolist()
+
+        keys = np.zeros(len(coords), dtype=np.uint64)
+        for axis in range(array.ndim):
+            keys <<= np.uint64(bits)
+            keys |= (coords[:, axis] + offset).astype(np.uint64)
+
+        grid._cells = dict(zip(keys.tolist(), values))
+        return grid
+
+    def _coords(self):
+        """
+        Unpack every key into an (N, ndim) coordinate array.
+        """
+        bits, offset, mask = _packing(self.ndim)
+        keys = np.fromiter(self._cells, dtype=np.uint64, count=len(self._cells))
+        coords = np.empty((len(keys), self.ndim), dtype=np.int64)
+        for axis in reversed(range(self.ndim)):
+            coords[:, axis] = (keys & np.uint64(mask)).astype(np.int64)
+            coords[:, axis] -= offset
+            keys >>= np.uint64(bits)
+        return coords
+
+
+@lru_cache(maxsize=None)
+def _packing(ndim):
+    """
+    Return the (bits, offset, mask) used to pack ndim coordinates into 64 bits.
+    """
+    bits = min(32, 64 // ndim)
+    return bits, 1 << (bits - 1), (1 << bits) - 1
+
+
+@lru_cache(maxsize=None)
+def _deltas(ndim, diagonals):
+    """
+    Return the neighbor deltas for ndim coordinates.
+    """
+    origin = VectorTuple([0] * ndim)
+    if diagonals:
+        return tuple(origin.adjacencies(None))
+    return tuple(origin.orthogonals(None))
+
+
+def _background(background, dtype):
+    """
+    Return background in the representation used by dtype, the ASCII code of a
+    symbol for compact uint8 grids.
+    """
+    if dtype is not None and np.dtype(dtype) == np.uint8:
+        return symbol_code(background)
+    return background
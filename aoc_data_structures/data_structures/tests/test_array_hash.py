@@ -0,0 +1,93 @@
+"""
+Test the incremental array hash.
+"""
+
+import unittest
+import numpy as np
+from ..array_hash import ArrayHash
+
+
+class TestArrayHash(unittest.TestCase):
+    """
+    Test the ArrayHash class.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.array = rng.integers(0, 255, (8, 8), dtype=np.uint8)
+
+    def test_equal_contents(self):
+        """
+        Test equal arrays hash equally.
+        """
+        self.assertEqual(
+            ArrayHash(self.array).value,
+            ArrayHash(self.array.copy()).value,
+        )
+
+    def test_single_cell(self):
+        """
+        Test a single cell update matches a full rehash.
+        """
+        tracked = ArrayHash(self.array.copy())
+        original = tracked.value
+        tracked[3, 4] = 7
+        self.assertNotEqual(tracked.value, original)
+        self.assertEqual(tracked.value, ArrayHash(tracked.array.copy()).value)
+        self.assertEqual(tracked[3, 4], 7)
+
+    def test_revert(self):
+        """
+        Test reverting a change restores the original hash.
+        """
+        tracked = ArrayHash(self.array.copy())
+        original = tracked.value
+        tracked[0, 0] = self.array[0, 0] + 1
+        tracked[0, 0] = self.array[0, 0]
+        self.assertEqual(tracked.value, original)
+
+    def test_slice(self):
+        """
+        Test slice updates.
+        """
+        tracked = ArrayHash(self.array.copy())
+        tracked[:, 2] = 0
+        self.assertEqual(tracked.value, ArrayHash(tracked.array.copy()).value)
+
+    def test_fancy(self):
+        """
+        Test fancy indices, including ones repeating a cell.
+        """
+        tracked = ArrayHash(np.zeros(4, dtype=np.uint8))
+        tracked[[1, 1]] = [3, 5]
+        self.assertEqual(tracked.array.tolist(), [0, 5, 0, 0])
+        self.assertEqual(tracked.value, tracked.rehash())
+
+        tracked = ArrayHash(self.array.copy())
+        tracked[[0, 2, 0], 1:] = 7
+        tracked[tracked.array > 50] = 1
+        tracked[(np.array([1, 1]), np.array([0, 0]))] = [4, 9]
+        self.assertEqual(tracked.value, ArrayHash(tracked.array.copy()).value)
+
+    def test_float(self):
+        """
+        Test hashing floats by bit pattern.
+        """
+        tracked = ArrayHash(np.zeros((3, 3)))
+        tracked[1, 1] = 0.5
+        self.assertEqual(tracked.value, ArrayHash(tracked.array.copy()).value)
+
+    def test_rehash(self):
+        """
+        Test rehashing after untracked modification.
+        """
+        tracked = ArrayHash(self.array.copy())
+        tracked.array[0, 0] += 1
+        self.assertEqual(tracked.rehash(), ArrayHash(tracked.array.copy()).value)
+
+    def test_unsupported_dtype(self):
+        """
+        Test object arrays are rejected.
+        """
+        with self.assertRaises(TypeError):
+            ArrayHash(np.array([None, 1]))
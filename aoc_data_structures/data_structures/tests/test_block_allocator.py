@@ -0,0 +1,167 @@
+"""
+Test the BlockAllocator class.
+"""
+
+import random
+import unittest
+from ..block_allocator import BlockAllocator
+from .test_persistent_integer_set import check_treap
+
+
+class TestAllocate(unittest.TestCase):
+    """
+    Test allocation.
+    """
+
+    def setUp(self):
+        """
+        Build an allocator with free runs of lengths 3, 10, 5 and 20.
+        """
+        self.allocator = BlockAllocator((0, 2), (10, 19), (30, 34), (40, 59))
+
+    def test_first_fit(self):
+        """
+        Test first fit takes the start of the leftmost run that fits.
+        """
+        self.assertEqual(self.allocator.allocate(4), (10, 13))
+        self.assertEqual(self.allocator.allocate(3), (0, 2))
+        self.assertEqual(self.allocator.allocate(7), (40, 46))
+        self.assertEqual(self.allocator.runs(), [(14, 19), (30, 34), (47, 59)])
+
+    def test_best_fit(self):
+        """
+        Test best fit takes the start of the shortest run that fits.
+        """
+        self.assertEqual(self.allocator.allocate(4, policy="best"), (30, 33))
+        self.assertEqual(self.allocator.allocate(3, policy="best"), (0, 2))
+        self.assertEqual(self.allocator.allocate(11, policy="best"), (40, 50))
+        self.assertEqual(self.allocator.allocate(6, policy="best"), (51, 56))
+        self.assertEqual(self.allocator.runs(), [(10, 19), (34, 34), (57, 59)])
+
+    def test_exhausted(self):
+        """
+        Test requests larger than every free run raise ValueError.
+        """
+        self.assertEqual(self.allocator.largest(), 20)
+        with self.assertRaises(ValueError):
+            self.allocator.allocate(21)
+        with self.assertRaises(ValueError):
+            self.allocator.allocate(21, policy="best")
+        self.assertEqual(len(self.allocator), 38)
+        with self.assertRaises(ValueError):
+            BlockAllocator().allocate(1)
+
+    def test_invalid(self):
+        """
+        Test unknown policies and non-positive sizes raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.allocator.allocate(1, policy="worst")
+        with self.assertRaises(ValueError):
+            self.allocator.allocate(0)
+
+
+class TestFree(unittest.TestCase):
+    """
+    Test freeing blocks.
+    """
+
+    def test_merge(self):
+        """
+        Test freed blocks merge with adjacent free runs.
+        """
+        allocator = BlockAllocator((0, 9), (20, 29))
+        allocator.free((10, 19))
+        self.assertEqual(allocator.runs(), [(0, 29)])
+        self.assertEqual(allocator.largest(), 30)
+        self.assertEqual(allocator.allocate(30, policy="best"), (0, 29))
+        self.assertEqual(len(allocator), 0)
+
+    def test_reversed(self):
+        """
+        Test blocks may be given high to low.
+        """
+        allocator = BlockAllocator()
+        allocator.free((9, 5))
+        self.assertEqual(allocator.runs(), [(5, 9)])
+        self.assertIn(7, allocator)
+
+    def test_double_free(self):
+        """
+        Test freeing free space raises ValueError and changes nothing.
+        """
+        allocator = BlockAllocator((10, 19))
+        for block in ((15, 25), (0, 10), (12, 14), (0, 30)):
+            with self.assertRaises(ValueError):
+                allocator.free(block)
+        self.assertEqual(allocator.runs(), [(10, 19)])
+
+    def test_snapshot(self):
+        """
+        Test free_space snapshots are unaffected by later allocations.
+        """
+        allocator = BlockAllocator((0, 99))
+        snapshot = allocator.free_space()
+        allocator.allocate(50)
+        self.assertEqual(len(snapshot), 100)
+        self.assertEqual(allocator.free_space().runs(), [(50, 99)])
+
+
+class TestRandom(unittest.TestCase):
+    """
+    Test random workloads against a brute force model.
+    """
+
+    def test_against_brute_force(self):
+        """
+        Test mixed allocations and frees against a scan of the free runs.
+        """
+        rng = random.Random(0)
+        allocator = BlockAllocator((0, 999))
+        free = set(range(1000))
+        allocated = []
+
+        for _ in range(2000):
+            if allocated and rng.random() < 0.45:
+                block = allocated.pop(rng.randrange(len(allocated)))
+                allocator.free(block)
+                free.update(range(block[0], block[1] + 1))
+            else:
+                size = rng.randint(1, 40)
+                policy = rng.choice(("first", "best"))
+                expected = expected_block(runs_of(free), size, policy)
+                if expected is None:
+                    with self.assertRaises(ValueError):
+                        allocator.allocate(size, policy)
+                    continue
+                self.assertEqual(allocator.allocate(size, policy), expected)
+                allocated.append(expected)
+                free.difference_update(range(expected[0], expected[1] + 1))
+
+            self.assertEqual(allocator.runs(), runs_of(free))
+        check_treap(self, allocator.free_space().root())
+
+
+def runs_of(values):
+    """
+    Return the runs of a set of integers.
+    """
+    runs = []
+    for value in sorted(values):
+        if runs and runs[-1][1] == value - 1:
+            runs[-1] = (runs[-1][0], value)
+        else:
+            runs.append((value, value))
+    return runs
+
+
+def expected_block(runs, size, policy):
+    """
+    Return the block a linear scan would allocate, or None.
+    """
+    fitting = [run for run in runs if run[1] - run[0] + 1 >= size]
+    if not fitting:
+        return None
+    if policy == "best":
+        fitting.sort(key=lambda run: (run[1] - run[0], run[0]))
+    return fitting[0][0], fitting[0][0] + size - 1
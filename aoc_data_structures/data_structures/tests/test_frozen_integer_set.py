@@ -0,0 +1,159 @@
+"""
+Test the FrozenIntegerSet class.
+"""
+
+import unittest
+from ..frozen_integer_set import FrozenIntegerSet
+from ..integer_set import IntegerSet
+
+
+class TestHashing(unittest.TestCase):
+    """
+    Test hashing and equality.
+    """
+
+    def test_dict_key(self):
+        """
+        Test equal sets built differently hash equally.
+        """
+        seen = {FrozenIntegerSet((0, 10)): 1}
+        self.assertIn(FrozenIntegerSet((0, 5), (6, 10)), seen)
+        self.assertIn(FrozenIntegerSet((10, 0)), seen)
+        self.assertNotIn(FrozenIntegerSet((0, 9)), seen)
+
+    def test_reversed_overlap(self):
+        """
+        Test overlapping reversed intervals equal their merged set.
+        """
+        frozen = FrozenIntegerSet((5, 0), (3, 8))
+        self.assertEqual(frozen, FrozenIntegerSet((0, 8)))
+        self.assertEqual(hash(frozen), hash(FrozenIntegerSet((0, 8))))
+
+    def test_equality(self):
+        """
+        Test equality with frozen and mutable sets.
+        """
+        frozen = FrozenIntegerSet((0, 5), (10, 20))
+        self.assertEqual(frozen, FrozenIntegerSet((0, 5), (10, 20)))
+        self.assertNotEqual(frozen, FrozenIntegerSet((0, 5)))
+        self.assertEqual(frozen, IntegerSet((0, 5), (10, 20)))
+        self.assertEqual(IntegerSet((0, 5), (10, 20)), frozen)
+        self.assertNotEqual(frozen, "IntegerSet")
+
+    def test_from_runs_iterator(self):
+        """
+        Test from_runs consumes an iterator once, keeping the hash consistent.
+        """
+        frozen = FrozenIntegerSet.from_runs(iter([(0, 3), (5, 6)]))
+        expected = FrozenIntegerSet((0, 3), (5, 6))
+        self.assertEqual(frozen, expected)
+        self.assertEqual(hash(frozen), hash(expected))
+        self.assertEqual(repr(frozen), "FrozenIntegerSet((0, 3), (5, 6))")
+        self.assertEqual(len(frozen), 6)
+
+    def test_repr(self):
+        """
+        Test __repr__.
+        """
+        self.assertEqual(repr(FrozenIntegerSet((0, 5))), "FrozenIntegerSet((0, 5))")
+
+
+class TestImmutability(unittest.TestCase):
+    """
+    Test frozen sets can't be modified.
+    """
+
+    def test_in_place(self):
+        """
+        Test in-place operators rebind to a new set.
+        """
+        frozen = FrozenIntegerSet((0, 5))
+        original = frozen
+        frozen |= FrozenIntegerSet((10, 20))
+        self.assertEqual(frozen, FrozenIntegerSet((0, 5), (10, 20)))
+        self.assertEqual(original, FrozenIntegerSet((0, 5)))
+
+    def test_mutators(self):
+        """
+        Test the mutating methods raise TypeError.
+        """
+        frozen = FrozenIntegerSet((0, 5))
+        for method, args in (
+            (frozen.add, (7,)),
+            (frozen.remove, (0,)),
+            (frozen.discard, (0,)),
+            (frozen.pop, ()),
+            (frozen.clear, ()),
+            (frozen.update, (IntegerSet((7, 8)),)),
+        ):
+            with self.assertRaises(TypeError):
+                method(*args)
+        self.assertEqual(frozen, FrozenIntegerSet((0, 5)))
+
+    def test_thaw(self):
+        """
+        Test thaw returns an independent mutable copy.
+        """
+        frozen = FrozenIntegerSet((0, 5))
+        thawed = frozen.thaw()
+        thawed.add(7)
+        self.assertEqual(frozen, FrozenIntegerSet((0, 5)))
+        self.assertEqual(thawed, IntegerSet((0, 5), (7, 7)))
+        self.assertIs(frozen.copy(), frozen)
+
+
+class TestOperations(unittest.TestCase):
+    """
+    Test set operations and the memo.
+    """
+
+    def setUp(self):
+        FrozenIntegerSet.memo_clear()
+        self.set_0 = FrozenIntegerSet((0, 10), (20, 30))
+        self.set_1 = FrozenIntegerSet((5, 25))
+
+    def test_operators(self):
+        """
+        Test the operators match IntegerSet and return frozen sets.
+        """
+        mutable_0, mutable_1 = self.set_0.thaw(), self.set_1.thaw()
+        for result, expected in (
+            (self.set_0 | self.set_1, mutable_0 | mutable_1),
+            (self.set_0 & self.set_1, mutable_0 & mutable_1),
+            (self.set_0 - self.set_1, mutable_0 - mutable_1),
+            (self.set_0 ^ self.set_1, mutable_0 ^ mutable_1),
+            (self.set_0.union(self.set_1, mutable_1), mutable_0 | mutable_1),
+            (self.set_0.intersection(mutable_1), mutable_0 & mutable_1),
+            (self.set_0.difference(self.set_1), mutable_0 - mutable_1),
+            (self.set_0.symmetric_difference(mutable_1), mutable_0 ^ mutable_1),
+        ):
+            self.assertIsInstance(result, FrozenIntegerSet)
+            self.assertEqual(result, expected)
+
+    def test_memo(self):
+        """
+        Test repeated operations on frozen operands hit the memo.
+        """
+        first = self.set_0 | self.set_1
+        second = FrozenIntegerSet((0, 10), (20, 30)) | FrozenIntegerSet((5, 25))
+        self.assertIs(first, second)
+        info = FrozenIntegerSet.memo_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_mutable_operand(self):
+        """
+        Test operations with mutable operands aren't memoized.
+        """
+        result = self.set_0 | self.set_1.thaw()
+        self.assertEqual(result, self.set_0 | self.set_1)
+        self.assertEqual(FrozenIntegerSet.memo_info().currsize, 1)
+
+    def test_read_only(self):
+        """
+        Test the inherited read-only methods.
+        """
+        self.assertIn(25, self.set_0)
+        self.assertNotIn(15, self.set_0)
+        self.assertEqual(len(self.set_0), 22)
+        self.assertTrue(FrozenIntegerSet((0, 3)) < self.set_0)
+        self.assertEqual(FrozenIntegerSet.from_runs([[0, 3]]), FrozenIntegerSet((0, 3)))
@@ -0,0 +1,153 @@
+"""
+Test the grid class.
+"""
+
+import unittest
+import numpy as np
+from ..grid import Grid
+from ..vector_tuple import VectorTuple
+
+
+class TestGet(unittest.TestCase):
+    """
+    Test bounds checked lookups.
+    """
+
+    def setUp(self):
+        self.grid = Grid(np.array([["#", "."], [".", "."]]))
+
+    def test_in_bounds(self):
+        """
+        Test a lookup within the grid.
+        """
+        self.assertEqual(self.grid.get(VectorTuple(0, 0)), "#")
+
+    def test_out_of_bounds(self):
+        """
+        Test lookups outside of the grid produce the default.
+        """
+        self.assertIsNone(self.grid.get(VectorTuple(-1, 0)))
+        self.assertEqual(self.grid.get(VectorTuple(0, 2), "x"), "x")
+
+    def test_contains(self):
+        """
+        Test the bounds check.
+        """
+        self.assertIn(VectorTuple(1, 1), self.grid)
+        self.assertNotIn(VectorTuple(2, 1), self.grid)
+        self.assertNotIn(VectorTuple(1, 1, 1), self.grid)
+
+
+class TestNeighbors(unittest.TestCase):
+    """
+    Test neighbor generation.
+    """
+
+    def test_corner(self):
+        """
+        Test orthogonal neighbors of a corner.
+        """
+        grid = Grid(np.zeros((3, 3)))
+        self.assertEqual(
+            set(grid.neighbors(VectorTuple(0, 0))),
+            {VectorTuple(1, 0), VectorTuple(0, 1)},
+        )
+
+    def test_diagonals(self):
+        """
+        Test full adjacencies of a corner.
+        """
+        grid = Grid(np.zeros((3, 3)))
+        self.assertEqual(
+            set(grid.neighbors(VectorTuple(0, 0), diagonals=True)),
+            {VectorTuple(1, 0), VectorTuple(0, 1), VectorTuple(1, 1)},
+        )
+
+    def test_matches_orthogonals(self):
+        """
+        Test agreement with VectorTuple.orthogonals.
+        """
+        array = np.zeros((4, 5, 3))
+        grid = Grid(array)
+        pos = VectorTuple(3, 2, 0)
+        self.assertEqual(
+            set(grid.neighbors(pos)),
+            set(pos.orthogonals(array)),
+        )
+
+
+class TestTake(unittest.TestCase):
+    """
+    Test batched lookups.
+    """
+
+    def setUp(self):
+        self.grid = Grid(np.arange(6).reshape(2, 3))
+
+    def test_in_bounds(self):
+        """
+        Test a batch of valid coordinates.
+        """
+        np.testing.assert_array_equal(
+            self.grid.take([(0, 0), (1, 2), (0, 1)]),
+            [0, 5, 1],
+        )
+
+    def test_default(self):
+        """
+        Test out of bounds coordinates are filled with the default.
+        """
+        np.testing.assert_array_equal(
+            self.grid.take([(0, 0), (2, 0), (-1, 1)], default=-1),
+            [0, -1, -1],
+        )
+
+    def test_none_default(self):
+        """
+        Test None is a usable default for object grids.
+        """
+        grid = Grid(np.array([["a", "b"]], dtype=object))
+        self.assertEqual(
+            grid.take([(0, 1), (0, 2)], default=None).tolist(), ["b", None]
+        )
+
+    def test_out_of_bounds(self):
+        """
+        Test out of bounds coordinates raise without a default.
+        """
+        with self.assertRaises(IndexError):
+            self.grid.take([(0, 3)])
+
+
+class TestFind(unittest.TestCase):
+    """
+    Test the find method.
+    """
+
+    def test_find(self):
+        """
+        Test finding coordinates of a symbol.
+        """
+        grid = Grid(np.array([["#", "."], [".", "#"]]))
+        self.assertEqual(grid.find("#"), [VectorTuple(0, 0), VectorTuple(1, 1)])
+
+
+class TestIter(unittest.TestCase):
+    """
+    Test iteration over coordinates.
+    """
+
+    def test_iter(self):
+        """
+        Test every coordinate is yielded in row-major order.
+        """
+        grid = Grid(np.zeros((2, 2)))
+        self.assertEqual(
+            list(grid),
+            [
+                VectorTuple(0, 0),
+                VectorTuple(0, 1),
+                VectorTuple(1, 0),
+                VectorTuple(1, 1),
+            ],
+        )
@@ -0,0 +1,129 @@
+"""
+Test the grid index class.
+"""
+
+import unittest
+import numpy as np
+from ..grid_index import GridIndex
+from ..integer_set import IntegerSet
+from ..vector_tuple import VectorTuple
+from ...grid_helpers import parse
+
+LINES = [
+    "#..#.",
+    ".....",
+    ".#.##",
+    "##...",
+]
+
+
+class TestGridIndex(unittest.TestCase):
+    """
+    Test symbol lookups.
+    """
+
+    def setUp(self):
+        self.grid = parse(LINES)
+        self.index = GridIndex(self.grid)
+
+    def test_positions(self):
+        """
+        Test positions match np.argwhere.
+        """
+        for symbol in "#.":
+            np.testing.assert_array_equal(
+                self.index.positions(symbol),
+                np.argwhere(self.grid == symbol),
+            )
+        self.assertEqual(self.index.positions("x").shape, (0, 2))
+
+    def test_count(self):
+        """
+        Test symbol counts.
+        """
+        self.assertEqual(self.index.count("#"), 7)
+        self.assertEqual(self.index.count("x"), 0)
+        self.assertIn("#", self.index)
+        self.assertNotIn("x", self.index)
+        self.assertEqual(sorted(self.index.symbols()), ["#", "."])
+
+    def test_in_row(self):
+        """
+        Test row queries.
+        """
+        self.assertEqual(self.index.in_row("#", 2), IntegerSet((1, 1), (3, 4)))
+        self.assertEqual(self.index.in_row("#", 2, 2, 3), IntegerSet((3, 3)))
+        self.assertEqual(self.index.in_row("#", 1), IntegerSet())
+
+    def test_in_column(self):
+        """
+        Test column queries.
+        """
+        self.assertEqual(self.index.in_column("#", 0), IntegerSet((0, 0), (3, 3)))
+        self.assertEqual(self.index.in_column("#", 1, 0, 2), IntegerSet((2, 2)))
+
+    def test_ranges(self):
+        """
+        Test every row and column range against a scan of the grid.
+        """
+        for symbol in "#.":
+            for row in range(len(LINES)):
+                for start in range(-1, 7):
+                    for end in (None, *range(start, 7)):
+                        columns = [
+                            column
+                            for column, value in enumerate(LINES[row])
+                            if value == symbol
+                            and column >= start
+                            and (end is None or column <= end)
+                        ]
+                        expected = IntegerSet(*((column, column) for column in columns))
+                        self.assertEqual(
+                            self.index.in_row(symbol, row, start, end), expected
+                        )
+        self.assertEqual(self.index.in_column("#", 0, None, 2), IntegerSet((0, 0)))
+
+    def test_cached_sets_unchanged(self):
+        """
+        Test returned sets can be modified without affecting the index.
+        """
+        result = self.index.in_row("#", 2)
+        result.add(0)
+        self.assertEqual(self.index.in_row("#", 2), IntegerSet((1, 1), (3, 4)))
+
+    def test_nearest(self):
+        """
+        Test nearest symbol lookups in every direction.
+        """
+        pos = VectorTuple(2, 3)
+        self.assertEqual(self.index.nearest("#", pos, "north"), (0, 3))
+        self.assertIsNone(self.index.nearest("#", pos, "south"))
+        self.assertEqual(self.index.nearest("#", pos, "east"), (2, 4))
+        self.assertEqual(self.index.nearest("#", pos, "west"), (2, 1))
+        self.assertEqual(self.index.nearest("#", VectorTuple(0, 0), (0, 1)), (0, 3))
+        self.assertIsNone(self.index.nearest("#", VectorTuple(0, 0), "<"))
+
+    def test_nearest_brute_force(self):
+        """
+        Test agreement with a step by step scan on a random grid.
+        """
+        grid = np.random.default_rng(0).choice(list(".#"), (13, 11), p=(0.8, 0.2))
+        index = GridIndex(grid)
+        for pos in np.ndindex(grid.shape):
+            for delta in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                expected = None
+                current = VectorTuple(*pos) + VectorTuple(*delta)
+                while current.valid(grid):
+                    if grid[current] == "#":
+                        expected = current
+                        break
+                    current += VectorTuple(*delta)
+                self.assertEqual(index.nearest("#", pos, delta), expected)
+
+    def test_compact(self):
+        """
+        Test string symbols on compact grids.
+        """
+        index = GridIndex(parse(LINES, compact=True))
+        self.assertEqual(index.count("#"), 7)
+        self.assertEqual(index.nearest("#", VectorTuple(3, 2), "west"), (3, 1))
@@ -0,0 +1,133 @@
+"""
+Test the grid view class.
+"""
+
+import unittest
+import numpy as np
+from ..grid_view import GridView
+from ..vector_tuple import VectorTuple
+from ...grid_helpers import expand_grid, parse
+
+
+class TestFiniteView(unittest.TestCase):
+    """
+    Test scaled and repeated views.
+    """
+
+    def setUp(self):
+        self.array = parse(["#..", ".#."])
+
+    def test_tiled(self):
+        """
+        Test a tiled view matches np.tile.
+        """
+        view = GridView(self.array, reps=(2, 3))
+        self.assertEqual(view.shape, (4, 9))
+        np.testing.assert_array_equal(view.materialize(), np.tile(self.array, (2, 3)))
+        for pos in view:
+            self.assertEqual(view[pos], view.materialize()[pos])
+
+    def test_scaled(self):
+        """
+        Test a scaled view matches expand_grid.
+        """
+        view = GridView(self.array, scale=3)
+        np.testing.assert_array_equal(view.materialize(), expand_grid(self.array, 3))
+        self.assertEqual(len(view), 54)
+
+    def test_get(self):
+        """
+        Test bounds checked lookups.
+        """
+        view = GridView(self.array, reps=2)
+        self.assertEqual(view.get(VectorTuple(3, 4)), "#")
+        self.assertIsNone(view.get(VectorTuple(4, 0)))
+
+    def test_neighbors(self):
+        """
+        Test neighbors respect the view bounds.
+        """
+        view = GridView(self.array, reps=2)
+        self.assertEqual(
+            set(view.neighbors(VectorTuple(3, 5))),
+            {VectorTuple(2, 5), VectorTuple(3, 4)},
+        )
+
+    def test_take(self):
+        """
+        Test batched lookups.
+        """
+        view = GridView(self.array, scale=2, reps=2)
+        coords = [(0, 0), (2, 2), (7, 11), (8, 0)]
+        np.testing.assert_array_equal(
+            view.take(coords, default="x"),
+            ["#", "#", ".", "x"],
+        )
+
+    def test_find(self):
+        """
+        Test finding every repetition of a symbol.
+        """
+        view = GridView(self.array, scale=2, reps=2)
+        expected = [
+            VectorTuple(pos) for pos in np.argwhere(view.materialize() == "#").tolist()
+        ]
+        self.assertEqual(view.find("#"), expected)
+
+    def test_write_through(self):
+        """
+        Test assignments modify the source array.
+        """
+        view = GridView(self.array.copy(), reps=2)
+        view[VectorTuple(2, 5)] = "x"
+        self.assertEqual(view.array[0, 2], "x")
+        self.assertEqual(view[VectorTuple(0, 2)], "x")
+
+    def test_invalid_reps(self):
+        """
+        Test per-axis values of the wrong length.
+        """
+        with self.assertRaises(ValueError):
+            GridView(self.array, reps=(1, 2, 3))
+
+
+class TestInfiniteView(unittest.TestCase):
+    """
+    Test infinitely tiled views.
+    """
+
+    def setUp(self):
+        self.view = GridView(parse(["#.", ".."]), reps=None)
+
+    def test_negative(self):
+        """
+        Test lookups at negative coordinates wrap around.
+        """
+        self.assertEqual(self.view[VectorTuple(-2, -4)], "#")
+        self.assertEqual(self.view[VectorTuple(-1, -1)], ".")
+        self.assertIn(VectorTuple(-100, 100), self.view)
+
+    def test_neighbors(self):
+        """
+        Test every neighbor is in bounds.
+        """
+        self.assertEqual(len(list(self.view.neighbors(VectorTuple(0, 0)))), 4)
+
+    def test_take(self):
+        """
+        Test batched lookups never fall out of bounds.
+        """
+        np.testing.assert_array_equal(
+            self.view.take([(-2, 0), (101, 1)]),
+            ["#", "."],
+        )
+
+    def test_unbounded_operations(self):
+        """
+        Test operations requiring a finite size.
+        """
+        for operation in (len, list, GridView.materialize):
+            with self.assertRaises(TypeError):
+                operation(self.view)
+        with self.assertRaises(TypeError):
+            self.view.find("#")
@@ -0,0 +1,162 @@
+"""
+Test the HybridIntegerSet class.
+"""
+
+import operator
+import random
+import unittest
+from ..hybrid_integer_set import HybridIntegerSet
+from ..integer_set import IntegerSet
+
+
+def random_values(seed):
+    """
+    Generate values mixing scattered members, long runs and a dense chunk, so
+    every container type is used.
+    """
+    rng = random.Random(seed)
+    values = {rng.randrange(-(1 << 17), 1 << 18) for _ in range(3000)}
+    for _ in range(20):
+        start = rng.randrange(-(1 << 17), 1 << 18)
+        values.update(range(start, start + rng.randrange(5000)))
+    values.update(rng.sample(range(1 << 17, 3 << 16), 20000))
+    return values
+
+
+class TestContainers(unittest.TestCase):
+    """
+    Test the container chosen for each chunk.
+    """
+
+    def test_array(self):
+        """
+        Test scattered members use arrays.
+        """
+        iset = HybridIntegerSet.from_values(range(0, 300000, 50))
+        self.assertEqual(iset.container_counts(), {"array": 5})
+        self.assertEqual(iset.nbytes, 2 * len(iset))
+
+    def test_runs(self):
+        """
+        Test long runs use runs, including across chunk boundaries.
+        """
+        iset = HybridIntegerSet((0, 10), (100, 200000))
+        self.assertEqual(iset.container_counts(), {"runs": 4})
+        self.assertEqual(iset.runs(), [(0, 10), (100, 200000)])
+
+    def test_bitmap(self):
+        """
+        Test dense fragmented chunks use bitmaps.
+        """
+        iset = HybridIntegerSet.from_values(range(0, 1 << 16, 2))
+        self.assertEqual(iset.container_counts(), {"bitmap": 1})
+        self.assertEqual(iset.nbytes, 8192)
+
+    def test_conversion(self):
+        """
+        Test containers are converted as operations change their contents.
+        """
+        iset = HybridIntegerSet.from_values(range(0, 1 << 16, 2))
+        iset |= HybridIntegerSet((0, 60000))
+        self.assertEqual(iset.container_counts(), {"bitmap": 1})
+        iset -= HybridIntegerSet((60001, 1 << 16))
+        self.assertEqual(iset.container_counts(), {"runs": 1})
+        self.assertEqual(iset, HybridIntegerSet((0, 60000)))
+
+
+class TestOperations(unittest.TestCase):
+    """
+    Test set operations against python sets.
+    """
+
+    def test_random(self):
+        """
+        Test every operator on random sets using every container pair.
+        """
+        for seed in range(3):
+            values_0, values_1 = random_values(seed), random_values(seed + 100)
+            set_0 = HybridIntegerSet.from_values(values_0)
+            set_1 = HybridIntegerSet.from_values(values_1)
+            for function in (operator.or_, operator.and_, operator.sub, operator.xor):
+                result = function(set_0, set_1)
+                expected = function(values_0, values_1)
+                self.assertEqual(len(result), len(expected))
+                self.assertEqual(set(result), expected)
+                self.assertEqual(result, HybridIntegerSet.from_values(expected))
+
+    def test_methods(self):
+        """
+        Test the multi-argument methods.
+        """
+        set_0 = HybridIntegerSet((0, 10))
+        set_1 = HybridIntegerSet((5, 20))
+        set_2 = HybridIntegerSet((8, 8))
+        self.assertEqual(set_0.union(set_1, set_2), HybridIntegerSet((0, 20)))
+        self.assertEqual(set_0.intersection(set_1, set_2), set_2)
+        self.assertEqual(set_0.difference(set_1), HybridIntegerSet((0, 4)))
+        self.assertEqual(
+            set_0.symmetric_difference(set_1), HybridIntegerSet((0, 4), (11, 20))
+        )
+        self.assertEqual(set_0, HybridIntegerSet((0, 10)))
+
+    def test_comparisons(self):
+        """
+        Test subset and superset comparisons.
+        """
+        set_0 = HybridIntegerSet((0, 10))
+        set_1 = HybridIntegerSet((0, 20))
+        self.assertTrue(set_0 < set_1)
+        self.assertTrue(set_0 <= HybridIntegerSet((0, 10)))
+        self.assertTrue(set_1 > set_0)
+        self.assertTrue(set_1 >= HybridIntegerSet((0, 20)))
+        self.assertFalse(set_1 < set_0)
+        self.assertTrue(set_0.isdisjoint(HybridIntegerSet((11, 12))))
+
+
+class TestElements(unittest.TestCase):
+    """
+    Test element access and modification.
+    """
+
+    def test_contains(self):
+        """
+        Test membership in each container type.
+        """
+        values = random_values(0)
+        iset = HybridIntegerSet.from_values(values)
+        for element in random.Random(1).sample(range(-(1 << 17), 3 << 16), 2000):
+            self.assertEqual(element in iset, element in values)
+
+    def test_add_remove(self):
+        """
+        Test add, remove, discard and clear.
+        """
+        iset = HybridIntegerSet()
+        iset.add(-1)
+        iset.add(1 << 20)
+        self.assertEqual(list(iset), [-1, 1 << 20])
+        iset.remove(-1)
+        iset.discard(5)
+        self.assertEqual(list(iset), [1 << 20])
+        with self.assertRaises(KeyError):
+            iset.remove(5)
+        iset.clear()
+        self.assertEqual(len(iset), 0)
+
+    def test_copy(self):
+        """
+        Test copies are independent.
+        """
+        iset = HybridIntegerSet((0, 10))
+        copy = iset.copy()
+        copy.add(20)
+        self.assertEqual(iset, HybridIntegerSet((0, 10)))
+
+    def test_from_runs(self):
+        """
+        Test building from IntegerSet runs, and repr.
+        """
+        runs = IntegerSet((0, 5), (10, 10)).runs()
+        iset = HybridIntegerSet.from_runs(runs)
+        self.assertEqual(iset.runs(), runs)
+        self.assertEqual(repr(iset), "HybridIntegerSet((0, 5), (10, 10))")
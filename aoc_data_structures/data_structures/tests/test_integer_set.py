@@ -4,6 +4,7 @@ Test the IntegerSet data structure.
 
 import unittest
 from ..integer_set import IntegerSet
+from ..interval import Interval
 
 
 class TestUnion(unittest.TestCase):
@@ -473,6 +474,14 @@ class TestMiscellaneous(unittest.TestCase):
 
         self.assertEqual(elements, {0, 1, 2, 10, 11, 12})
 
+    def test_iter_reversed(self):
+        """
+        Test iter yields the members of reversed intervals.
+        """
+        set_0 = IntegerSet((2, 0), (12, 10))
+        self.assertEqual(list(set_0), [0, 1, 2, 10, 11, 12])
+        self.assertEqual(len(list(set_0)), len(set_0))
+
     def test_repr(self):
         """
         Test __repr__
@@ -503,3 +512,194 @@ class TestConsolidation(unittest.TestCase):
         """
         set_0 = IntegerSet((0, 20), (0, 10))
         self.assertEqual(set_0, IntegerSet((0, 20)))
+
+    def test_single_element_union(self):
+        """
+        Test a union with a single element interval keeps the orientation.
+        """
+        set_0 = IntegerSet((1, 1)) | IntegerSet((1, 5))
+        self.assertEqual(set_0, IntegerSet((1, 5)))
+        self.assertEqual(list(set_0), [1, 2, 3, 4, 5])
+
+    def test_nested(self):
+        """
+        Test consolidation when an interval is nested inside another.
+        """
+        set_0 = IntegerSet((0, 10), (2, 5), (4, 10))
+        self.assertEqual(set_0, IntegerSet((0, 10)))
+        self.assertEqual(len(set_0), 11)
+
+
+class TestRuns(unittest.TestCase):
+    """
+    Test the runs() and from_runs() conversions.
+    """
+
+    def test_runs(self):
+        """
+        Test runs are ascending regardless of interval orientation.
+        """
+        self.assertEqual(IntegerSet((5, 0), (7, 9)).runs(), [(0, 5), (7, 9)])
+        self.assertEqual(IntegerSet().runs(), [])
+
+    def test_runs_reversed_overlap(self):
+        """
+        Test reversed intervals are merged with the intervals they overlap.
+        """
+        iset = IntegerSet((5, 0), (3, 8))
+        self.assertEqual(iset.runs(), [(0, 8)])
+        self.assertEqual(len(iset), 9)
+
+        iset = IntegerSet((-1, -6), (2, -3))
+        self.assertEqual(iset.runs(), [(-6, 2)])
+        self.assertEqual(len(iset), 9)
+        self.assertEqual(list(iset), list(range(-6, 3)))
+
+        self.assertEqual(IntegerSet((9, 0), (3, 2)).runs(), [(0, 9)])
+        self.assertEqual(IntegerSet((5, 0), (7, 6)).runs(), [(0, 7)])
+
+    def test_from_runs(self):
+        """
+        Test from_runs round trips.
+        """
+        set_0 = IntegerSet((0, 5), (7, 9), (20, 20))
+        set_1 = IntegerSet.from_runs(set_0.runs())
+        self.assertEqual(set_1, set_0)
+        self.assertEqual(len(set_1), 10)
+        self.assertIn(8, set_1)
+        self.assertEqual(set_1 | IntegerSet((6, 6)), IntegerSet((0, 9), (20, 20)))
+
+
+class TestNeighbors(unittest.TestCase):
+    """
+    Test the min/max, successor/predecessor and gap queries.
+    """
+
+    def test_min_max(self):
+        """
+        Test min and max, including reversed intervals.
+        """
+        set_0 = IntegerSet((10, 5), (20, 30))
+        self.assertEqual(set_0.min(), 5)
+        self.assertEqual(set_0.max(), 30)
+        with self.assertRaises(ValueError):
+            IntegerSet().min()
+        with self.assertRaises(ValueError):
+            IntegerSet().max()
+
+    def test_against_brute_force(self):
+        """
+        Test every query against a scan of the members.
+        """
+        for set_0 in (
+            IntegerSet((0, 5), (10, 15), (17, 17)),
+            IntegerSet((5, 0), (15, 10), (17, 17)),
+            IntegerSet(),
+        ):
+            members = set(set_0)
+            for element in range(-3, 22):
+                above = [value for value in members if value >= element]
+                below = [value for value in members if value <= element]
+                self.assertEqual(set_0.successor(element), min(above, default=None))
+                self.assertEqual(set_0.predecessor(element), max(below, default=None))
+                self.assertEqual(
+                    set_0.next_gap(element),
+                    min(value for value in range(element, 30) if value not in members),
+                )
+                self.assertEqual(
+                    set_0.prev_gap(element),
+                    max(
+                        value
+                        for value in range(-5, element + 1)
+                        if value not in members
+                    ),
+                )
+
+
+class TestMorphology(unittest.TestCase):
+    """
+    Test shift, dilate, erode, opening, closing and complement.
+    """
+
+    def setUp(self):
+        """
+        Build a set with runs of lengths 6, 1, 3 and 4 and gaps of 3, 1 and 5.
+        """
+        self.set_0 = IntegerSet((0, 5), (9, 9), (11, 13), (19, 22))
+
+    def test_shift(self):
+        """
+        Test shifting both ways.
+        """
+        self.assertEqual(
+            self.set_0.shift(5).runs(), [(5, 10), (14, 14), (16, 18), (24, 27)]
+        )
+        self.assertEqual(self.set_0.shift(-5).shift(5), self.set_0)
+        self.assertEqual(IntegerSet().shift(3), IntegerSet())
+
+    def test_dilate(self):
+        """
+        Test dilation merges runs whose gaps close.
+        """
+        self.assertEqual(self.set_0.dilate(0), self.set_0)
+        self.assertEqual(self.set_0.dilate(1).runs(), [(-1, 6), (8, 14), (18, 23)])
+        self.assertEqual(self.set_0.dilate(2).runs(), [(-2, 15), (17, 24)])
+        self.assertEqual(self.set_0.dilate(3).runs(), [(-3, 25)])
+
+    def test_erode(self):
+        """
+        Test erosion drops runs that are too short.
+        """
+        self.assertEqual(self.set_0.erode(0), self.set_0)
+        self.assertEqual(self.set_0.erode(1).runs(), [(1, 4), (12, 12), (20, 21)])
+        self.assertEqual(self.set_0.erode(2).runs(), [(2, 3)])
+        self.assertEqual(self.set_0.erode(3), IntegerSet())
+
+    def test_opening_closing(self):
+        """
+        Test opening drops short runs and closing fills short gaps.
+        """
+        self.assertEqual(self.set_0.opening(1).runs(), [(0, 5), (11, 13), (19, 22)])
+        self.assertEqual(self.set_0.closing(1).runs(), [(0, 5), (9, 13), (19, 22)])
+        self.assertEqual(self.set_0.closing(3), IntegerSet((0, 22)))
+
+    def test_against_brute_force(self):
+        """
+        Test dilation and erosion against their member-wise definitions.
+        """
+        members = set(self.set_0)
+        for radius in range(4):
+            offsets = range(-radius, radius + 1)
+            dilated = {value + offset for value in members for offset in offsets}
+            eroded = {
+                value
+                for value in range(-10, 40)
+                if all(value + offset in members for offset in offsets)
+            }
+            self.assertEqual(set(self.set_0.dilate(radius)), dilated)
+            self.assertEqual(set(self.set_0.erode(radius)), eroded)
+
+    def test_negative_radius(self):
+        """
+        Test negative radii raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.set_0.dilate(-1)
+        with self.assertRaises(ValueError):
+            self.set_0.erode(-1)
+
+    def test_complement(self):
+        """
+        Test complement within intervals and tuples, either orientation.
+        """
+        self.assertEqual(
+            self.set_0.complement(Interval(-2, 30)).runs(),
+            [(-2, -1), (6, 8), (10, 10), (14, 18), (23, 30)],
+        )
+        self.assertEqual(self.set_0.complement((12, 7)).runs(), [(7, 8), (10, 10)])
+        self.assertEqual(self.set_0.complement((1, 4)), IntegerSet())
+        self.assertEqual(self.set_0.complement((30, 40)).runs(), [(30, 40)])
+        for start in range(-2, 25):
+            for end in range(start, 25):
+                expected = set(range(start, end + 1)) - set(self.set_0)
+                self.assertEqual(set(self.set_0.complement((start, end))), expected)
@@ -375,6 +375,22 @@ class TestMiscellaneous(unittest.TestCase):
     Test miscellaneous methods of the Interval class.
     """
 
+    def test_increasing(self):
+        """
+        Test single element intervals count as increasing.
+        """
+        self.assertTrue(Interval(0, 1).increasing())
+        self.assertTrue(Interval(5, 5).increasing())
+        self.assertFalse(Interval(1, 0).increasing())
+
+    def test_single_element_orientation(self):
+        """
+        Test a single element left operand produces an increasing result.
+        """
+        self.assertEqual(Interval(5, 5) | Interval(3, 8), Interval(3, 8))
+        self.assertEqual(Interval(5, 5) & Interval(3, 8), Interval(5, 5))
+        self.assertEqual(list((Interval(1, 1) | Interval(1, 5)).range), [1, 2, 3, 4, 5])
+
     def test_hash(self):
         """
         Test the hash function.
@@ -0,0 +1,150 @@
+"""
+Test the LazyIntegerSet class.
+"""
+
+import operator
+import random
+import unittest
+import numpy as np
+from ..frozen_integer_set import FrozenIntegerSet
+from ..integer_set import IntegerSet
+from ..lazy_integer_set import LazyIntegerSet
+
+
+def random_set(rng, count=20, span=200):
+    """
+    Build an IntegerSet of count random intervals in [0, span).
+    """
+    intervals = []
+    for _ in range(count):
+        start = rng.randrange(span)
+        intervals.append((start, start + rng.randrange(10)))
+    return IntegerSet(*intervals)
+
+
+class TestEvaluation(unittest.TestCase):
+    """
+    Test lazy expressions evaluate like the eager operators.
+    """
+
+    def test_operators(self):
+        """
+        Test each operator against IntegerSet.
+        """
+        rng = random.Random(0)
+        for _ in range(20):
+            set_0, set_1 = random_set(rng), random_set(rng)
+            for function in (operator.or_, operator.and_, operator.sub, operator.xor):
+                expected = function(set_0, set_1)
+                lazy = function(set_0.lazy(), set_1)
+                self.assertEqual(len(lazy), len(expected))
+                self.assertEqual(lazy.materialize(), expected)
+
+    def test_expression(self):
+        """
+        Test a nested expression, its length, membership and iteration.
+        """
+        rng = random.Random(1)
+        for _ in range(20):
+            a, b, c, d, e = (random_set(rng) for _ in range(5))
+            expected = (a | b) & (c - d) ^ e
+            lazy = (a.lazy() | b) & (c.lazy() - d) ^ e
+            self.assertEqual(len(lazy), len(expected))
+            self.assertEqual(list(lazy), list(expected))
+            for element in range(-1, 212):
+                self.assertEqual(element in lazy, element in expected)
+
+    def test_reflected(self):
+        """
+        Test IntegerSets, frozen sets and run arrays as left operands.
+        """
+        rng = random.Random(3)
+        for _ in range(10):
+            set_0, set_1 = random_set(rng), random_set(rng)
+            lazy = set_1.lazy()
+            for function in (operator.or_, operator.and_, operator.sub, operator.xor):
+                expected = function(set_0, set_1)
+                for left in (set_0, FrozenIntegerSet.from_runs(set_0.runs())):
+                    result = function(left, lazy)
+                    self.assertIsInstance(result, LazyIntegerSet)
+                    self.assertEqual(result.materialize(), expected)
+                result = function(np.array(set_0.runs()).reshape(-1, 2), lazy)
+                self.assertIsInstance(result, LazyIntegerSet)
+                self.assertEqual(result.materialize(), expected)
+
+    def test_unsupported_operand(self):
+        """
+        Test IntegerSet operators reject other types with TypeError.
+        """
+        with self.assertRaises(TypeError):
+            IntegerSet((0, 5)) | 5  # pylint: disable=expression-not-assigned
+
+    def test_methods(self):
+        """
+        Test the multi-operand methods and flattened chains.
+        """
+        rng = random.Random(2)
+        sets = [random_set(rng) for _ in range(4)]
+        lazy = sets[0].lazy()
+        self.assertEqual(lazy.union(*sets[1:]).materialize(), sets[0].union(*sets[1:]))
+        self.assertEqual(
+            lazy.intersection(*sets[1:]).materialize(),
+            sets[0].intersection(*sets[1:]),
+        )
+        self.assertEqual(
+            (lazy - sets[1] - sets[2]).materialize(), sets[0] - sets[1] - sets[2]
+        )
+        self.assertEqual(len((lazy | sets[1] | sets[2]).operands), 3)
+        self.assertEqual(
+            (lazy ^ sets[1] ^ sets[2]).materialize(), sets[0] ^ sets[1] ^ sets[2]
+        )
+
+    def test_shared_leaf(self):
+        """
+        Test a leaf used more than once in an expression.
+        """
+        set_0, set_1 = IntegerSet((0, 9)), IntegerSet((5, 14))
+        lazy = set_0.lazy()
+        expression = (lazy | set_1) - (lazy & set_1)
+        self.assertEqual(expression.materialize(), set_0 ^ set_1)
+
+    def test_empty(self):
+        """
+        Test expressions over empty sets.
+        """
+        empty = LazyIntegerSet()
+        self.assertEqual(len(empty | IntegerSet()), 0)
+        self.assertEqual((empty | IntegerSet()).materialize(), IntegerSet())
+        self.assertNotIn(0, empty & IntegerSet((0, 5)))
+        self.assertEqual(len(empty ^ IntegerSet((0, 5))), 6)
+
+
+class TestLaziness(unittest.TestCase):
+    """
+    Test when expressions are evaluated.
+    """
+
+    def test_snapshot(self):
+        """
+        Test leaves don't see later changes to their sets.
+        """
+        iset = IntegerSet((0, 9))
+        lazy = iset.lazy() | IntegerSet((20, 29))
+        iset.add(15)
+        self.assertEqual(len(lazy), 20)
+        self.assertNotIn(15, lazy)
+
+    def test_cached(self):
+        """
+        Test the result is built once.
+        """
+        lazy = IntegerSet((0, 9)).lazy() - IntegerSet((3, 4))
+        self.assertIs(lazy.runs(), lazy.runs())
+        np.testing.assert_array_equal(lazy.runs(), [[0, 2], [5, 9]])
+
+    def test_repr(self):
+        """
+        Test the expression is readable.
+        """
+        lazy = (IntegerSet((0, 9)).lazy() | IntegerSet()) - IntegerSet((3, 4))
+        self.assertEqual(repr(lazy), "LazyIntegerSet((<1 runs> | <0 runs>) - <1 runs>)")
@@ -0,0 +1,230 @@
+"""
+Test the PersistentIntegerSet class.
+"""
+
+import operator
+import random
+import unittest
+from ..integer_set import IntegerSet
+from ..persistent_integer_set import PersistentIntegerSet
+
+
+def nodes(node):
+    """
+    Return the ids of every node in a treap.
+    """
+    if node is None:
+        return set()
+    return {id(node)} | nodes(node.left) | nodes(node.right)
+
+
+def depth(node):
+    """
+    Return the depth of a treap.
+    """
+    if node is None:
+        return 0
+    return 1 + max(depth(node.left), depth(node.right))
+
+
+def check_treap(test, node, low=None, high=None):
+    """
+    Check the ordering, heap and count invariants of a treap.
+    """
+    if node is None:
+        return
+    test.assertLessEqual(node.start, node.end)
+    if low is not None:
+        test.assertGreater(node.start, low + 1)
+    if high is not None:
+        test.assertLess(node.end + 1, high)
+    for child in (node.left, node.right):
+        if child is not None:
+            test.assertLess(child.priority, node.priority)
+    count = node.end - node.start + 1
+    count += sum(child.count for child in (node.left, node.right) if child)
+    test.assertEqual(node.count, count)
+    longest = max(
+        [node.end - node.start + 1]
+        + [child.longest for child in (node.left, node.right) if child]
+    )
+    test.assertEqual(node.longest, longest)
+    check_treap(test, node.left, low, node.start)
+    check_treap(test, node.right, node.end, high)
+
+
+class TestConstruction(unittest.TestCase):
+    """
+    Test construction and the read-only interface.
+    """
+
+    def test_init(self):
+        """
+        Test overlapping, adjacent and reversed intervals are merged.
+        """
+        iset = PersistentIntegerSet((5, 0), (3, 8), (9, 9), (20, 25))
+        self.assertEqual(iset.runs(), [(0, 9), (20, 25)])
+        self.assertEqual(len(iset), 16)
+        self.assertEqual(list(PersistentIntegerSet((1, 3))), [1, 2, 3])
+        self.assertEqual(repr(iset), "PersistentIntegerSet((0, 9), (20, 25))")
+        check_treap(self, iset.root())
+
+    def test_balanced(self):
+        """
+        Test the bulk built treap is balanced.
+        """
+        iset = PersistentIntegerSet(*((value * 3, value * 3) for value in range(4096)))
+        check_treap(self, iset.root())
+        self.assertLess(depth(iset.root()), 40)
+
+    def test_contains(self):
+        """
+        Test membership.
+        """
+        iset = PersistentIntegerSet((0, 5), (10, 10))
+        self.assertEqual(
+            [value in iset for value in range(-1, 12)],
+            [
+                False,
+                True,
+                True,
+                True,
+                True,
+                True,
+                True,
+                False,
+                False,
+                False,
+                False,
+                True,
+                False,
+            ],
+        )
+
+    def test_hash(self):
+        """
+        Test equal sets hash equally.
+        """
+        set_0 = PersistentIntegerSet((0, 10)).discard(5)
+        set_1 = PersistentIntegerSet((0, 4), (6, 10))
+        self.assertEqual(set_0, set_1)
+        self.assertIn(set_0, {set_1})
+        self.assertNotEqual(set_0, PersistentIntegerSet((0, 10)))
+
+
+class TestPersistence(unittest.TestCase):
+    """
+    Test updates return new versions sharing structure.
+    """
+
+    def test_versions(self):
+        """
+        Test older versions are unchanged.
+        """
+        version_0 = PersistentIntegerSet((0, 99))
+        version_1 = version_0.discard_range(10, 19)
+        version_2 = version_1.add(15)
+        self.assertEqual(version_0.runs(), [(0, 99)])
+        self.assertEqual(version_1.runs(), [(0, 9), (20, 99)])
+        self.assertEqual(version_2.runs(), [(0, 9), (15, 15), (20, 99)])
+
+    def test_sharing(self):
+        """
+        Test an update copies O(log n) nodes.
+        """
+        iset = PersistentIntegerSet(*((value * 3, value * 3) for value in range(4096)))
+        updated = iset.add(3001).discard(6000)
+        shared = nodes(iset.root()) & nodes(updated.root())
+        self.assertGreater(len(shared), 4096 - 100)
+
+    def test_no_op(self):
+        """
+        Test updates that change nothing return the same version.
+        """
+        iset = PersistentIntegerSet((0, 10), (20, 30))
+        self.assertIs(iset.add(5), iset)
+        self.assertIs(iset.add_range(21, 30), iset)
+        self.assertIs(iset.discard(15), iset)
+        self.assertIs(iset.discard_range(11, 19), iset)
+
+    def test_remove(self):
+        """
+        Test remove raises KeyError for missing elements.
+        """
+        iset = PersistentIntegerSet((0, 1))
+        self.assertEqual(iset.remove(0).runs(), [(1, 1)])
+        with self.assertRaises(KeyError):
+            iset.remove(2)
+
+
+class TestRandom(unittest.TestCase):
+    """
+    Test random updates against python sets.
+    """
+
+    def test_updates(self):
+        """
+        Test random range additions and removals.
+        """
+        rng = random.Random(0)
+        iset = PersistentIntegerSet()
+        expected = set()
+        for _ in range(2000):
+            start = rng.randrange(500)
+            end = start + rng.randrange(10)
+            if rng.random() < 0.6:
+                iset = iset.add_range(start, end)
+                expected.update(range(start, end + 1))
+            else:
+                iset = iset.discard_range(start, end)
+                expected.difference_update(range(start, end + 1))
+        check_treap(self, iset.root())
+        self.assertEqual(set(iset), expected)
+        self.assertEqual(len(iset), len(expected))
+        self.assertLess(depth(iset.root()), 40)
+
+    def test_operations(self):
+        """
+        Test the set operators.
+        """
+        rng = random.Random(1)
+        for _ in range(20):
+            intervals_0 = [
+                (start, start + rng.randrange(8))
+                for start in rng.sample(range(200), 20)
+            ]
+            intervals_1 = [
+                (start, start + rng.randrange(8))
+                for start in rng.sample(range(200), 20)
+            ]
+            set_0 = PersistentIntegerSet(*intervals_0)
+            set_1 = PersistentIntegerSet(*intervals_1)
+            for function in (operator.or_, operator.and_, operator.sub, operator.xor):
+                result = function(set_0, set_1)
+                check_treap(self, result.root())
+                self.assertEqual(set(result), function(set(set_0), set(set_1)))
+            self.assertEqual(set_0.thaw(), IntegerSet(*intervals_0))
+            self.assertEqual(set_0.isdisjoint(set_1), not set(set_0) & set(set_1))
+
+
+class TestQueries(unittest.TestCase):
+    """
+    Test the successor and run queries.
+    """
+
+    def test_against_brute_force(self):
+        """
+        Test successor, run and first_run against a scan of the runs.
+        """
+        iset = PersistentIntegerSet((0, 2), (5, 5), (8, 15), (20, 23), (30, 39))
+        runs = iset.runs()
+        members = set(iset)
+        for element in range(-2, 42):
+            above = [value for value in members if value >= element]
+            self.assertEqual(iset.successor(element), min(above, default=None))
+            containing = [run for run in runs if run[0] <= element <= run[1]]
+            self.assertEqual(iset.run(element), containing[0] if containing else None)
+        for length in range(12):
+            fitting = [run for run in runs if run[1] - run[0] + 1 >= length]
+            self.assertEqual(iset.first_run(length), fitting[0] if fitting else None)
+        self.assertIsNone(PersistentIntegerSet().first_run(1))
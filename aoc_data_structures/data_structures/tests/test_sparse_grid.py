@@ -0,0 +1,182 @@
+"""
+Test the sparse grid class.
+"""
+
+import unittest
+import numpy as np
+from ..sparse_grid import SparseGrid
+from ..vector_tuple import VectorTuple
+from ...grid_helpers import grid_str, hash_array, parse
+
+
+class TestSparseGrid(unittest.TestCase):
+    """
+    Test basic mapping operations.
+    """
+
+    def test_numpy_coordinates(self):
+        """
+        Test numpy integer coordinates address the same cells as ints.
+        """
+        grid = SparseGrid()
+        grid[np.array([5, -3])] = "#"
+        self.assertEqual(grid.pack(np.array([5, -3])), grid.pack((5, -3)))
+        self.assertIn((5, -3), grid)
+        self.assertEqual(grid.get((5, -3)), "#")
+        grid[(np.int64(5), np.int64(-3))] = "O"
+        self.assertEqual(len(grid), 1)
+        self.assertEqual(grid.bounds, ((5, -3), (5, -3)))
+        del grid[np.array([5, -3])]
+        self.assertEqual(len(grid), 0)
+
+        dense = SparseGrid.from_dense(parse(["#.", ".#"]))
+        self.assertIn((np.int64(1), np.int64(1)), dense)
+        for pos in np.argwhere(parse(["#.", ".#"]) == "#"):
+            self.assertEqual(dense[pos], "#")
+
+    def test_set_get(self):
+        """
+        Test setting and getting cells.
+        """
+        grid = SparseGrid()
+        grid[VectorTuple(-3, 7)] = "#"
+        self.assertEqual(grid[VectorTuple(-3, 7)], "#")
+        self.assertIn(VectorTuple(-3, 7), grid)
+        self.assertNotIn(VectorTuple(3, 7), grid)
+        self.assertIsNone(grid.get(VectorTuple(3, 7)))
+        self.assertEqual(list(grid), [VectorTuple(-3, 7)])
+
+    def test_pack_round_trip(self):
+        """
+        Test packing and unpacking extreme coordinates.
+        """
+        for ndim in (1, 2, 3, 4):
+            grid = SparseGrid(ndim)
+            low = -(1 << (min(32, 64 // ndim) - 1))
+            for pos in ([low] * ndim, [-low - 1] * ndim, [0] * ndim):
+                self.assertEqual(grid.unpack(grid.pack(pos)), VectorTuple(pos))
+
+    def test_out_of_range(self):
+        """
+        Test coordinates that can't be packed.
+        """
+        with self.assertRaises(IndexError):
+            SparseGrid(4)[(1 << 15, 0, 0, 0)] = 1
+        with self.assertRaises(IndexError):
+            SparseGrid(2)[(1, 2, 3)] = 1
+
+    def test_pop(self):
+        """
+        Test removing cells.
+        """
+        grid = SparseGrid(cells={(0, 0): 1})
+        self.assertEqual(grid.pop((0, 0)), 1)
+        self.assertEqual(grid.pop((0, 0), None), None)
+        self.assertEqual(len(grid), 0)
+
+
+class TestBounds(unittest.TestCase):
+    """
+    Test bounding box maintenance.
+    """
+
+    def test_grow(self):
+        """
+        Test the bounding box grows as cells are added.
+        """
+        grid = SparseGrid()
+        self.assertIsNone(grid.bounds)
+        grid[(2, 3)] = 1
+        self.assertEqual(grid.bounds, ((2, 3), (2, 3)))
+        grid[(-1, 5)] = 1
+        self.assertEqual(grid.bounds, ((-1, 3), (2, 5)))
+
+    def test_shrink(self):
+        """
+        Test the bounding box shrinks when edge cells are removed.
+        """
+        grid = SparseGrid(cells={(0, 0): 1, (5, 5): 1, (2, 1): 1})
+        del grid[(5, 5)]
+        self.assertEqual(grid.bounds, ((0, 0), (2, 1)))
+        del grid[(0, 0)]
+        del grid[(2, 1)]
+        self.assertIsNone(grid.bounds)
+
+
+class TestNeighbors(unittest.TestCase):
+    """
+    Test neighbor lookups.
+    """
+
+    def test_neighbors(self):
+        """
+        Test only set neighbors are generated.
+        """
+        grid = SparseGrid(cells={(0, 0): 1, (0, 1): 1, (1, 1): 1})
+        self.assertEqual(set(grid.neighbors((0, 0))), {(0, 1)})
+        self.assertEqual(set(grid.neighbors((0, 0), diagonals=True)), {(0, 1), (1, 1)})
+
+
+class TestDense(unittest.TestCase):
+    """
+    Test dense conversions.
+    """
+
+    def setUp(self):
+        self.lines = ["#..", ".#.", "..#"]
+
+    def test_round_trip(self):
+        """
+        Test converting to and from dense arrays.
+        """
+        dense = parse(self.lines)
+        grid = SparseGrid.from_dense(dense, origin=(10, -4))
+        self.assertEqual(len(grid), 3)
+        self.assertEqual(grid.bounds, ((10, -4), (12, -2)))
+        array, origin = grid.to_dense()
+        self.assertEqual(origin, (10, -4))
+        np.testing.assert_array_equal(array, dense)
+        self.assertEqual(hash_array(array), hash_array(dense))
+        self.assertEqual(str(grid), grid_str(dense))
+
+    def test_compact(self):
+        """
+        Test compact uint8 grids.
+        """
+        dense = parse(self.lines, compact=True)
+        grid = SparseGrid.from_dense(dense, background=ord("."))
+        array, _ = grid.to_dense(background=ord("."))
+        self.assertEqual(array.dtype, np.uint8)
+        self.assertEqual(grid_str(array), "\n".join(self.lines))
+
+    def test_compact_symbol_background(self):
+        """
+        Test compact uint8 grids round trip with the default str background.
+        """
+        dense = parse(["S..", ".#.", "..."], compact=True)
+        grid = SparseGrid.from_dense(dense)
+        self.assertEqual(len(grid), 2)
+        array, origin = grid.to_dense()
+        self.assertEqual(origin, (0, 0))
+        self.assertEqual(array.dtype, np.uint8)
+        np.testing.assert_array_equal(array, dense[:2, :2])
+        self.assertEqual(hash_array(array), hash_array(dense[:2, :2]))
+        self.assertEqual(str(grid), "S.\n.#")
+
+    def test_three_dimensions(self):
+        """
+        Test a 3-d round trip.
+        """
+        dense = np.zeros((2, 3, 4), dtype=int)
+        dense[0, 0, 0] = dense[1, 2, 3] = 7
+        array, origin = SparseGrid.from_dense(dense, background=0).to_dense(0)
+        self.assertEqual(origin, (0, 0, 0))
+        np.testing.assert_array_equal(array, dense)
+
+    def test_empty(self):
+        """
+        Test an empty grid.
+        """
+        array, origin = SparseGrid().to_dense()
+        self.assertEqual(array.shape, (0, 0))
+        self.assertIsNone(origin)
@@ -2,8 +2,8 @@
 Datastructures collection.
 """
 
+import sys
 from itertools import product
-import numpy as np
 
 
 class VectorTuple(tuple):
@@ -75,7 +75,10 @@ class VectorTuple(tuple):
     def _get_ranges(self, bounds):
         if bounds is None:
             return None
-        if isinstance(bounds, np.ndarray):
+        # numpy is only imported by callers that use it, if it hasn't been
+        # imported then bounds can't be an ndarray
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(bounds, numpy.ndarray):
             return self._get_ranges_from_ndarray(bounds)
         if isinstance(bounds, int):
             return self._get_ranges_from_int(bounds)
@@ -0,0 +1,99 @@
+"""
+Batched distance kernels for collections of points, such as lists of
+VectorTuples.
+"""
+
+import numpy as np
+
+METRICS = ("manhattan", "chebyshev", "sqeuclidean")
+
+
+def as_points(points):
+    """
+    Convert a list of VectorTuples (or any sequence of equal length tuples) to
+    an (N, d) integer array.  Signed integer and float arrays are passed
+    through unchanged.  Unsigned arrays are converted to int64 so coordinate
+    differences can't wrap, and raise ValueError if a value doesn't fit.
+    """
+    points = _signed(np.asarray(points))
+
+    if points.ndim == 1:
+        points = points.reshape(-1, 1)
+
+    if points.ndim != 2:
+        raise ValueError("Points must be an (N, d) array or a list of tuples.")
+
+    return points
+
+
+def distances_to(point, points, metric="manhattan"):
+    """
+    Return the distance from a single point to each of points as an (N,) array.
+
+    >>> distances_to(VectorTuple(0, 0), [VectorTuple(1, 2), VectorTuple(-3, 0)])
+    array([3, 3])
+    """
+    points = as_points(points)
+    deltas = points - _signed(np.asarray(point))
+    return _reduce(deltas, metric, axis=1)
+
+
+def pairwise_distances(points, metric="manhattan", others=None, block_size=1024):
+    """
+    Return the (N, M) matrix of distances between each of points and each of
+    others.  If others is omitted, distances are computed between every pair of
+    points.
+
+    The matrix is filled in tiles of block_size rows by block_size columns, so
+    the intermediate difference array never holds more than
+    block_size * block_size * d elements, however large N and M are.
+
+    >>> pairwise_distances([VectorTuple(0, 0), VectorTuple(1, 2)])
+    array([[0, 3],
+           [3, 0]])
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unsupported metric {metric!r}.")
+
+    points = as_points(points)
+    others = points if others is None else as_points(others)
+    dtype = np.result_type(points, others)
+    result = np.empty((len(points), len(others)), dtype=dtype)
+
+    for row in range(0, len(points), block_size):
+        rows = points[row : row + block_size, np.newaxis, :]
+        for column in range(0, len(others), block_size):
+            deltas = rows - others[np.newaxis, column : column + block_size, :]
+            result[row : row + block_size, column : column + block_size] = _reduce(
+                deltas, metric, axis=2
+            )
+
+    return result
+
+
+def _signed(array):
+    """
+    Convert an unsigned integer array to int64, leaving other arrays as they
+    are.
+    """
+    if array.dtype.kind != "u":
+        return array
+    if array.size and array.max() > np.iinfo(np.int64).max:
+        raise ValueError("Unsigned coordinates exceed the int64 range.")
+    return array.astype(np.int64)
+
+
+def _reduce(deltas, metric, axis):
+    """
+    Reduce coordinate differences to distances along axis.
+    """
+    if metric == "manhattan":
+        return np.abs(deltas).sum(axis=axis)
+
+    if metric == "chebyshev":
+        return np.abs(deltas).max(axis=axis, initial=0)
+
+    if metric == "sqeuclidean":
+        return (deltas * deltas).sum(axis=axis)
+
+    raise ValueError(f"Unsupported metric {metric!r}.")
@@ -2,6 +2,8 @@
 A collection of helpers for common grid-based AOC challenges.
 """
 
+import hashlib
+import mmap
 import numpy as np
 
 
@@ -20,14 +22,18 @@ def expand_grid(grid, expansion_size=2):
             1 1 0 0
             0 0 1 1
             0 0 1 1
+
+    GridView provides the same expansion lazily, without copying the grid.
     """
     grid = np.repeat(grid, expansion_size, axis=0)
     return np.repeat(grid, expansion_size, axis=1)
 
 
-def parse(lines):
+def parse(lines, compact=False):
     """
     Parse a list of strings representing a grid.  Return as a 2-D numpy array.
+    If compact is set, the grid is returned as a uint8 array of ASCII codes
+    rather than a "<U1" array, which uses a quarter of the memory.
 
     ex input:
     [
@@ -45,6 +51,12 @@ def parse(lines):
         ["#", "#", "#", "#"],
     ]
     """
+    if compact:
+        rows = [line.strip().encode("ascii") for line in lines]
+        buffer = bytearray().join(rows)
+        width = len(rows[0]) if rows else 0
+        return np.frombuffer(buffer, dtype=np.uint8).reshape(len(rows), width)
+
     grid = []
 
     for line in lines:
@@ -53,16 +65,303 @@ def parse(lines):
     return np.array(grid)
 
 
+def encode_grid(grid):
+    """
+    Convert a "<U1" grid to a compact uint8 grid of ASCII codes.  uint8 grids
+    are returned unchanged.
+    """
+    if grid.dtype == np.uint8:
+        return grid
+    return grid.astype("S1").view(np.uint8)
+
+
+def decode_grid(grid):
+    """
+    Convert a compact uint8 grid of ASCII codes to a "<U1" grid.  "<U1" grids
+    are returned unchanged.
+    """
+    if grid.dtype.kind == "U":
+        return grid
+    return np.ascontiguousarray(grid).view("S1").astype("U1")
+
+
+def translate(grid, mapping, default=0, dtype=None):
+    """
+    Translate the symbols of a grid through a 256 entry lookup table, in one
+    vectorized indexing operation.  Symbols missing from mapping are translated
+    to default.
+
+    >>> translate(parse(["#.", ".#"], compact=True), {"#": 1, ".": 0})
+    array([[1, 0],
+           [0, 1]])
+    """
+    dtype = np.result_type(default, *mapping.values()) if dtype is None else dtype
+    table = np.full(256, default, dtype=dtype)
+
+    for symbol, value in mapping.items():
+        table[symbol_code(symbol)] = value
+
+    return table[encode_grid(grid)]
+
+
+def symbol_code(symbol):
+    """
+    Return the ASCII code of a single character symbol.
+    """
+    if isinstance(symbol, (str, bytes)):
+        return ord(symbol)
+    return int(symbol)
+
+
+def parse_bytes(buffer):
+    """
+    Parse a bytes-like object representing a grid.  Return a 2-D uint8 numpy
+    array of the ASCII codes.  The array is a strided view of the buffer with
+    the line terminators skipped, no per-character objects are created and no
+    data is copied.  The result is read-only if the buffer is read-only.
+
+    Every line must have the same length.  Both "\\n" and "\\r\\n" line endings
+    are supported, a trailing line ending is optional.
+
+    ex input:
+    b"#.#\\n.#.\\n"
+
+    returns:
+    [
+        [35, 46, 35],
+        [46, 35, 46],
+    ]
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    width = _find_newline(data)
+
+    if width is None:
+        return data.reshape(1, -1) if len(data) else data.reshape(0, 0)
+
+    terminator = 1
+    if width > 0 and data[width - 1] == ord("\r"):
+        width -= 1
+        terminator = 2
+
+    stride = width + terminator
+    rows, remainder = divmod(len(data), stride)
+
+    if remainder == width and remainder != 0:
+        # no trailing line ending
+        rows += 1
+    elif remainder != 0:
+        raise ValueError("Grid lines must all have the same length.")
+
+    terminators = data[width + terminator - 1 :: stride]
+    if np.any(terminators != ord("\n")) or _count_newlines(data) != len(terminators):
+        raise ValueError("Grid lines must all have the same length.")
+
+    return np.lib.stride_tricks.as_strided(
+        data,
+        shape=(rows, width),
+        strides=(stride, 1),
+        writeable=False,
+    )
+
+
+def parse_file(path, use_mmap=True):
+    """
+    Parse a file representing a grid with parse_bytes.  If use_mmap is set the
+    file is memory mapped, so the returned read-only array is backed directly by
+    the page cache.  Otherwise the file is read into memory in one call.
+    """
+    with open(path, "rb") as file:
+        if use_mmap:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                buffer = b""
+        else:
+            buffer = file.read()
+
+    return parse_bytes(buffer)
+
+
+def _count_newlines(data, chunk_size=1 << 20):
+    """
+    Count the newlines in data a chunk at a time, to bound the size of the
+    temporary comparison array.
+    """
+    return sum(
+        int(np.count_nonzero(data[offset : offset + chunk_size] == ord("\n")))
+        for offset in range(0, len(data), chunk_size)
+    )
+
+
+def _find_newline(data, chunk_size=1 << 16):
+    """
+    Return the index of the first newline in data, or None.  The search is done
+    a chunk at a time, so only the first line of a large buffer is scanned.
+    """
+    for offset in range(0, len(data), chunk_size):
+        indices = np.flatnonzero(data[offset : offset + chunk_size] == ord("\n"))
+        if len(indices):
+            return offset + int(indices[0])
+    return None
+
+
 def grid_str(grid):
     """
     Return the string representation of a numpy array where each element can be
-    represented as a single character.
+    represented as a single character.  Compact uint8 grids are rendered from
+    their byte buffer in a single decode.
     """
+    if grid.dtype == np.uint8:
+        newlines = np.full((len(grid), 1), ord("\n"), dtype=np.uint8)
+        buffer = np.concatenate((grid, newlines), axis=1).tobytes()
+        return buffer[:-1].decode("ascii")
+
     return "\n".join("".join(row) for row in grid)
 
 
 def hash_array(array):
     """
-    Produce a hash based on current contents of a grid/array.
+    Produce a hash based on current contents of a grid/array.  The raw buffer is
+    hashed along with the dtype and shape, so no per-element objects are
+    created and any numeric dtype is supported.  The hash is only consistent
+    within one interpreter session, use digest_array for a persistent value.
+    """
+    if array.dtype.hasobject:
+        return hash((array.shape, tuple(array.flat)))
+
+    return hash((array.dtype.str, array.shape, array.tobytes()))
+
+
+def digest_array(array, bits=64):
+    """
+    Produce a stable 64 or 128 bit digest of a grid/array, suitable for
+    persisting across sessions.  The digest covers the dtype, shape and raw
+    contents of the array.
+    """
+    if bits not in (64, 128):
+        raise ValueError("bits must be 64 or 128.")
+
+    if array.dtype.hasobject:
+        raise TypeError("Object arrays can't be digested.")
+
+    digest = hashlib.blake2b(digest_size=bits // 8)
+    digest.update(array.dtype.str.encode())
+    digest.update(np.array(array.shape, dtype="<i8").tobytes())
+    digest.update(np.ascontiguousarray(array).data)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def distance_field(grid, sources, passable=None, metric="manhattan"):
+    """
+    Compute the distance from every cell of a grid to the nearest source cell.
+    The frontier is expanded one step at a time as a whole boolean mask, so each
+    step is a handful of vectorized array operations rather than a Python-level
+    visit per cell.
+
+    sources:   a boolean mask, a symbol, a collection of symbols, or an iterable
+               of coordinate tuples
+    passable:  a boolean mask, a symbol or a collection of symbols, None treats
+               every cell as passable
+    metric:    "manhattan" expands orthogonally, "chebyshev" also expands
+               diagonally
+
+    Unreachable cells are assigned -1.
+
+    ex input:
+    grid = parse([
+        "S..",
+        ".#.",
+        "...",
+    ])
+    distance_field(grid, "S", ".S")
+
+    returns:
+    [
+        [ 0,  1,  2],
+        [ 1, -1,  3],
+        [ 2,  3,  4],
+    ]
     """
-    return hash("".join(array.flatten()))
+    if metric not in ("manhattan", "chebyshev"):
+        raise ValueError(f"Unsupported metric {metric!r}.")
+
+    frontier = _source_mask(grid, sources)
+    passable = np.ones(grid.shape, dtype=bool) if passable is None else passable
+    passable = symbol_mask(grid, passable)
+
+    distances = np.full(grid.shape, -1, dtype=np.int64)
+    distances[frontier] = 0
+    unvisited = passable & ~frontier
+    distance = 0
+
+    while frontier.any():
+        distance += 1
+        frontier = _dilate(frontier, diagonal=metric == "chebyshev") & unvisited
+        distances[frontier] = distance
+        unvisited &= ~frontier
+
+    return distances
+
+
+def symbol_mask(grid, selector):
+    """
+    Convert a boolean mask, a symbol or a collection of symbols to a boolean mask
+    with the same shape as grid.  Symbols are converted to ASCII codes for
+    compact uint8 grids.
+    """
+    if isinstance(selector, np.ndarray) and selector.dtype == bool:
+        if selector.shape != grid.shape:
+            raise ValueError("Mask shape doesn't match grid shape.")
+        return selector
+
+    if isinstance(selector, str) and grid.dtype.kind in "Uu":
+        selector = list(selector)
+
+    if grid.dtype == np.uint8:
+        table = np.zeros(256, dtype=bool)
+        table[[symbol_code(symbol) for symbol in np.ravel(selector)]] = True
+        return table[grid]
+
+    selector = np.ravel(selector)
+    if len(selector) == 1:
+        return grid == selector[0]
+
+    return np.isin(grid, selector)
+
+
+def _source_mask(grid, sources):
+    """
+    Convert sources to a boolean mask.  In addition to the forms accepted by
+    symbol_mask, sources may be an iterable of coordinate tuples.
+    """
+    if isinstance(sources, (np.ndarray, str)):
+        return symbol_mask(grid, sources)
+
+    sources = list(sources)
+    if sources and all(isinstance(source, tuple) for source in sources):
+        mask = np.zeros(grid.shape, dtype=bool)
+        mask[tuple(np.array(sources).T)] = True
+        return mask
+
+    return symbol_mask(grid, sources)
+
+
+def _dilate(mask, diagonal=False):
+    """
+    Grow a boolean mask by one cell along every axis.  Orthogonal growth ORs the
+    shifted copies of the original mask.  Diagonal growth is separable, so the
+    mask is grown one axis at a time.
+    """
+    result = mask.copy()
+
+    for axis in range(mask.ndim):
+        source = result.copy() if diagonal else mask
+        lower = [slice(None)] * mask.ndim
+        upper = [slice(None)] * mask.ndim
+        lower[axis] = slice(None, -1)
+        upper[axis] = slice(1, None)
+        result[tuple(upper)] |= source[tuple(lower)]
+        result[tuple(lower)] |= source[tuple(upper)]
+
+    return result
@@ -0,0 +1,234 @@
+"""
+Opt-in instrumentation of the IntegerSet and Interval hot paths.
+
+Instrumentation works by temporarily replacing the instrumented methods with
+counting/timing wrappers.  While it's disabled the original methods are in
+place, so there is no overhead at all.  Enable it for a block of code with
+collect_stats(), or for a whole process by setting the environment variable
+AOC_DATA_STRUCTURES_STATS=1, in which case a report is printed to stderr on
+exit.
+
+>>> with collect_stats() as stats:
+...     IntegerSet((0, 10)) | IntegerSet((5, 20))
+>>> stats.calls["IntegerSet.union"]
+1
+"""
+
+import atexit
+import inspect
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from sortedcontainers import SortedKeyList
+from .data_structures import integer_set
+from .data_structures.integer_set import IntegerSet, IntervalSortAdapter
+from .data_structures.interval import Interval
+
+ENVIRONMENT_VARIABLE = "AOC_DATA_STRUCTURES_STATS"
+
+# (owner, attribute, name, timed)
+_TARGETS = [
+    *(
+        (IntegerSet, attribute, f"IntegerSet.{attribute}", True)
+        for attribute in (
+            "__init__",
+            "__ior__",
+            "__iand__",
+            "__isub__",
+            "__ixor__",
+            "__contains__",
+            "__len__",
+            "__eq__",
+            "union",
+            "intersection",
+            "difference",
+            "symmetric_difference",
+            "copy",
+            "consolidate_intervals",
+        )
+    ),
+    *(
+        (IntegerSet, attribute, f"IntegerSet.{attribute}", False)
+        for attribute in ("_generate_overlaps", "_generate_greater", "_generate_lesser")
+    ),
+    # adapters are Intervals too, so they're included in the Interval count
+    (Interval, "__init__", "Interval allocations", False),
+    (IntervalSortAdapter, "__init__", "IntervalSortAdapter allocations", False),
+    (SortedKeyList, "bisect_left", "SortedList bisects", False),
+    (integer_set, "SortedList", "SortedList builds", True),
+    (integer_set, "deepcopy", "deepcopy", True),
+]
+
+_ACTIVE = []
+_ORIGINALS = []
+
+
+class Stats:
+    """
+    Call counts and inclusive time spent per instrumented operation.  Generator
+    methods are counted but not timed, since their work is interleaved with the
+    caller's.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = Counter()
+
+    def __repr__(self):
+        return f"Stats(calls={dict(self.calls)})"
+
+    def clear(self):
+        """
+        Reset every counter.
+        """
+        self.calls.clear()
+        self.seconds.clear()
+
+    def report(self):
+        """
+        Return the counters as a table, slowest operations first.
+        """
+        names = sorted(self.calls, key=lambda name: (-self.seconds[name], name))
+        lines = [f"{'operation':<40} {'calls':>10} {'seconds':>12}"]
+        for name in names:
+            seconds = f"{self.seconds[name]:.6f}" if name in self.seconds else "-"
+            lines.append(f"{name:<40} {self.calls[name]:>10} {seconds:>12}")
+        return "\n".join(lines)
+
+
+def enable(stats=None):
+    """
+    Install the instrumentation wrappers, recording into stats.  Return the
+    Stats object.  Enabling while already enabled just switches the target.
+    """
+    stats = Stats() if stats is None else stats
+
+    if _ACTIVE:
+        _ACTIVE[0] = stats
+        return stats
+
+    _ACTIVE.append(stats)
+    for owner, attribute, name, timed in _TARGETS:
+        original = inspect.getattr_static(owner, attribute)
+        setattr(owner, attribute, _wrap(original, name, timed))
+        _ORIGINALS.append((owner, attribute, original))
+
+    return stats
+
+
+def disable():
+    """
+    Restore the original methods.  Return the Stats object that was active, or
+    None.
+    """
+    while _ORIGINALS:
+        owner, attribute, original = _ORIGINALS.pop()
+        setattr(owner, attribute, original)
+
+    return _ACTIVE.pop() if _ACTIVE else None
+
+
+def enabled():
+    """
+    Check if instrumentation is currently installed.
+    """
+    return bool(_ACTIVE)
+
+
+@contextmanager
+def collect_stats(stats=None):
+    """
+    Enable instrumentation for the duration of a with block, yielding the Stats
+    object being recorded into.  If instrumentation was already enabled, the
+    previous target is restored afterwards.
+    """
+    previous = _ACTIVE[0] if _ACTIVE else None
+    stats = enable(stats)
+    try:
+        yield stats
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
+
+
+def memory_footprint(iset):
+    """
+    Estimate the memory used by an IntegerSet, in bytes.  Return a dict with
+    the number of intervals, the bytes used by the Interval objects, by the
+    SortedList index (including the sort key objects), and the total.
+    """
+    seen = set()
+    interval_bytes = sum(_deep_sizeof(interval, seen) for interval in iset.intervals)
+    index_bytes = _deep_sizeof(iset.intervals, seen)
+
+    return {
+        "intervals": len(iset.intervals),
+        "interval_bytes": interval_bytes,
+        "index_bytes": index_bytes,
+        "total_bytes": sys.getsizeof(iset) + interval_bytes + index_bytes,
+    }
+
+
+def _wrap(original, name, timed):
+    """
+    Build a counting, and optionally timing, wrapper around original.
+    """
+    if inspect.isgeneratorfunction(original) or not timed:
+
+        @wraps(original)
+        def counting(*args, **kwargs):
+            _ACTIVE[0].calls[name] += 1
+            return original(*args, **kwargs)
+
+        return counting
+
+    @wraps(original)
+    def timing(*args, **kwargs):
+        stats = _ACTIVE[0]
+        stats.calls[name] += 1
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            stats.seconds[name] += time.perf_counter() - start
+
+    return timing
+
+
+def _deep_sizeof(obj, seen):
+    """
+    Sum the sizes of obj and the objects it references, skipping anything
+    already counted.  Classes and functions aren't followed.
+    """
+    if id(obj) in seen or isinstance(obj, (type, type(len), type(_deep_sizeof))):
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_sizeof(key, seen) + _deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _deep_sizeof(item, seen)
+    elif isinstance(obj, range):
+        size += _deep_sizeof(obj.start, seen) + _deep_sizeof(obj.stop, seen)
+
+    if hasattr(obj, "__dict__"):
+        size += _deep_sizeof(vars(obj), seen)
+
+    return size
+
+
+def _report_at_exit(stats):
+    print(stats.report(), file=sys.stderr)
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE):
+    atexit.register(_report_at_exit, enable())
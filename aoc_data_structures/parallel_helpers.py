@@ -0,0 +1,271 @@
+"""
+Opt-in parallel set algebra for very large IntegerSets and run arrays.
+
+The integer domain is partitioned at run boundaries into one shard per worker,
+each worker applies the run_helpers kernels to its shard of the inputs, and
+the shard results are stitched back together.  Inputs are copied once into a
+shared memory block, so workers only receive the block name and their slice
+indices.  Below the threshold the kernels run serially in-process, since
+starting workers costs far more than the operation.
+
+>>> with ShardPool(processes=8) as pool:
+...     runs = pool.union(load_runs("a.aocd"), load_runs("b.aocd"))
+...     count = pool.cardinality(runs)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from .data_structures.integer_set import IntegerSet
+from .run_helpers import (
+    OPERATIONS,
+    as_runs,
+    cardinality,
+    clip,
+    combine,
+    concatenate,
+    to_integer_set,
+)
+
+SERIAL_THRESHOLD = 1 << 18
+
+# candidate shard boundaries sampled per shard from each input
+_OVERSAMPLING = 8
+
+
+class ShardPool:
+    """
+    A pool of worker processes for sharded set operations.  Operations accept
+    IntegerSets or run arrays, and return the type of their first argument.
+    Converting between IntegerSets and run arrays is serial, so for the
+    largest inputs keep the data as run arrays (see run_helpers and
+    serialization_helpers.load_runs).
+
+    processes:  number of workers and shards, defaults to os.cpu_count()
+    threshold:  total number of input runs below which operations run serially
+    """
+
+    def __init__(self, processes=None, threshold=SERIAL_THRESHOLD):
+        self.processes = processes or os.cpu_count() or 1
+        self.threshold = threshold
+        self._executor = None
+
+    def __repr__(self):
+        return f"ShardPool(processes={self.processes}, threshold={self.threshold})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the worker processes.  The pool restarts them if it's used
+        again.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def union(self, set_0, set_1):
+        """
+        set_0 | set_1
+        """
+        return self.combine(set_0, set_1, "union")
+
+    def intersection(self, set_0, set_1):
+        """
+        set_0 & set_1
+        """
+        return self.combine(set_0, set_1, "intersection")
+
+    def difference(self, set_0, set_1):
+        """
+        set_0 - set_1
+        """
+        return self.combine(set_0, set_1, "difference")
+
+    def symmetric_difference(self, set_0, set_1):
+        """
+        set_0 ^ set_1
+        """
+        return self.combine(set_0, set_1, "symmetric_difference")
+
+    def combine(self, set_0, set_1, operation):
+        """
+        Apply a run_helpers.combine operation, sharded across the workers.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unsupported operation {operation!r}.")
+
+        runs_0, runs_1 = as_runs(set_0), as_runs(set_1)
+
+        if self._serial(len(runs_0) + len(runs_1)):
+            result = combine(runs_0, runs_1, operation)
+        else:
+            bounds = _shard_bounds(runs_0, runs_1, self.processes)
+            with _Shared(runs_0, runs_1) as name:
+                shards = self._map(
+                    _combine_shard,
+                    [
+                        (name, (len(runs_0), len(runs_1)), shard, operation)
+                        for shard in _shard_slices(runs_0, runs_1, bounds)
+                    ],
+                )
+            result = concatenate(shards)
+
+        return to_integer_set(result) if isinstance(set_0, IntegerSet) else result
+
+    def cardinality(self, iset):
+        """
+        Return the number of integers in an IntegerSet or run array.
+        """
+        runs = as_runs(iset)
+
+        if self._serial(len(runs)):
+            return cardinality(runs)
+
+        splits = _sample(len(runs) + 1, self.processes + 1)
+        with _Shared(runs) as name:
+            counts = self._map(
+                _cardinality_shard,
+                [
+                    (name, len(runs), start, end)
+                    for start, end in zip(splits[:-1].tolist(), splits[1:].tolist())
+                ],
+            )
+        return sum(counts)
+
+    def _serial(self, size):
+        """
+        Check if an operation on size runs should run in-process.
+        """
+        return self.processes == 1 or size < self.threshold
+
+    def _map(self, function, arguments):
+        """
+        Run function over the argument tuples in the workers.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.processes)
+        return list(self._executor.map(function, *zip(*arguments)))
+
+
+class _Shared:
+    """
+    Context manager copying run arrays into one shared memory block, yielding
+    the block name.  The block is unlinked on exit.
+    """
+
+    def __init__(self, *run_arrays):
+        self.run_arrays = run_arrays
+        self.memory = None
+
+    def __enter__(self):
+        size = sum(runs.nbytes for runs in self.run_arrays)
+        self.memory = SharedMemory(create=True, size=max(size, 1))
+        view = np.ndarray((size // 8,), dtype=np.int64, buffer=self.memory.buf)
+        view[:] = np.concatenate([runs.ravel() for runs in self.run_arrays])
+        del view
+        return self.memory.name
+
+    def __exit__(self, *_):
+        self.memory.close()
+        self.memory.unlink()
+
+
+def _shard_bounds(runs_0, runs_1, shards):
+    """
+    Choose shards - 1 run starts as shard boundaries, so each shard holds
+    roughly the same total number of runs of both inputs.  Candidates are
+    sampled from both inputs, and the ones closest to each target rank chosen.
+    """
+    candidates = np.unique(
+        np.concatenate(
+            [
+                np.empty(0, dtype=np.int64),
+                *(
+                    runs[_sample(len(runs), _OVERSAMPLING * shards), 0]
+                    for runs in (runs_0, runs_1)
+                    if len(runs)
+                ),
+            ]
+        )
+    )
+    if len(candidates) == 0:
+        return []
+
+    ranks = np.searchsorted(runs_0[:, 0], candidates) + np.searchsorted(
+        runs_1[:, 0], candidates
+    )
+    targets = np.arange(1, shards) * (len(runs_0) + len(runs_1)) / shards
+    chosen = np.abs(ranks[np.newaxis, :] - targets[:, np.newaxis]).argmin(axis=1)
+    return np.unique(candidates[chosen]).tolist()
+
+
+def _sample(size, count):
+    """
+    Return count evenly spaced indices into a sequence of size items.
+    """
+    return np.linspace(0, size - 1, count).astype(np.int64)
+
+
+def _shard_slices(runs_0, runs_1, bounds):
+    """
+    Yield (slice_0, slice_1, start, end) for each shard, where the slices
+    index the runs overlapping the inclusive shard range [start, end] and None
+    is unbounded.
+    """
+    starts = [None, *bounds]
+    ends = [bound - 1 for bound in bounds] + [None]
+
+    for start, end in zip(starts, ends):
+        yield (
+            _overlapping(runs_0, start, end),
+            _overlapping(runs_1, start, end),
+            start,
+            end,
+        )
+
+
+def _overlapping(runs, start, end):
+    """
+    Return the (first, last) indices of the runs overlapping [start, end].
+    """
+    first = 0 if start is None else int(np.searchsorted(runs[:, 1], start))
+    last = len(runs) if end is None else int(np.searchsorted(runs[:, 0], end, "right"))
+    return first, last
+
+
+def _combine_shard(name, sizes, shard, operation):
+    """
+    Worker: combine one shard of the shared run arrays.
+    """
+    slice_0, slice_1, start, end = shard
+    memory = SharedMemory(name)
+    try:
+        view = np.ndarray((sum(sizes), 2), dtype=np.int64, buffer=memory.buf)
+        runs_0 = clip(view[slice_0[0] : slice_0[1]], start, end)
+        runs_1 = clip(view[sizes[0] + slice_1[0] : sizes[0] + slice_1[1]], start, end)
+        del view
+    finally:
+        memory.close()
+
+    return combine(runs_0, runs_1, operation)
+
+
+def _cardinality_shard(name, size, start, end):
+    """
+    Worker: count the integers in one shard of a shared run array.
+    """
+    memory = SharedMemory(name)
+    try:
+        view = np.ndarray((size, 2), dtype=np.int64, buffer=memory.buf)
+        count = cardinality(view[start:end])
+        del view
+    finally:
+        memory.close()
+
+    return count
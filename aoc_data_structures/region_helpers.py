@@ -0,0 +1,205 @@
+"""
+Helpers for finding connected regions of equal symbols in 2-D grids.
+"""
+
+from collections import namedtuple
+import numpy as np
+from .data_structures import VectorTuple
+
+Region = namedtuple("Region", ["label", "symbol", "area", "perimeter", "bounds"])
+Region.__doc__ = """
+A connected region of equal symbols.  bounds is the inclusive bounding box as
+a pair of VectorTuples (mins, maxs), perimeter counts the cell edges shared
+with other regions or the edge of the grid.
+"""
+
+
+def label_components(grid, connectivity="orthogonal", background=None):
+    """
+    Label the connected regions of equal symbols in a 2-D grid.  Return
+    (labels, regions), where labels is an int array with each cell set to its
+    region's label (1, 2, ...) and regions is a list of Region tuples indexed by
+    label - 1.  Cells equal to background are labeled 0 and belong to no
+    region.
+
+    connectivity:  "orthogonal" joins cells sharing an edge, "full" also joins
+                   diagonal neighbors
+
+    Cells are grouped into horizontal runs with a vectorized scan of each row.
+    Runs are joined to the runs they touch in the next row with an array
+    backed union-find, so the Python-level work is proportional to the number
+    of runs rather than the number of cells.
+
+    ex input:
+    parse([
+        "AAB",
+        "ABB",
+        "CCB",
+    ])
+
+    returns labels:
+    [
+        [1, 1, 2],
+        [1, 2, 2],
+        [3, 3, 2],
+    ]
+    """
+    if connectivity not in ("orthogonal", "full"):
+        raise ValueError(f"Unsupported connectivity {connectivity!r}.")
+
+    grid = np.asarray(grid)
+    if grid.ndim != 2:
+        raise ValueError("label_components only supports 2-D grids.")
+
+    foreground = np.ones(grid.shape, dtype=bool)
+    if background is not None:
+        foreground = grid != background
+
+    run_ids, runs = _runs(grid)
+    parents = list(range(len(runs[0])))
+
+    for run_0, run_1 in _touching_runs(grid, foreground, run_ids, connectivity):
+        _union(parents, run_0, run_1)
+
+    roots = np.array([_find(parents, run) for run in range(len(parents))])
+    roots[~foreground.ravel()[runs[1]]] = -1
+    labels_by_root, run_labels = np.unique(roots, return_inverse=True)
+    run_labels = run_labels.ravel()
+
+    if len(labels_by_root) and labels_by_root[0] != -1:
+        run_labels += 1
+
+    labels = run_labels[run_ids]
+    return labels, _regions(grid, labels, runs, run_labels)
+
+
+def flood_fill(grid, start, connectivity="orthogonal"):
+    """
+    Return a boolean mask of the region of equal symbols containing start.
+    """
+    grid = np.asarray(grid)
+    mask = grid == grid[tuple(start)]
+    labels, _ = label_components(mask, connectivity, background=False)
+    return labels == labels[tuple(start)]
+
+
+def _runs(grid):
+    """
+    Split every row into runs of equal symbols.  Return (run_ids, runs), where
+    run_ids maps each cell to its run and runs is a tuple of arrays
+    (rows, flat start index, length).
+    """
+    starts = np.ones(grid.shape, dtype=bool)
+    starts[:, 1:] = grid[:, 1:] != grid[:, :-1]
+    run_ids = np.cumsum(starts.ravel()).reshape(grid.shape) - 1
+
+    flat_starts = np.flatnonzero(starts)
+    lengths = np.diff(np.append(flat_starts, grid.size))
+    rows = flat_starts // grid.shape[1] if grid.shape[1] else flat_starts
+    return run_ids, (rows, flat_starts, lengths)
+
+
+def _touching_runs(grid, foreground, run_ids, connectivity):
+    """
+    Return the unique pairs of runs in adjacent rows that share a symbol and
+    touch, given the connectivity.
+    """
+    shifts = [(slice(None), slice(None))]
+    if connectivity == "full":
+        shifts.append((slice(None, -1), slice(1, None)))
+        shifts.append((slice(1, None), slice(None, -1)))
+
+    pairs = [np.empty((0, 2), dtype=run_ids.dtype)]
+    for upper_columns, lower_columns in shifts:
+        upper = (slice(None, -1), upper_columns)
+        lower = (slice(1, None), lower_columns)
+        joined = (grid[upper] == grid[lower]) & foreground[upper] & foreground[lower]
+        pairs.append(np.stack((run_ids[upper][joined], run_ids[lower][joined]), 1))
+
+    return np.unique(np.concatenate(pairs), axis=0).tolist()
+
+
+def _find(parents, node):
+    """
+    Find the root of node, compressing the path along the way.
+    """
+    root = node
+    while parents[root] != root:
+        root = parents[root]
+
+    while parents[node] != root:
+        parents[node], node = root, parents[node]
+
+    return root
+
+
+def _union(parents, node_0, node_1):
+    """
+    Join the sets containing node_0 and node_1, rooted at the smaller root.
+    """
+    root_0 = _find(parents, node_0)
+    root_1 = _find(parents, node_1)
+    if root_0 != root_1:
+        parents[max(root_0, root_1)] = min(root_0, root_1)
+
+
+def _regions(grid, labels, runs, run_labels):
+    """
+    Compute the per-region statistics from the runs and the label array.
+    """
+    count = int(labels.max(initial=0))
+    foreground = run_labels > 0
+    run_labels = run_labels[foreground] - 1
+    rows, starts, lengths = (run_array[foreground] for run_array in runs)
+    columns = starts - rows * grid.shape[1]
+
+    areas = np.bincount(run_labels, weights=lengths, minlength=count)
+    mins, maxs = _bounds(count, run_labels, rows, columns, columns + lengths - 1)
+    perimeters = _perimeters(labels, count)
+
+    first_cells = np.zeros(count, dtype=np.int64)
+    first_cells[run_labels[::-1]] = starts[::-1]
+
+    return [
+        Region(
+            label + 1,
+            grid.flat[first_cells[label]].item(),
+            int(areas[label]),
+            int(perimeters[label + 1]),
+            (VectorTuple(mins[label].tolist()), VectorTuple(maxs[label].tolist())),
+        )
+        for label in range(count)
+    ]
+
+
+def _bounds(count, run_labels, rows, first_columns, last_columns):
+    """
+    Compute the inclusive bounding box of each region from its runs.
+    """
+    mins = np.full((count, 2), np.iinfo(np.int64).max)
+    maxs = np.full((count, 2), -1)
+    np.minimum.at(mins, (run_labels, 0), rows)
+    np.minimum.at(mins, (run_labels, 1), first_columns)
+    np.maximum.at(maxs, (run_labels, 0), rows)
+    np.maximum.at(maxs, (run_labels, 1), last_columns)
+    return mins, maxs
+
+
+def _perimeters(labels, count):
+    """
+    Count the edges of each label's cells that border a different label or the
+    edge of the grid.  Index 0 of the result is the background.
+    """
+    padded = np.pad(labels, 1, constant_values=0)
+    center = padded[1:-1, 1:-1]
+    perimeters = np.zeros(count + 1, dtype=np.int64)
+
+    for neighbor in (
+        padded[:-2, 1:-1],
+        padded[2:, 1:-1],
+        padded[1:-1, :-2],
+        padded[1:-1, 2:],
+    ):
+        perimeters += np.bincount(center[center != neighbor], minlength=count + 1)
+
+    return perimeters
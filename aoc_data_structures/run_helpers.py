@@ -0,0 +1,149 @@
+"""
+Vectorized set algebra on run arrays.  A run array is an (N, 2) int64 array of
+ascending, disjoint, non-adjacent inclusive (start, end) runs, the same
+representation IntegerSet.runs() returns and serialization_helpers stores.
+Working on run arrays avoids building an Interval object per run, so these
+kernels are suitable for sets with millions of runs.
+
+>>> combine(as_runs(IntegerSet((0, 10))), as_runs(IntegerSet((5, 20))), "intersection")
+array([[ 5, 10]])
+"""
+
+import numpy as np
+from .data_structures.integer_set import IntegerSet
+
+OPERATIONS = {
+    "union": np.logical_or,
+    "intersection": np.logical_and,
+    "difference": lambda inside_0, inside_1: inside_0 & ~inside_1,
+    "symmetric_difference": np.logical_xor,
+}
+
+
+def as_runs(iset):
+    """
+    Convert an IntegerSet to a run array.  Arrays are passed through
+    unchanged, other sequences of (start, end) pairs are converted without
+    validation.
+    """
+    if isinstance(iset, IntegerSet):
+        iset = iset.runs()
+    return np.asarray(iset, dtype=np.int64).reshape(-1, 2)
+
+
+def to_integer_set(runs):
+    """
+    Convert a run array to an IntegerSet.
+    """
+    return IntegerSet.from_runs(np.asarray(runs).tolist())
+
+
+def combine(runs_0, runs_1, operation="union"):
+    """
+    Apply a set operation to two run arrays, returning a new run array.
+
+    Every run start and end + 1 is a point where membership can change.  Each
+    input's membership is evaluated at every such point with two bisections,
+    the operation is applied to the membership flags, and the points where the
+    result changes become the output runs.  This is an O((n + m) log(n + m))
+    sweep with no Python-level loop.
+
+    operation:  "union", "intersection", "difference" or "symmetric_difference"
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unsupported operation {operation!r}.")
+
+    points = sorted_unique(
+        np.concatenate((runs_0[:, 0], runs_0[:, 1] + 1, runs_1[:, 0], runs_1[:, 1] + 1))
+    )
+    inside = OPERATIONS[operation](covered(runs_0, points), covered(runs_1, points))
+    return from_flags(points, inside)
+
+
+def covered(runs, values):
+    """
+    Return a boolean array, True where values are members of the run array.
+    """
+    started = np.searchsorted(runs[:, 0], values, side="right")
+    ended = np.searchsorted(runs[:, 1], values, side="left")
+    return started > ended
+
+
+def cardinality(runs):
+    """
+    Return the number of integers in a run array.
+    """
+    return int((runs[:, 1] - runs[:, 0] + 1).sum())
+
+
+def clip(runs, start=None, end=None):
+    """
+    Restrict a run array to the inclusive range [start, end], where None is
+    unbounded.  Only the runs overlapping the range are copied.
+    """
+    first = 0 if start is None else np.searchsorted(runs[:, 1], start, side="left")
+    last = len(runs) if end is None else np.searchsorted(runs[:, 0], end, side="right")
+    runs = runs[first:last].copy()
+
+    if len(runs) and start is not None:
+        runs[0, 0] = max(runs[0, 0], start)
+    if len(runs) and end is not None:
+        runs[-1, 1] = min(runs[-1, 1], end)
+
+    return runs
+
+
+def normalize(runs):
+    """
+    Sort a run array and merge its overlapping and adjacent runs.  Runs must
+    have start <= end.
+    """
+    runs = np.asarray(runs, dtype=np.int64).reshape(-1, 2)
+    if len(runs) < 2:
+        return runs
+
+    runs = runs[np.argsort(runs[:, 0], kind="stable")]
+    ends = np.maximum.accumulate(runs[:, 1])
+    first = np.ones(len(runs), dtype=bool)
+    first[1:] = runs[1:, 0] > ends[:-1] + 1
+    last = np.append(first[1:], True)
+    return np.stack((runs[first, 0], ends[last]), axis=1)
+
+
+def concatenate(run_arrays):
+    """
+    Join run arrays covering ascending, disjoint ranges, merging runs that
+    touch across the joins.
+    """
+    runs = np.concatenate([np.empty((0, 2), dtype=np.int64), *run_arrays])
+    if len(runs) < 2:
+        return runs
+
+    joined = runs[1:, 0] == runs[:-1, 1] + 1
+    if not joined.any():
+        return runs
+
+    starts = runs[np.append(True, ~joined), 0]
+    ends = runs[np.append(~joined, True), 1]
+    return np.stack((starts, ends), axis=1)
+
+
+def sorted_unique(values):
+    """
+    Sort and deduplicate values.  Faster than np.unique for large int arrays.
+    """
+    values = np.sort(values)
+    keep = np.ones(len(values), dtype=bool)
+    keep[1:] = values[1:] != values[:-1]
+    return values[keep]
+
+
+def from_flags(points, inside):
+    """
+    Convert membership flags, each holding from its point up to the next, to a
+    run array.  The final flag must be False.
+    """
+    changes = np.diff(inside.astype(np.int8), prepend=np.int8(0))
+    starts = points[changes == 1]
+    ends = points[changes == -1] - 1
+    return np.stack((starts, ends), axis=1)
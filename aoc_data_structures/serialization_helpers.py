@@ -0,0 +1,163 @@
+"""
+Compact, versioned binary serialization of IntegerSets and grids.
+
+Every file starts with a fixed header (magic, format version, kind), followed
+by a kind specific header and the payload, padded so the payload is 64 byte
+aligned.  IntegerSets are stored as an (N, 2) array of little endian int64
+(start, end) runs, and grids as their dtype, shape and raw C-order bytes.
+Payloads can be memory mapped, so large files open instantly and the pages
+are shared read-only between processes mapping the same file.
+
+>>> save("map.aocd", parse(lines, compact=True))
+>>> grid = load("map.aocd")  # read-only array backed by the page cache
+"""
+
+import mmap
+import struct
+import numpy as np
+from .data_structures.grid import Grid
+from .data_structures.integer_set import IntegerSet
+
+MAGIC = b"AOCD"
+VERSION = 1
+KIND_INTEGER_SET = 1
+KIND_GRID = 2
+
+_HEADER = struct.Struct("<4sHH")
+_INTEGER_SET_HEADER = struct.Struct("<Q")
+_GRID_HEADER = struct.Struct("<16sQ")
+_ALIGNMENT = 64
+_RUN_DTYPE = np.dtype("<i8")
+
+
+def save(path, obj):
+    """
+    Write an IntegerSet, Grid or numpy array to path.
+    """
+    with open(path, "wb") as file:
+        file.write(dumps(obj))
+
+
+def load(path, use_mmap=True):
+    """
+    Read an IntegerSet or grid array written by save.  Grids are returned as
+    numpy arrays.  If use_mmap is set, grid arrays are read-only and backed
+    directly by the page cache, otherwise the file is read into memory in one
+    call.
+    """
+    return loads(_read(path, use_mmap))
+
+
+def load_runs(path, use_mmap=True):
+    """
+    Read the (N, 2) int64 array of inclusive (start, end) runs of an IntegerSet
+    written by save, without building the IntegerSet.  With use_mmap set this
+    takes constant time regardless of the size of the set, and the runs can be
+    searched with np.searchsorted.
+    """
+    buffer = _read(path, use_mmap)
+    kind, offset = _read_header(buffer)
+    if kind != KIND_INTEGER_SET:
+        raise ValueError("File doesn't contain an IntegerSet.")
+    return _loads_runs(buffer, offset)
+
+
+def dumps(obj):
+    """
+    Serialize an IntegerSet, Grid or numpy array to bytes.
+    """
+    if isinstance(obj, IntegerSet):
+        runs = np.array(obj.runs(), dtype=_RUN_DTYPE).reshape(-1, 2)
+        header = _INTEGER_SET_HEADER.pack(len(runs))
+        return _pack(KIND_INTEGER_SET, header, runs.tobytes())
+
+    array = obj.array if isinstance(obj, Grid) else np.asarray(obj)
+    if array.dtype.hasobject:
+        raise ValueError("Object arrays can't be serialized.")
+
+    dtype = array.dtype.str.encode("ascii")
+    if len(dtype) > _GRID_HEADER.size - 8:
+        raise ValueError(f"Unsupported dtype {array.dtype}.")
+
+    header = _GRID_HEADER.pack(dtype, array.ndim)
+    header += struct.pack(f"<{array.ndim}Q", *array.shape)
+    return _pack(KIND_GRID, header, np.ascontiguousarray(array).tobytes())
+
+
+def loads(buffer):
+    """
+    Deserialize bytes (or any buffer, such as an mmap) produced by dumps.
+    Grid arrays share memory with the buffer.
+    """
+    kind, offset = _read_header(buffer)
+
+    if kind == KIND_INTEGER_SET:
+        return IntegerSet.from_runs(_loads_runs(buffer, offset).tolist())
+
+    dtype, ndim = _GRID_HEADER.unpack_from(buffer, offset)
+    offset += _GRID_HEADER.size
+    shape = struct.unpack_from(f"<{ndim}Q", buffer, offset)
+    offset = _aligned(offset + 8 * ndim)
+    dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+    count = int(np.prod(shape, dtype=np.int64))
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return array.reshape(shape)
+
+
+def _pack(kind, header, payload):
+    """
+    Join the common header, the kind specific header, alignment padding and the
+    payload.
+    """
+    data = _HEADER.pack(MAGIC, VERSION, kind) + header
+    return data + bytes(_aligned(len(data)) - len(data)) + payload
+
+
+def _read(path, use_mmap):
+    """
+    Return the contents of path as an mmap or bytes.
+    """
+    with open(path, "rb") as file:
+        if use_mmap:
+            try:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                return b""
+        return file.read()
+
+
+def _read_header(buffer):
+    """
+    Validate the common header.  Return (kind, offset of the kind specific
+    header).
+    """
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Truncated file.")
+
+    magic, version, kind = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not an aoc_data_structures file.")
+    if version > VERSION:
+        raise ValueError(f"Unsupported format version {version}.")
+    if kind not in (KIND_INTEGER_SET, KIND_GRID):
+        raise ValueError(f"Unsupported kind {kind}.")
+
+    return kind, _HEADER.size
+
+
+def _loads_runs(buffer, offset):
+    """
+    Return the runs array of a serialized IntegerSet.
+    """
+    (count,) = _INTEGER_SET_HEADER.unpack_from(buffer, offset)
+    offset = _aligned(offset + _INTEGER_SET_HEADER.size)
+    runs = np.frombuffer(buffer, dtype=_RUN_DTYPE, count=2 * count, offset=offset)
+    return runs.reshape(count, 2)
+
+
+def _aligned(offset):
+    """
+    Round offset up to the payload alignment.
+    """
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
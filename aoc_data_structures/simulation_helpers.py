@@ -0,0 +1,108 @@
+"""
+Helpers for running deterministic simulations, such as grids evolved by a
+step function, for a large number of iterations.
+"""
+
+import numpy as np
+from .grid_helpers import hash_array
+
+
+def find_cycle(step, initial, fingerprint=hash_array):
+    """
+    Find the cycle reached by repeatedly applying step to initial.  Return a
+    tuple (offset, period), where offset is the number of steps before the first
+    state of the cycle and period is the length of the cycle.
+
+    Brent's algorithm is used, so only two states are held at a time regardless
+    of the length of the cycle.  Fingerprints are compared first, and equal
+    fingerprints are verified by comparing the states themselves.
+
+    step must return a new state rather than modifying its argument.
+
+    >>> find_cycle(lambda x: (x * x + 1) % 255, 3, hash)
+    (2, 6)
+    """
+    offset, period, _ = _brent(step, initial, fingerprint)
+    return offset, period
+
+
+def simulate(step, initial, iterations, fingerprint=hash_array):
+    """
+    Return the state after applying step to initial the given number of times.
+    Once a cycle is detected, the remaining iterations are skipped by jumping
+    ahead a whole number of periods.
+
+    step must return a new state rather than modifying its argument.
+    """
+    if iterations == 0:
+        return initial
+
+    offset, period, state = _brent(step, initial, fingerprint, iterations)
+
+    if period is None:
+        return state
+
+    for _ in range((iterations - offset) % period):
+        state = step(state)
+
+    return state
+
+
+def _brent(step, initial, fingerprint, limit=None):
+    """
+    Run Brent's cycle detection.  Return (offset, period, first cycle state).
+    If limit is reached before the cycle is found, return
+    (None, None, state at limit).
+
+    States are carried as (state, fingerprint) pairs so each fingerprint is only
+    computed once.
+    """
+    power = period = 1
+    tortoise = _fingerprinted(initial, fingerprint)
+    hare = _fingerprinted(step(initial), fingerprint)
+    index = 1
+
+    while not _same(tortoise, hare):
+        if limit is not None and index == limit:
+            return None, None, hare[0]
+
+        if power == period:
+            tortoise = hare
+            power *= 2
+            period = 0
+
+        hare = _fingerprinted(step(hare[0]), fingerprint)
+        period += 1
+        index += 1
+
+    tortoise = hare = _fingerprinted(initial, fingerprint)
+    for _ in range(period):
+        hare = _fingerprinted(step(hare[0]), fingerprint)
+
+    offset = 0
+    while not _same(tortoise, hare):
+        tortoise = _fingerprinted(step(tortoise[0]), fingerprint)
+        hare = _fingerprinted(step(hare[0]), fingerprint)
+        offset += 1
+
+    return offset, period, tortoise[0]
+
+
+def _fingerprinted(state, fingerprint):
+    return state, fingerprint(state)
+
+
+def _same(pair_0, pair_1):
+    """
+    Compare the cheap fingerprints first, and only verify the states themselves
+    on a match.
+    """
+    (state_0, fingerprint_0), (state_1, fingerprint_1) = pair_0, pair_1
+
+    if fingerprint_0 != fingerprint_1:
+        return False
+
+    if isinstance(state_0, np.ndarray):
+        return np.array_equal(state_0, state_1)
+
+    return state_0 == state_1
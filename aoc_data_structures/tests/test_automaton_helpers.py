@@ -0,0 +1,119 @@
+"""
+Test the cellular automaton helpers.
+"""
+
+import unittest
+from itertools import product
+import numpy as np
+from ..automaton_helpers import neighbor_counts, parse_rule, step
+from ..data_structures import VectorTuple
+
+
+def _brute_force_counts(grid, neighborhood):
+    counts = np.zeros(grid.shape, dtype=int)
+    for pos in product(*(range(size) for size in grid.shape)):
+        pos = VectorTuple(*pos)
+        if neighborhood == "full":
+            neighbors = pos.adjacencies(grid)
+        else:
+            neighbors = pos.orthogonals(grid)
+        counts[pos] = sum(grid[neighbor] for neighbor in neighbors)
+    return counts
+
+
+class TestParseRule(unittest.TestCase):
+    """
+    Test rule parsing.
+    """
+
+    def test_notation(self):
+        """
+        Test B/S notation.
+        """
+        self.assertEqual(parse_rule("B3/S23"), ({3}, {2, 3}))
+        self.assertEqual(parse_rule("s23/b36"), ({3, 6}, {2, 3}))
+
+    def test_pair(self):
+        """
+        Test (birth, survive) pairs.
+        """
+        self.assertEqual(parse_rule(([1], [])), ({1}, set()))
+
+    def test_invalid(self):
+        """
+        Test invalid notation.
+        """
+        with self.assertRaises(ValueError):
+            parse_rule("X3/S23")
+
+
+class TestNeighborCounts(unittest.TestCase):
+    """
+    Test neighbor counting against VectorTuple adjacencies.
+    """
+
+    def test_dimensions(self):
+        """
+        Test both neighborhoods in 2 to 4 dimensions.
+        """
+        rng = np.random.default_rng(0)
+        for shape in ((6, 7), (4, 5, 3), (3, 3, 4, 3)):
+            grid = rng.random(shape) < 0.4
+            for neighborhood in ("full", "orthogonal"):
+                np.testing.assert_array_equal(
+                    neighbor_counts(grid, neighborhood),
+                    _brute_force_counts(grid, neighborhood),
+                )
+
+    def test_invalid(self):
+        """
+        Test an unsupported neighborhood.
+        """
+        with self.assertRaises(ValueError):
+            neighbor_counts(np.zeros((2, 2), dtype=bool), "hexagonal")
+
+
+class TestStep(unittest.TestCase):
+    """
+    Test stepping generations.
+    """
+
+    def test_blinker(self):
+        """
+        Test a period 2 oscillator.
+        """
+        blinker = np.zeros((5, 5), dtype=bool)
+        blinker[2, 1:4] = True
+        np.testing.assert_array_equal(step(step(blinker)), blinker)
+        np.testing.assert_array_equal(step(blinker), blinker.T)
+
+    def test_grow(self):
+        """
+        Test a glider isn't clipped when the grid grows.
+        """
+        glider = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=bool)
+        grid = glider
+        for _ in range(8):
+            grid = step(grid, grow=True)
+        self.assertEqual(grid.sum(), 5)
+
+    def test_no_grow(self):
+        """
+        Test a glider is clipped by a fixed grid.
+        """
+        glider = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=bool)
+        grid = glider
+        for _ in range(8):
+            grid = step(grid)
+        self.assertEqual(grid.shape, (3, 3))
+        self.assertLess(grid.sum(), 5)
+
+    def test_three_dimensions(self):
+        """
+        Test a 3-d orthogonal rule.
+        """
+        grid = np.zeros((3, 3, 3), dtype=bool)
+        grid[1, 1, 1] = True
+        result = step(grid, ([1], []), neighborhood="orthogonal")
+        self.assertEqual(result.sum(), 6)
+        self.assertFalse(result[1, 1, 1])
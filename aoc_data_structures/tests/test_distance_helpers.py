@@ -0,0 +1,127 @@
+"""
+Test the batched distance kernels.
+"""
+
+import unittest
+from itertools import product
+import numpy as np
+from ..data_structures import VectorTuple
+from ..distance_helpers import as_points, distances_to, pairwise_distances
+
+
+class TestDistancesTo(unittest.TestCase):
+    """
+    Test the distances_to function.
+    """
+
+    def test_manhattan(self):
+        """
+        Test agreement with VectorTuple.manhattan.
+        """
+        point = VectorTuple(1, -2)
+        points = [VectorTuple(0, 0), VectorTuple(5, 5), VectorTuple(-3, 4)]
+        np.testing.assert_array_equal(
+            distances_to(point, points),
+            [(point - other).manhattan() for other in points],
+        )
+
+    def test_chebyshev(self):
+        """
+        Test the chebyshev metric.
+        """
+        np.testing.assert_array_equal(
+            distances_to((0, 0), [(1, 2), (-3, 0)], metric="chebyshev"),
+            [2, 3],
+        )
+
+    def test_invalid_metric(self):
+        """
+        Test an unsupported metric.
+        """
+        with self.assertRaises(ValueError):
+            distances_to((0, 0), [(1, 2)], metric="cosine")
+
+
+class TestPairwiseDistances(unittest.TestCase):
+    """
+    Test the pairwise_distances function.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = [VectorTuple(point) for point in rng.integers(-50, 50, (37, 3))]
+
+    def test_manhattan(self):
+        """
+        Test agreement with VectorTuple.manhattan for every pair.
+        """
+        result = pairwise_distances(self.points, block_size=5)
+        for i, j in product(range(len(self.points)), repeat=2):
+            self.assertEqual(
+                result[i, j], (self.points[i] - self.points[j]).manhattan()
+            )
+
+    def test_block_size(self):
+        """
+        Test block-wise evaluation doesn't change the result.
+        """
+        for metric in ("manhattan", "chebyshev", "sqeuclidean"):
+            np.testing.assert_array_equal(
+                pairwise_distances(self.points, metric, block_size=4),
+                pairwise_distances(self.points, metric, block_size=1000),
+            )
+
+    def test_sqeuclidean(self):
+        """
+        Test the squared euclidean metric.
+        """
+        np.testing.assert_array_equal(
+            pairwise_distances([(0, 0)], "sqeuclidean", others=[(3, 4), (1, 1)]),
+            [[25, 2]],
+        )
+
+    def test_array_input(self):
+        """
+        Test (N, d) arrays are accepted.
+        """
+        array = np.array(self.points)
+        np.testing.assert_array_equal(
+            pairwise_distances(array),
+            pairwise_distances(self.points),
+        )
+
+    def test_rectangular_blocks(self):
+        """
+        Test tiling when others is longer than a block.
+        """
+        others = self.points[:11]
+        np.testing.assert_array_equal(
+            pairwise_distances(self.points[:3], others=others, block_size=2),
+            pairwise_distances(self.points[:3], others=others, block_size=1000),
+        )
+
+    def test_unsigned(self):
+        """
+        Test unsigned inputs don't wrap around.
+        """
+        points = np.array([[0], [5]], dtype=np.uint8)
+        np.testing.assert_array_equal(pairwise_distances(points), [[0, 5], [5, 0]])
+        np.testing.assert_array_equal(distances_to(np.uint8(5), points), [5, 0])
+
+    def test_large_unsigned(self):
+        """
+        Test uint64 coordinates stay exact, and out of range ones are rejected.
+        """
+        points = np.array([[2**60 + 1], [2**60]], dtype=np.uint64)
+        result = pairwise_distances(points)
+        self.assertEqual(result.dtype, np.int64)
+        np.testing.assert_array_equal(result, [[0, 1], [1, 0]])
+        with self.assertRaises(ValueError):
+            pairwise_distances(np.array([[2**63]], dtype=np.uint64))
+
+    def test_signed_unchanged(self):
+        """
+        Test signed arrays aren't copied or promoted.
+        """
+        points = np.array([[0, 1], [2, 3]], dtype=np.int16)
+        self.assertIs(as_points(points), points)
@@ -0,0 +1,333 @@
+"""
+Test the grid helpers.
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from ..grid_helpers import (
+    decode_grid,
+    digest_array,
+    distance_field,
+    encode_grid,
+    expand_grid,
+    grid_str,
+    hash_array,
+    parse,
+    parse_bytes,
+    parse_file,
+    symbol_code,
+    symbol_mask,
+    translate,
+)
+
+
+class TestDistanceField(unittest.TestCase):
+    """
+    Test the distance_field function.
+    """
+
+    def test_manhattan(self):
+        """
+        Test orthogonal expansion around a wall.
+        """
+        grid = parse(["S..", ".#.", "..."])
+        np.testing.assert_array_equal(
+            distance_field(grid, "S", ".S"),
+            [[0, 1, 2], [1, -1, 3], [2, 3, 4]],
+        )
+
+    def test_chebyshev(self):
+        """
+        Test diagonal expansion.
+        """
+        grid = parse(["...", "...", "..."])
+        np.testing.assert_array_equal(
+            distance_field(grid, [(2, 2)], metric="chebyshev"),
+            [[2, 2, 2], [2, 1, 1], [2, 1, 0]],
+        )
+
+    def test_multiple_sources(self):
+        """
+        Test distance to the nearest of several sources.
+        """
+        grid = parse(["S...S"])
+        np.testing.assert_array_equal(
+            distance_field(grid, grid == "S"),
+            [[0, 1, 2, 1, 0]],
+        )
+
+    def test_unreachable(self):
+        """
+        Test cells walled off from every source.
+        """
+        grid = parse(["S#."])
+        np.testing.assert_array_equal(
+            distance_field(grid, "S", "S."),
+            [[0, -1, -1]],
+        )
+
+    def test_three_dimensions(self):
+        """
+        Test expansion in more than two dimensions.
+        """
+        grid = np.zeros((3, 3, 3), dtype=bool)
+        distances = distance_field(grid, [(0, 0, 0)])
+        self.assertEqual(distances[2, 2, 2], 6)
+
+    def test_invalid_metric(self):
+        """
+        Test an unsupported metric.
+        """
+        with self.assertRaises(ValueError):
+            distance_field(parse(["S"]), "S", metric="euclidean")
+
+
+class TestParseBytes(unittest.TestCase):
+    """
+    Test the parse_bytes function.
+    """
+
+    def test_trailing_newline(self):
+        """
+        Test a buffer ending with a newline.
+        """
+        grid = parse_bytes(b"#.#\n.#.\n")
+        self.assertEqual(grid.dtype, np.uint8)
+        np.testing.assert_array_equal(grid, parse(["#.#", ".#."]).view(np.int32))
+
+    def test_no_trailing_newline(self):
+        """
+        Test a buffer without a final newline.
+        """
+        np.testing.assert_array_equal(
+            parse_bytes(b"#.#\n.#."),
+            parse_bytes(b"#.#\n.#.\n"),
+        )
+
+    def test_crlf(self):
+        """
+        Test windows line endings.
+        """
+        np.testing.assert_array_equal(
+            parse_bytes(b"#.#\r\n.#.\r\n"),
+            parse_bytes(b"#.#\n.#.\n"),
+        )
+
+    def test_single_line(self):
+        """
+        Test a buffer without any newline.
+        """
+        self.assertEqual(parse_bytes(b"abc").shape, (1, 3))
+
+    def test_empty(self):
+        """
+        Test an empty buffer.
+        """
+        self.assertEqual(parse_bytes(b"").shape, (0, 0))
+
+    def test_ragged(self):
+        """
+        Test lines of differing lengths are rejected.
+        """
+        for buffer in (b"ab\nabc\n", b"ab\nc\n", b"ab\n\nb\n"):
+            with self.assertRaises(ValueError):
+                parse_bytes(buffer)
+
+    def test_zero_copy(self):
+        """
+        Test the result is a view of the buffer.
+        """
+        buffer = bytearray(b"ab\ncd\n")
+        grid = parse_bytes(buffer)
+        buffer[3] = ord("x")
+        self.assertEqual(grid[1, 0], ord("x"))
+
+
+class TestParseFile(unittest.TestCase):
+    """
+    Test the parse_file function.
+    """
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile("wb", delete=False) as file:
+            file.write(b"#..\n.#.\n..#\n")
+        self.path = file.name
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_mmap(self):
+        """
+        Test parsing a memory mapped file.
+        """
+        grid = parse_file(self.path)
+        np.testing.assert_array_equal(grid == ord("#"), np.eye(3, dtype=bool))
+
+    def test_read(self):
+        """
+        Test parsing a file read into memory.
+        """
+        np.testing.assert_array_equal(
+            parse_file(self.path, use_mmap=False),
+            parse_file(self.path),
+        )
+
+    def test_empty(self):
+        """
+        Test parsing an empty file.
+        """
+        with open(self.path, "wb"):
+            pass
+        self.assertEqual(parse_file(self.path).shape, (0, 0))
+
+
+class TestCompactGrids(unittest.TestCase):
+    """
+    Test the helpers with compact uint8 grids.
+    """
+
+    def setUp(self):
+        self.lines = ["#..", ".#.", "..#"]
+        self.grid = parse(self.lines, compact=True)
+
+    def test_parse(self):
+        """
+        Test compact parsing produces a writeable uint8 grid.
+        """
+        self.assertEqual(self.grid.dtype, np.uint8)
+        self.assertTrue(self.grid.flags.writeable)
+        np.testing.assert_array_equal(self.grid, parse_bytes(b"#..\n.#.\n..#"))
+
+    def test_round_trip(self):
+        """
+        Test conversion between compact and unicode grids.
+        """
+        np.testing.assert_array_equal(decode_grid(self.grid), parse(self.lines))
+        np.testing.assert_array_equal(encode_grid(parse(self.lines)), self.grid)
+
+    def test_grid_str(self):
+        """
+        Test rendering matches the unicode grid.
+        """
+        self.assertEqual(grid_str(self.grid), "\n".join(self.lines))
+        self.assertEqual(grid_str(self.grid), grid_str(parse(self.lines)))
+
+    def test_expand_grid(self):
+        """
+        Test expansion preserves the dtype.
+        """
+        expanded = expand_grid(self.grid)
+        self.assertEqual(expanded.dtype, np.uint8)
+        self.assertEqual(grid_str(expanded), grid_str(expand_grid(parse(self.lines))))
+
+    def test_hash_array(self):
+        """
+        Test hashing follows grid contents.
+        """
+        copy = self.grid.copy()
+        self.assertEqual(hash_array(copy), hash_array(self.grid))
+        copy[0, 0] = ord(".")
+        self.assertNotEqual(hash_array(copy), hash_array(self.grid))
+
+    def test_translate(self):
+        """
+        Test translation through a lookup table.
+        """
+        np.testing.assert_array_equal(
+            translate(self.grid, {"#": 1, ".": 0}),
+            np.eye(3),
+        )
+        np.testing.assert_array_equal(
+            translate(parse(self.lines), {"#": 7}, default=-1),
+            np.where(np.eye(3), 7, -1),
+        )
+
+    def test_distance_field(self):
+        """
+        Test symbol selectors on compact grids.
+        """
+        np.testing.assert_array_equal(
+            distance_field(self.grid, "#", "."),
+            distance_field(parse(self.lines), "#", "."),
+        )
+
+
+class TestSymbols(unittest.TestCase):
+    """
+    Test the symbol conversion helpers shared with the other grid modules.
+    """
+
+    def test_symbol_code(self):
+        """
+        Test characters, bytes and codes convert to ASCII codes.
+        """
+        self.assertEqual(symbol_code("#"), 35)
+        self.assertEqual(symbol_code(b"#"), 35)
+        self.assertEqual(symbol_code(np.uint8(35)), 35)
+
+    def test_symbol_mask(self):
+        """
+        Test masks from symbols match for str and compact grids.
+        """
+        lines = ["#.O", ".#.", "O.#"]
+        for grid in (parse(lines), parse(lines, compact=True)):
+            np.testing.assert_array_equal(symbol_mask(grid, "#O"), parse(lines) != ".")
+            np.testing.assert_array_equal(symbol_mask(grid, "."), parse(lines) == ".")
+        with self.assertRaises(ValueError):
+            symbol_mask(parse(lines), np.zeros((2, 2), dtype=bool))
+
+
+class TestHashArray(unittest.TestCase):
+    """
+    Test the hash_array and digest_array functions.
+    """
+
+    def test_numeric(self):
+        """
+        Test hashing numeric dtypes.
+        """
+        array = np.arange(12, dtype=np.float64).reshape(3, 4)
+        self.assertEqual(hash_array(array), hash_array(array.copy()))
+        self.assertNotEqual(hash_array(array), hash_array(array + 1))
+
+    def test_shape(self):
+        """
+        Test arrays with the same buffer but different shapes hash differently.
+        """
+        array = np.arange(12)
+        self.assertNotEqual(hash_array(array), hash_array(array.reshape(3, 4)))
+        self.assertNotEqual(digest_array(array), digest_array(array.reshape(3, 4)))
+
+    def test_dtype(self):
+        """
+        Test arrays with the same values but different dtypes hash differently.
+        """
+        array = np.zeros(4, dtype=np.int32)
+        self.assertNotEqual(hash_array(array), hash_array(array.view(np.float32)))
+
+    def test_unicode(self):
+        """
+        Test hashing unicode grids.
+        """
+        grid = parse(["#.", ".#"])
+        self.assertEqual(hash_array(grid), hash_array(parse(["#.", ".#"])))
+        self.assertNotEqual(hash_array(grid), hash_array(parse(["#.", "##"])))
+
+    def test_digest_stable(self):
+        """
+        Test digests are stable values of the requested size.
+        """
+        grid = parse(["#.", ".#"], compact=True)
+        self.assertEqual(digest_array(grid), digest_array(grid.copy()))
+        self.assertLess(digest_array(grid), 1 << 64)
+        self.assertGreaterEqual(digest_array(grid, bits=128), 0)
+        self.assertEqual(digest_array(grid.T), digest_array(grid.T.copy()))
+
+    def test_digest_bits(self):
+        """
+        Test unsupported digest sizes.
+        """
+        with self.assertRaises(ValueError):
+            digest_array(np.zeros(1), bits=32)
@@ -0,0 +1,71 @@
+"""
+Test the lazy package imports.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import aoc_data_structures
+
+
+def _imported_modules(code):
+    """
+    Run code in a fresh interpreter and return the modules it imported.
+    """
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    """
+    Test dependencies are only imported when needed.
+    """
+
+    def test_interval(self):
+        """
+        Test importing Interval doesn't import numpy or sortedcontainers.
+        """
+        modules = _imported_modules("from aoc_data_structures import Interval")
+        self.assertNotIn("numpy", modules)
+        self.assertNotIn("sortedcontainers", modules)
+        self.assertNotIn("aoc_data_structures.data_structures.integer_set", modules)
+
+    def test_vector_tuple(self):
+        """
+        Test VectorTuple works without numpy.
+        """
+        modules = _imported_modules(
+            "from aoc_data_structures import VectorTuple\n"
+            "assert len(list(VectorTuple(1, 1).orthogonals((3, 3)))) == 4"
+        )
+        self.assertNotIn("numpy", modules)
+
+    def test_integer_set(self):
+        """
+        Test importing IntegerSet doesn't import numpy.
+        """
+        modules = _imported_modules("from aoc_data_structures import IntegerSet")
+        self.assertIn("sortedcontainers", modules)
+        self.assertNotIn("numpy", modules)
+
+    def test_attributes(self):
+        """
+        Test every export resolves, and unknown names raise AttributeError.
+        """
+        for name in aoc_data_structures.__all__:
+            self.assertIs(
+                getattr(aoc_data_structures, name),
+                getattr(aoc_data_structures.data_structures, name),
+            )
+        self.assertIn("IntegerSet", dir(aoc_data_structures))
+        with self.assertRaises(AttributeError):
+            getattr(aoc_data_structures, "Missing")
+        with self.assertRaises(AttributeError):
+            getattr(aoc_data_structures.data_structures, "Missing")
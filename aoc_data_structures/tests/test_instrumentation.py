@@ -0,0 +1,112 @@
+"""
+Test the instrumentation module.
+"""
+
+import unittest
+from ..data_structures import IntegerSet, Interval
+from ..instrumentation import (
+    Stats,
+    collect_stats,
+    disable,
+    enable,
+    enabled,
+    memory_footprint,
+)
+
+
+class TestCollectStats(unittest.TestCase):
+    """
+    Test the collect_stats context manager.
+    """
+
+    def test_counts(self):
+        """
+        Test operations are counted.
+        """
+        set_0 = IntegerSet((0, 10), (20, 30))
+        set_1 = IntegerSet((5, 25))
+        with collect_stats() as stats:
+            _ = set_0 | set_1
+            _ = 5 in set_0
+
+        self.assertEqual(stats.calls["IntegerSet.union"], 1)
+        self.assertEqual(stats.calls["IntegerSet.__contains__"], 1)
+        self.assertEqual(stats.calls["deepcopy"], 1)
+        self.assertGreater(stats.calls["Interval allocations"], 0)
+        self.assertGreater(stats.calls["SortedList bisects"], 0)
+        self.assertGreater(stats.calls["IntegerSet._generate_overlaps"], 0)
+        self.assertGreaterEqual(stats.seconds["IntegerSet.union"], 0)
+        self.assertIn("IntegerSet.union", stats.report())
+
+    def test_results_unchanged(self):
+        """
+        Test instrumented operations return the same results.
+        """
+        set_0 = IntegerSet((0, 10), (20, 30))
+        set_1 = IntegerSet((5, 25))
+        expected = (set_0 | set_1, set_0 & set_1, set_0 - set_1, set_0 ^ set_1)
+        with collect_stats():
+            result = (set_0 | set_1, set_0 & set_1, set_0 - set_1, set_0 ^ set_1)
+        self.assertEqual(result, expected)
+
+    def test_restored(self):
+        """
+        Test the original methods are restored afterwards.
+        """
+        originals = (IntegerSet.union, Interval.__init__, IntegerSet.__contains__)
+        with collect_stats():
+            self.assertTrue(enabled())
+            self.assertIsNot(IntegerSet.union, originals[0])
+        self.assertFalse(enabled())
+        self.assertEqual(
+            (IntegerSet.union, Interval.__init__, IntegerSet.__contains__),
+            originals,
+        )
+
+    def test_nested(self):
+        """
+        Test nested blocks record separately.
+        """
+        with collect_stats() as outer:
+            IntegerSet((0, 1))
+            with collect_stats() as inner:
+                IntegerSet((0, 1))
+            IntegerSet((0, 1))
+        self.assertEqual(outer.calls["IntegerSet.__init__"], 2)
+        self.assertEqual(inner.calls["IntegerSet.__init__"], 1)
+        self.assertFalse(enabled())
+
+    def test_enable_disable(self):
+        """
+        Test the explicit switch.
+        """
+        stats = Stats()
+        self.assertIs(enable(stats), stats)
+        try:
+            IntegerSet((0, 1))
+        finally:
+            self.assertIs(disable(), stats)
+        self.assertEqual(stats.calls["IntegerSet.__init__"], 1)
+        stats.clear()
+        self.assertEqual(stats.calls["IntegerSet.__init__"], 0)
+        self.assertIsNone(disable())
+
+
+class TestMemoryFootprint(unittest.TestCase):
+    """
+    Test the memory_footprint function.
+    """
+
+    def test_grows(self):
+        """
+        Test the footprint grows with the number of intervals.
+        """
+        small = memory_footprint(IntegerSet((0, 1)))
+        large = memory_footprint(IntegerSet(*((i * 3, i * 3 + 1) for i in range(100))))
+        self.assertEqual(small["intervals"], 1)
+        self.assertEqual(large["intervals"], 100)
+        self.assertGreater(large["interval_bytes"], 50 * small["interval_bytes"])
+        self.assertGreater(
+            large["total_bytes"],
+            large["interval_bytes"] + large["index_bytes"],
+        )
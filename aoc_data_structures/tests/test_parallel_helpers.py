@@ -0,0 +1,83 @@
+"""
+Test the sharded parallel set operations.
+"""
+
+import unittest
+from ..data_structures import IntegerSet
+from ..parallel_helpers import ShardPool
+from ..run_helpers import OPERATIONS, as_runs, combine
+from .test_run_helpers import random_set
+
+
+class TestShardPool(unittest.TestCase):
+    """
+    Test ShardPool against the serial kernels.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ShardPool(processes=3, threshold=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_combine(self):
+        """
+        Test every operation matches the serial result, with runs crossing
+        shard boundaries.
+        """
+        for seed in range(3):
+            runs_0 = as_runs(random_set(seed, count=300, span=1000))
+            runs_1 = as_runs(random_set(seed + 100, count=300, span=1000))
+            for operation in OPERATIONS:
+                self.assertEqual(
+                    self.pool.combine(runs_0, runs_1, operation).tolist(),
+                    combine(runs_0, runs_1, operation).tolist(),
+                )
+
+    def test_integer_sets(self):
+        """
+        Test IntegerSet inputs return IntegerSets.
+        """
+        set_0, set_1 = random_set(0), random_set(1)
+        for result, expected in (
+            (self.pool.union(set_0, set_1), set_0 | set_1),
+            (self.pool.intersection(set_0, set_1), set_0 & set_1),
+            (self.pool.difference(set_0, set_1), set_0 - set_1),
+            (self.pool.symmetric_difference(set_0, set_1), set_0 ^ set_1),
+        ):
+            self.assertIsInstance(result, IntegerSet)
+            self.assertEqual(result, expected)
+
+    def test_empty(self):
+        """
+        Test empty inputs.
+        """
+        self.assertEqual(self.pool.union(IntegerSet(), IntegerSet()), IntegerSet())
+        self.assertEqual(self.pool.cardinality(IntegerSet()), 0)
+        iset = IntegerSet((0, 10))
+        self.assertEqual(self.pool.difference(iset, IntegerSet()), iset)
+
+    def test_cardinality(self):
+        """
+        Test cardinality matches len().
+        """
+        iset = random_set(0, count=300, span=1000)
+        self.assertEqual(self.pool.cardinality(iset), len(iset))
+
+    def test_serial(self):
+        """
+        Test small inputs are combined without starting workers.
+        """
+        with ShardPool(processes=3) as pool:
+            result = pool.union(random_set(0), random_set(1))
+            self.assertIsNone(pool._executor)  # pylint: disable=protected-access
+        self.assertEqual(result, random_set(0) | random_set(1))
+
+    def test_operation(self):
+        """
+        Test unknown operations are rejected.
+        """
+        with self.assertRaises(ValueError):
+            self.pool.combine(IntegerSet(), IntegerSet(), "product")
@@ -0,0 +1,124 @@
+"""
+Test the region helpers.
+"""
+
+import unittest
+from collections import deque
+import numpy as np
+from ..data_structures import VectorTuple
+from ..grid_helpers import parse
+from ..region_helpers import flood_fill, label_components
+
+
+def _brute_force_regions(grid, diagonals):
+    """
+    Find regions with a per-cell BFS over VectorTuple neighbors.
+    """
+    seen = set()
+    regions = []
+    for start in np.ndindex(grid.shape):
+        start = VectorTuple(*start)
+        if start in seen:
+            continue
+        region = {start}
+        queue = deque([start])
+        while queue:
+            pos = queue.popleft()
+            neighbors = pos.adjacencies(grid) if diagonals else pos.orthogonals(grid)
+            for neighbor in neighbors:
+                if neighbor not in region and grid[neighbor] == grid[start]:
+                    region.add(neighbor)
+                    queue.append(neighbor)
+        seen |= region
+        regions.append(region)
+    return regions
+
+
+class TestLabelComponents(unittest.TestCase):
+    """
+    Test the label_components function.
+    """
+
+    def test_example(self):
+        """
+        Test a small grid.
+        """
+        labels, regions = label_components(parse(["AAB", "ABB", "CCB"]))
+        np.testing.assert_array_equal(labels, [[1, 1, 2], [1, 2, 2], [3, 3, 2]])
+        self.assertEqual([region.symbol for region in regions], ["A", "B", "C"])
+        self.assertEqual([region.area for region in regions], [3, 4, 2])
+        self.assertEqual([region.perimeter for region in regions], [8, 10, 6])
+        self.assertEqual(regions[1].bounds, ((0, 1), (2, 2)))
+
+    def test_random(self):
+        """
+        Test agreement with a per-cell BFS on random grids.
+        """
+        rng = np.random.default_rng(0)
+        for connectivity in ("orthogonal", "full"):
+            grid = rng.choice(list("ABC"), (15, 17))
+            labels, regions = label_components(grid, connectivity)
+            expected = _brute_force_regions(grid, connectivity == "full")
+            self.assertEqual(len(regions), len(expected))
+            for cells in expected:
+                label = labels[next(iter(cells))]
+                region = regions[label - 1]
+                self.assertEqual(
+                    {
+                        VectorTuple(*pos)
+                        for pos in np.argwhere(labels == label).tolist()
+                    },
+                    cells,
+                )
+                self.assertEqual(region.area, len(cells))
+                self.assertEqual(
+                    region.perimeter,
+                    sum(
+                        4 - sum(neighbor in cells for neighbor in pos.orthogonals(None))
+                        for pos in cells
+                    ),
+                )
+                coords = np.array(list(cells))
+                self.assertEqual(
+                    region.bounds,
+                    (tuple(coords.min(axis=0)), tuple(coords.max(axis=0))),
+                )
+
+    def test_background(self):
+        """
+        Test background cells are left unlabeled.
+        """
+        grid = parse(["#.#", ".#.", "#.#"])
+        labels, regions = label_components(grid, "full", background=".")
+        self.assertEqual(len(regions), 1)
+        self.assertEqual(regions[0].area, 5)
+        np.testing.assert_array_equal(labels == 0, grid == ".")
+
+        labels, regions = label_components(grid, background=".")
+        self.assertEqual(len(regions), 5)
+
+    def test_invalid(self):
+        """
+        Test unsupported arguments.
+        """
+        with self.assertRaises(ValueError):
+            label_components(parse(["#"]), "hexagonal")
+        with self.assertRaises(ValueError):
+            label_components(np.zeros((2, 2, 2)))
+
+
+class TestFloodFill(unittest.TestCase):
+    """
+    Test the flood_fill function.
+    """
+
+    def test_flood_fill(self):
+        """
+        Test filling from a start cell.
+        """
+        grid = parse(["AAB", "ABB", "CCB"])
+        np.testing.assert_array_equal(
+            flood_fill(grid, VectorTuple(0, 2)),
+            grid == "B",
+        )
+        self.assertEqual(flood_fill(grid, (0, 0), "full").sum(), 3)
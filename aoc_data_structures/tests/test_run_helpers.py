@@ -0,0 +1,141 @@
+"""
+Test the run array helpers.
+"""
+
+import random
+import unittest
+import numpy as np
+from ..data_structures import IntegerSet
+from ..run_helpers import (
+    OPERATIONS,
+    as_runs,
+    cardinality,
+    clip,
+    combine,
+    concatenate,
+    covered,
+    from_flags,
+    normalize,
+    sorted_unique,
+    to_integer_set,
+)
+
+
+def random_set(seed, count=50, span=200):
+    """
+    Build a random IntegerSet from overlapping intervals.
+    """
+    rng = random.Random(seed)
+    starts = (rng.randrange(-span, span) for _ in range(count))
+    return IntegerSet(*((start, start + rng.randrange(10)) for start in starts))
+
+
+class TestCombine(unittest.TestCase):
+    """
+    Test combine() against the IntegerSet operators.
+    """
+
+    def test_random(self):
+        """
+        Test every operation on random sets.
+        """
+        for seed in range(20):
+            set_0, set_1 = random_set(seed), random_set(seed + 100)
+            expected = {
+                "union": set_0 | set_1,
+                "intersection": set_0 & set_1,
+                "difference": set_0 - set_1,
+                "symmetric_difference": set_0 ^ set_1,
+            }
+            for operation in OPERATIONS:
+                result = combine(as_runs(set_0), as_runs(set_1), operation)
+                self.assertEqual(to_integer_set(result), expected[operation])
+
+    def test_empty(self):
+        """
+        Test empty inputs.
+        """
+        empty = as_runs(IntegerSet())
+        runs = as_runs(IntegerSet((0, 5)))
+        np.testing.assert_array_equal(combine(empty, runs), runs)
+        self.assertEqual(combine(empty, runs, "intersection").shape, (0, 2))
+        self.assertEqual(combine(empty, empty).shape, (0, 2))
+
+    def test_adjacent(self):
+        """
+        Test adjacent runs are merged.
+        """
+        result = combine(as_runs([(0, 4)]), as_runs([(5, 9)]))
+        np.testing.assert_array_equal(result, [[0, 9]])
+
+    def test_operation(self):
+        """
+        Test unknown operations are rejected.
+        """
+        with self.assertRaises(ValueError):
+            combine(as_runs([]), as_runs([]), "product")
+
+
+class TestHelpers(unittest.TestCase):
+    """
+    Test the smaller run array helpers.
+    """
+
+    def test_covered(self):
+        """
+        Test vectorized membership.
+        """
+        runs = as_runs([(0, 2), (5, 5)])
+        np.testing.assert_array_equal(
+            covered(runs, np.arange(-1, 7)),
+            [False, True, True, True, False, False, True, False],
+        )
+
+    def test_cardinality(self):
+        """
+        Test cardinality matches len().
+        """
+        iset = random_set(0)
+        self.assertEqual(cardinality(as_runs(iset)), len(iset))
+
+    def test_clip(self):
+        """
+        Test clipping to closed and open ranges.
+        """
+        runs = as_runs([(0, 5), (10, 15), (20, 25)])
+        np.testing.assert_array_equal(clip(runs, 3, 12), [[3, 5], [10, 12]])
+        np.testing.assert_array_equal(clip(runs, None, 10), [[0, 5], [10, 10]])
+        np.testing.assert_array_equal(clip(runs, 16, None), [[20, 25]])
+        self.assertEqual(clip(runs, 6, 9).shape, (0, 2))
+
+    def test_concatenate(self):
+        """
+        Test runs touching across the joins are merged.
+        """
+        result = concatenate([as_runs([(0, 4)]), as_runs([(5, 6), (8, 9)])])
+        np.testing.assert_array_equal(result, [[0, 6], [8, 9]])
+        self.assertEqual(concatenate([]).shape, (0, 2))
+
+    def test_from_flags(self):
+        """
+        Test membership flags between points convert to runs.
+        """
+        points = np.array([0, 3, 5, 9])
+        flags = np.array([True, False, True, False])
+        np.testing.assert_array_equal(from_flags(points, flags), [[0, 2], [5, 8]])
+
+    def test_sorted_unique(self):
+        """
+        Test sorting and deduplication match np.unique.
+        """
+        values = np.random.default_rng(0).integers(-20, 20, 100)
+        np.testing.assert_array_equal(sorted_unique(values), np.unique(values))
+        self.assertEqual(sorted_unique(np.empty(0, dtype=np.int64)).shape, (0,))
+
+    def test_normalize(self):
+        """
+        Test unsorted, overlapping and adjacent runs are merged.
+        """
+        runs = [(10, 12), (0, 3), (2, 5), (6, 6), (11, 11), (20, 21)]
+        np.testing.assert_array_equal(normalize(runs), [[0, 6], [10, 12], [20, 21]])
+        self.assertEqual(normalize([]).shape, (0, 2))
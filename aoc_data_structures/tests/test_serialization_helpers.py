@@ -0,0 +1,168 @@
+"""
+Test the serialization helpers.
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from ..data_structures import Grid, IntegerSet
+from ..grid_helpers import parse
+from ..serialization_helpers import dumps, load, load_runs, loads, save
+
+
+class TestIntegerSet(unittest.TestCase):
+    """
+    Test IntegerSet serialization.
+    """
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix=".aocd", delete=False) as file:
+            self.path = file.name
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        """
+        Test sets survive a save/load round trip, with and without mmap.
+        """
+        iset = IntegerSet((-(2**40), -5), (0, 10), (20, 20))
+        save(self.path, iset)
+        self.assertEqual(load(self.path), iset)
+        self.assertEqual(load(self.path, use_mmap=False), iset)
+
+    def test_orientation(self):
+        """
+        Test reversed intervals are stored as ascending runs.
+        """
+        self.assertEqual(loads(dumps(IntegerSet((10, 0)))), IntegerSet((0, 10)))
+
+    def test_empty(self):
+        """
+        Test the empty set.
+        """
+        save(self.path, IntegerSet())
+        self.assertEqual(load(self.path), IntegerSet())
+        self.assertEqual(load_runs(self.path).shape, (0, 2))
+
+    def test_load_runs(self):
+        """
+        Test the runs are memory mapped and read-only.
+        """
+        save(self.path, IntegerSet((0, 10), (20, 30)))
+        runs = load_runs(self.path)
+        np.testing.assert_array_equal(runs, [[0, 10], [20, 30]])
+        self.assertFalse(runs.flags.writeable)
+
+    def test_load_runs_grid(self):
+        """
+        Test load_runs rejects grid files.
+        """
+        save(self.path, np.zeros((2, 2)))
+        with self.assertRaises(ValueError):
+            load_runs(self.path)
+
+    def test_smaller_than_pickle(self):
+        """
+        Test the format is more compact than pickle.
+        """
+        iset = IntegerSet(*((start * 10, start * 10 + 5) for start in range(1000)))
+        self.assertLess(len(dumps(iset)) * 3, len(pickle.dumps(iset)))
+
+
+class TestGrid(unittest.TestCase):
+    """
+    Test grid serialization.
+    """
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix=".aocd", delete=False) as file:
+            self.path = file.name
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        """
+        Test grids of several dtypes survive a round trip.
+        """
+        lines = ["#..", ".#.", "..#"]
+        for grid in (
+            parse(lines),
+            parse(lines, compact=True),
+            parse(lines) == "#",
+            np.arange(24, dtype=np.int64).reshape(2, 3, 4),
+            np.zeros((0, 5), dtype=np.int32),
+        ):
+            save(self.path, grid)
+            for use_mmap in (True, False):
+                loaded = load(self.path, use_mmap)
+                self.assertEqual(loaded.dtype, grid.dtype)
+                np.testing.assert_array_equal(loaded, grid)
+
+    def test_mmap_read_only(self):
+        """
+        Test memory mapped grids are read-only.
+        """
+        save(self.path, parse(["#.", ".#"], compact=True))
+        self.assertFalse(load(self.path).flags.writeable)
+
+    def test_grid(self):
+        """
+        Test Grid objects are saved as their array.
+        """
+        save(self.path, Grid(parse(["#.", ".#"])))
+        np.testing.assert_array_equal(load(self.path), parse(["#.", ".#"]))
+
+    def test_non_contiguous(self):
+        """
+        Test views are saved in C order.
+        """
+        grid = np.arange(12).reshape(3, 4).T
+        np.testing.assert_array_equal(loads(dumps(grid)), grid)
+
+    def test_payload_alignment(self):
+        """
+        Test the payload starts on a 64 byte boundary.
+        """
+        data = dumps(np.full((3, 3), 7, dtype=np.uint8))
+        self.assertEqual(len(data), 64 + 9)
+
+    def test_object(self):
+        """
+        Test object arrays are rejected.
+        """
+        with self.assertRaises(ValueError):
+            dumps(np.array([None, 1]))
+
+
+class TestInvalid(unittest.TestCase):
+    """
+    Test malformed input is rejected.
+    """
+
+    def test_magic(self):
+        """
+        Test files with the wrong magic.
+        """
+        with self.assertRaises(ValueError):
+            loads(b"PK\x03\x04" + bytes(60))
+
+    def test_version(self):
+        """
+        Test files from a newer format version.
+        """
+        data = bytearray(dumps(IntegerSet((0, 1))))
+        data[4] = 99
+        with self.assertRaises(ValueError):
+            loads(bytes(data))
+
+    def test_truncated(self):
+        """
+        Test empty files.
+        """
+        with tempfile.NamedTemporaryFile(suffix=".aocd") as file:
+            with self.assertRaises(ValueError):
+                load(file.name)
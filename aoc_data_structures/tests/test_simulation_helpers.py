@@ -0,0 +1,88 @@
+"""
+Test the simulation helpers.
+"""
+
+import unittest
+import numpy as np
+from ..simulation_helpers import find_cycle, simulate
+
+
+def _square_plus_one(value):
+    return (value * value + 1) % 255
+
+
+def _sequence(step, initial, length):
+    states = [initial]
+    for _ in range(length):
+        states.append(step(states[-1]))
+    return states
+
+
+class TestFindCycle(unittest.TestCase):
+    """
+    Test the find_cycle function.
+    """
+
+    def test_integers(self):
+        """
+        Test a cycle with a non-zero offset.
+        """
+        self.assertEqual(find_cycle(_square_plus_one, 3, hash), (2, 6))
+
+    def test_pure_cycle(self):
+        """
+        Test a cycle starting from the initial state.
+        """
+        self.assertEqual(find_cycle(lambda x: (x + 1) % 7, 0, hash), (0, 7))
+
+    def test_fixed_point(self):
+        """
+        Test a state that maps to itself.
+        """
+        self.assertEqual(find_cycle(lambda x: x, 4, hash), (0, 1))
+
+    def test_grid(self):
+        """
+        Test a grid rolled around a torus after a settling step.
+        """
+        grid = np.zeros((3, 5), dtype=np.uint8)
+        grid[0, 0] = 1
+
+        def step(state):
+            if state[0, 0] == 1 and state.sum() == 1:
+                state = state.copy()
+                state[1, 1] = 1
+            return np.roll(state, 1, axis=1)
+
+        self.assertEqual(find_cycle(step, grid), (1, 5))
+
+    def test_fingerprint_collision(self):
+        """
+        Test states with colliding fingerprints are verified.
+        """
+        self.assertEqual(
+            find_cycle(lambda x: (x + 1) % 10, 0, fingerprint=lambda x: x % 2),
+            (0, 10),
+        )
+
+
+class TestSimulate(unittest.TestCase):
+    """
+    Test the simulate function.
+    """
+
+    def test_matches_direct_simulation(self):
+        """
+        Test every iteration count before and after the cycle is found.
+        """
+        states = _sequence(_square_plus_one, 3, 60)
+        for iterations, state in enumerate(states):
+            self.assertEqual(simulate(_square_plus_one, 3, iterations, hash), state)
+
+    def test_large(self):
+        """
+        Test jumping ahead a large number of iterations.
+        """
+        grid = np.arange(6).reshape(2, 3)
+        result = simulate(lambda state: np.roll(state, 1), grid, 10**12)
+        np.testing.assert_array_equal(result, np.roll(grid, 10**12 % 6))
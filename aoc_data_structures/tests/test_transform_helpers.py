@@ -0,0 +1,152 @@
+"""
+Test the transform helpers.
+"""
+
+import unittest
+import numpy as np
+from ..data_structures import VectorTuple
+from ..grid_helpers import grid_str, parse
+from ..simulation_helpers import simulate
+from ..transform_helpers import orientations, reflect, rotate, spin, tilt, transpose
+
+EXAMPLE = [
+    "O....#....",
+    "O.OO#....#",
+    ".....##...",
+    "OO.#O....O",
+    ".O.....O#.",
+    "O.#..O.#.#",
+    "..O..#O..O",
+    ".......O..",
+    "#....###..",
+    "#OO..#....",
+]
+
+
+def _brute_force_tilt_west(lines):
+    """
+    Move each movable cell one step at a time.
+    """
+    rows = [list(line) for line in lines]
+    for row in rows:
+        moved = True
+        while moved:
+            moved = False
+            for column in range(1, len(row)):
+                if row[column] == "O" and row[column - 1] == ".":
+                    row[column - 1], row[column] = "O", "."
+                    moved = True
+    return "\n".join("".join(row) for row in rows)
+
+
+class TestViews(unittest.TestCase):
+    """
+    Test rotations and reflections.
+    """
+
+    def setUp(self):
+        self.grid = parse(["ab", "cd"])
+
+    def test_rotate(self):
+        """
+        Test clockwise rotation.
+        """
+        self.assertEqual(grid_str(rotate(self.grid)), "ca\ndb")
+        self.assertEqual(grid_str(rotate(self.grid, -1)), "bd\nac")
+        self.assertEqual(grid_str(rotate(self.grid, 4)), "ab\ncd")
+
+    def test_reflect(self):
+        """
+        Test reflections.
+        """
+        self.assertEqual(grid_str(reflect(self.grid)), "ba\ndc")
+        self.assertEqual(grid_str(reflect(self.grid, 0)), "cd\nab")
+        self.assertEqual(grid_str(transpose(self.grid)), "ac\nbd")
+
+    def test_views(self):
+        """
+        Test no data is copied.
+        """
+        for view in orientations(self.grid):
+            self.assertTrue(np.shares_memory(view, self.grid))
+
+    def test_orientations(self):
+        """
+        Test all 8 orientations are distinct.
+        """
+        self.assertEqual(len({grid_str(view) for view in orientations(self.grid)}), 8)
+
+
+class TestTilt(unittest.TestCase):
+    """
+    Test tilting.
+    """
+
+    def test_north(self):
+        """
+        Test tilting the example north.
+        """
+        self.assertEqual(
+            grid_str(tilt(parse(EXAMPLE), "north")).split(),
+            [
+                "OOOO.#.O..",
+                "OO..#....#",
+                "OO..O##..O",
+                "O..#.OO...",
+                "........#.",
+                "..#....#.#",
+                "..O..#.O.O",
+                "..O.......",
+                "#....###..",
+                "#....#....",
+            ],
+        )
+
+    def test_directions(self):
+        """
+        Test every direction against a brute force tilt of a rotated grid.
+        """
+        rng = np.random.default_rng(0)
+        grid = rng.choice(list(".O#"), (12, 9))
+        for direction, turns in (("west", 0), ("north", -1), ("east", 2), ("south", 1)):
+            expected = _brute_force_tilt_west(grid_str(rotate(grid, turns)).split())
+            result = rotate(tilt(grid, direction), turns)
+            self.assertEqual(grid_str(result), expected)
+
+    def test_direction_aliases(self):
+        """
+        Test symbolic and vector directions.
+        """
+        grid = parse(EXAMPLE)
+        for aliases in (("north", "^", VectorTuple(-1, 0)), ("east", ">", (0, 1))):
+            results = [grid_str(tilt(grid, alias)) for alias in aliases]
+            self.assertEqual(len(set(results)), 1)
+
+    def test_other_symbols(self):
+        """
+        Test symbols that aren't movable or empty block by default.
+        """
+        self.assertEqual(grid_str(tilt(parse([".OxO."]), "east")), ".Ox.O")
+        self.assertEqual(
+            grid_str(tilt(parse([".OxO."]), "east", blocker="#")),
+            "...OO",
+        )
+
+    def test_compact(self):
+        """
+        Test compact uint8 grids.
+        """
+        grid = parse(EXAMPLE)
+        compact = parse(EXAMPLE, compact=True)
+        self.assertEqual(grid_str(spin(compact)), grid_str(spin(grid)))
+
+    def test_spin_cycle(self):
+        """
+        Test a billion spin cycles.
+        """
+        grid = simulate(spin, parse(EXAMPLE), 10**9)
+        load = sum(
+            (len(grid) - row) * np.count_nonzero(grid[row] == "O")
+            for row in range(len(grid))
+        )
+        self.assertEqual(load, 64)
@@ -0,0 +1,117 @@
+"""
+Helpers for rotating, reflecting and tilting 2-D grids.  Rotations and
+reflections are returned as numpy views, so no data is copied.
+"""
+
+import numpy as np
+from .data_structures.directions import DIRECTIONS
+from .grid_helpers import symbol_code, symbol_mask
+
+
+def rotate(grid, turns=1):
+    """
+    Return a view of grid rotated clockwise by the given number of quarter
+    turns.  Negative turns rotate counter-clockwise.
+    """
+    return np.rot90(grid, -turns)
+
+
+def reflect(grid, axis=1):
+    """
+    Return a view of grid reflected along axis.  axis=1 mirrors left to right,
+    axis=0 mirrors top to bottom.
+    """
+    return np.flip(grid, axis)
+
+
+def transpose(grid):
+    """
+    Return a view of grid reflected along its main diagonal.
+    """
+    return grid.T
+
+
+def orientations(grid):
+    """
+    Yield views of all 8 rotations and reflections of grid: the 4 rotations of
+    grid, then the 4 rotations of its mirror image.
+    """
+    for view in (grid, reflect(grid)):
+        for turns in range(4):
+            yield rotate(view, turns)
+
+
+def tilt(grid, direction, movable="O", blocker=None, empty="."):
+    """
+    Slide every movable cell as far as it can go in direction, until it hits a
+    blocker, another movable cell or the edge of the grid.  Return the tilted
+    grid as a new array.
+
+    direction:  "north", "south", "east", "west", "^", "v", "<", ">" or a
+                delta such as VectorTuple(-1, 0)
+    blocker:    the symbol(s) that stop movable cells.  If None, every cell that
+                is neither movable nor empty is a blocker.  Cells that are
+                neither movable nor blockers are treated as empty space.
+
+    Rather than moving cells one at a time, each row is split into segments
+    between blockers.  The movable cells in each segment are counted, and the
+    first count cells of the segment become movable, the rest empty.
+
+    >>> grid_str(tilt(parse(["..O#.O", "O.O..O"]), "west"))
+    'O..#O.\\nOOO...'
+    """
+    axis, reverse = DIRECTIONS[tuple(direction) if len(direction) == 2 else direction]
+    moving = symbol_mask(grid, movable)
+    if blocker is None:
+        blocked = ~(moving | symbol_mask(grid, empty))
+    else:
+        blocked = symbol_mask(grid, blocker)
+
+    views = [view.T if axis == 0 else view for view in (grid, moving, blocked)]
+    if reverse:
+        views = [view[:, ::-1] for view in views]
+
+    occupied = _tilt_west(*(np.ascontiguousarray(view) for view in views[1:]))
+    result = np.where(views[2], views[0], _symbol(grid, empty))
+    result[occupied] = _symbol(grid, movable)
+
+    if reverse:
+        result = result[:, ::-1]
+    return np.ascontiguousarray(result.T if axis == 0 else result)
+
+
+def spin(grid, movable="O", blocker=None, empty="."):
+    """
+    Tilt north, west, south and then east.
+    """
+    for direction in ("north", "west", "south", "east"):
+        grid = tilt(grid, direction, movable, blocker, empty)
+    return grid
+
+
+def _tilt_west(moving, blocked):
+    """
+    Return a mask of the cells occupied by movable cells after tilting every
+    row towards column 0.
+    """
+    rows, columns = moving.shape
+    column_indices = np.arange(columns)
+
+    # every blocker starts a new segment, which begins in the next column
+    segments = np.cumsum(blocked, axis=1)
+    segments += np.arange(0, rows * (columns + 1), columns + 1)[:, np.newaxis]
+    segment_starts = np.maximum.accumulate(
+        np.where(blocked, column_indices + 1, 0), axis=1
+    )
+    counts = np.bincount(segments[moving], minlength=rows * (columns + 1))
+
+    return (column_indices - segment_starts < counts[segments]) & ~blocked
+
+
+def _symbol(grid, symbol):
+    """
+    Return symbol in the representation used by grid's dtype.
+    """
+    if grid.dtype == np.uint8:
+        return symbol_code(symbol)
+    return symbol
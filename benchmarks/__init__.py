@@ -0,0 +1,8 @@
+"""
+Performance benchmarks for the hot paths of aoc_data_structures.  Only the
+standard library is used for timing and memory measurement.
+
+Run with:
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json
+"""
@@ -0,0 +1,54 @@
+"""
+Command line entry point for the benchmarks.
+"""
+
+import argparse
+import sys
+from . import cases  # pylint: disable=unused-import
+from .runner import compare, format_comparison, load, run, save
+
+
+def main(argv=None):
+    """
+    Run the benchmarks, optionally saving the results and comparing them with
+    a saved baseline.  Return 1 if --fail-on-regression is set and any
+    benchmark is slower than the baseline.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", help="only run names containing this")
+    parser.add_argument("-o", "--output", help="save results as JSON")
+    parser.add_argument("-c", "--compare", help="baseline results to compare with")
+    parser.add_argument("--threshold", type=float, default=1.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=10**5,
+        help="skip sizes above this, 0 for no limit",
+    )
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.filter,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        max_size=args.max_size or None,
+    )
+
+    if args.output:
+        save(results, args.output)
+
+    if args.compare:
+        rows = compare(results, load(args.compare), args.threshold)
+        print()
+        print("\n".join(format_comparison(rows)))
+        if args.fail_on_regression and any(row[-1] == "slower" for row in rows):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,423 @@
+"""
+Benchmark cases.  Each case returns the callable to be timed.
+"""
+
+import atexit
+import os
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+import numpy as np
+from aoc_data_structures import (
+    BlockAllocator,
+    FrozenIntegerSet,
+    HybridIntegerSet,
+    IntegerSet,
+    Interval,
+    PersistentIntegerSet,
+    VectorTuple,
+)
+from aoc_data_structures.grid_helpers import (
+    grid_str,
+    hash_array,
+    parse,
+    parse_bytes,
+)
+from aoc_data_structures.parallel_helpers import ShardPool
+from aoc_data_structures.run_helpers import as_runs, combine
+from aoc_data_structures.serialization_helpers import dumps, load_runs, loads, save
+from .runner import benchmark
+
+RUNS = (10**3, 10**4, 10**5, 10**6)
+GRID_SIZES = (100, 1000)
+
+
+def _runs(count, seed=0, gap=5, length=10):
+    """
+    Generate count disjoint, non-adjacent intervals with random gaps.
+    """
+    rng = random.Random(seed)
+    intervals = []
+    start = 0
+    for _ in range(count):
+        end = start + rng.randint(0, length)
+        intervals.append((start, end))
+        start = end + 2 + rng.randint(0, gap)
+    return intervals
+
+
+def _lines(size, seed=0):
+    rng = np.random.default_rng(seed)
+    grid = rng.choice(list(".#O"), (size, size))
+    return ["".join(row) for row in grid]
+
+
+@benchmark("package.import_interval")
+def package_import_interval(_):
+    """
+    Start an interpreter and import Interval.  Compare with
+    package.interpreter_startup for the cost of the import itself, the target
+    is under 5 ms, with numpy and sortedcontainers left unimported.
+    """
+    command = [sys.executable, "-c", "from aoc_data_structures import Interval"]
+    return lambda: subprocess.run(command, check=True)
+
+
+@benchmark("package.interpreter_startup")
+def package_interpreter_startup(_):
+    """
+    Start an interpreter without importing anything.
+    """
+    command = [sys.executable, "-c", "pass"]
+    return lambda: subprocess.run(command, check=True)
+
+
+@benchmark("integer_set.construct", RUNS)
+def integer_set_construct(size):
+    """
+    Build an IntegerSet from disjoint intervals.
+    """
+    intervals = _runs(size)
+    return lambda: IntegerSet(*intervals)
+
+
+@benchmark("integer_set.union", RUNS)
+def integer_set_union(size):
+    """
+    Union two interleaved sets.
+    """
+    set_0 = IntegerSet(*_runs(size, seed=0))
+    set_1 = IntegerSet(*_runs(size, seed=1))
+    return lambda: set_0 | set_1
+
+
+@benchmark("integer_set.intersection", RUNS)
+def integer_set_intersection(size):
+    """
+    Intersect two interleaved sets.
+    """
+    set_0 = IntegerSet(*_runs(size, seed=0))
+    set_1 = IntegerSet(*_runs(size, seed=1))
+    return lambda: set_0 & set_1
+
+
+@benchmark("integer_set.difference", RUNS)
+def integer_set_difference(size):
+    """
+    Subtract two interleaved sets.
+    """
+    set_0 = IntegerSet(*_runs(size, seed=0))
+    set_1 = IntegerSet(*_runs(size, seed=1))
+    return lambda: set_0 - set_1
+
+
+@benchmark("integer_set.len", RUNS)
+def integer_set_len(size):
+    """
+    Count the members of a set.
+    """
+    set_0 = IntegerSet(*_runs(size))
+    return lambda: len(set_0)
+
+
+@benchmark("integer_set.contains", RUNS)
+def integer_set_contains(size):
+    """
+    Test membership of 1000 random integers.
+    """
+    set_0 = IntegerSet(*_runs(size))
+    end = set_0.intervals[-1].end
+    elements = [random.Random(0).randint(0, end) for _ in range(1000)]
+    return lambda: [element in set_0 for element in elements]
+
+
+@benchmark("frozen_integer_set.equal_lookup", RUNS[:3])
+def frozen_integer_set_equal_lookup(size):
+    """
+    Look up an equal but distinct FrozenIntegerSet in a dict.
+    """
+    seen = {FrozenIntegerSet(*_runs(size)): True}
+    key = FrozenIntegerSet(*_runs(size))
+    return lambda: seen[key]
+
+
+@benchmark("integer_set.equal", RUNS[:3])
+def integer_set_equal(size):
+    """
+    Compare two equal IntegerSets, compare with
+    frozen_integer_set.equal_lookup.
+    """
+    set_0 = IntegerSet(*_runs(size))
+    set_1 = IntegerSet(*_runs(size))
+    return lambda: set_0 == set_1
+
+
+def _scattered(count, seed=0):
+    """
+    Generate count distinct values scattered with an average gap of 8.
+    """
+    return random.Random(seed).sample(range(8 * count), count)
+
+
+@benchmark("integer_set.union_scattered", RUNS[:3])
+def integer_set_union_scattered(size):
+    """
+    Union two sets of scattered single values.
+    """
+    set_0 = IntegerSet(*((value, value) for value in _scattered(size, seed=0)))
+    set_1 = IntegerSet(*((value, value) for value in _scattered(size, seed=1)))
+    return lambda: set_0 | set_1
+
+
+@benchmark("hybrid_integer_set.union_scattered", RUNS[:3])
+def hybrid_integer_set_union_scattered(size):
+    """
+    Union two sets of scattered single values, compare with
+    integer_set.union_scattered.
+    """
+    set_0 = HybridIntegerSet.from_values(_scattered(size, seed=0))
+    set_1 = HybridIntegerSet.from_values(_scattered(size, seed=1))
+    return lambda: set_0 | set_1
+
+
+@benchmark("hybrid_integer_set.union", RUNS[:3])
+def hybrid_integer_set_union(size):
+    """
+    Union two interleaved run sets, compare with integer_set.union.
+    """
+    set_0 = HybridIntegerSet(*_runs(size, seed=0))
+    set_1 = HybridIntegerSet(*_runs(size, seed=1))
+    return lambda: set_0 | set_1
+
+
+@benchmark("integer_set.branch", RUNS[:3])
+def integer_set_branch(size):
+    """
+    Copy a set and remove a range from the copy, as a search branch would.
+    """
+    intervals = _runs(size)
+    iset = IntegerSet(*intervals)
+    start, end = intervals[size // 2]
+
+    def branch():
+        copy = iset.copy()
+        copy.difference_update(IntegerSet((start, end)))
+        return copy
+
+    return branch
+
+
+@benchmark("persistent_integer_set.branch", RUNS[:3])
+def persistent_integer_set_branch(size):
+    """
+    Derive a version with a range removed, compare with integer_set.branch.
+    """
+    intervals = _runs(size)
+    iset = PersistentIntegerSet(*intervals)
+    start, end = intervals[size // 2]
+    return lambda: iset.discard_range(start, end)
+
+
+@benchmark("integer_set.next_gap", RUNS)
+def integer_set_next_gap(size):
+    """
+    Find the first absent integer after a point in the middle of the set.
+    """
+    intervals = _runs(size)
+    iset = IntegerSet(*intervals)
+    element = intervals[size // 2][0]
+    return lambda: iset.next_gap(element)
+
+
+@benchmark("integer_set.expression", RUNS[:2])
+def integer_set_expression(size):
+    """
+    Count the members of (a | b) & (c - d) ^ e, copying each intermediate.
+    """
+    a, b, c, d, e = (IntegerSet(*_runs(size, seed)) for seed in range(5))
+    return lambda: len((a | b) & (c - d) ^ e)
+
+
+@benchmark("lazy_integer_set.expression", RUNS[:2])
+def lazy_integer_set_expression(size):
+    """
+    Count the members of (a | b) & (c - d) ^ e in one sweep, compare with
+    integer_set.expression.
+    """
+    a, b, c, d, e = (IntegerSet(*_runs(size, seed)).lazy() for seed in range(5))
+    return lambda: len((a | b) & (c - d) ^ e)
+
+
+@benchmark("block_allocator.allocate_free", RUNS[:3])
+def block_allocator_allocate_free(size):
+    """
+    First-fit allocate a block only the last free run can hold, then free it.
+    """
+    intervals = _runs(size)
+    start, end = intervals[-1]
+    intervals[-1] = (start, end + 100)
+    allocator = BlockAllocator(*intervals)
+
+    def allocate_free():
+        allocator.free(allocator.allocate(100))
+
+    return allocate_free
+
+
+@benchmark("integer_set.dilate", RUNS)
+def integer_set_dilate(size):
+    """
+    Grow every run by a radius that merges about half of them.
+    """
+    iset = IntegerSet(*_runs(size))
+    return lambda: iset.dilate(2)
+
+
+@benchmark("interval.union")
+def interval_union(_):
+    """
+    Union overlapping intervals.
+    """
+    interval_0 = Interval(0, 10)
+    interval_1 = Interval(5, 20)
+    return lambda: interval_0 | interval_1
+
+
+@benchmark("vector_tuple.add")
+def vector_tuple_add(_):
+    """
+    Add two 2-d VectorTuples.
+    """
+    pos = VectorTuple(3, 4)
+    delta = VectorTuple(1, -1)
+    return lambda: pos + delta
+
+
+@benchmark("vector_tuple.manhattan")
+def vector_tuple_manhattan(_):
+    """
+    Manhattan magnitude of a 3-d VectorTuple.
+    """
+    pos = VectorTuple(3, -4, 5)
+    return pos.manhattan
+
+
+@benchmark("vector_tuple.orthogonals")
+def vector_tuple_orthogonals(_):
+    """
+    Generate the bounded orthogonal neighbors of a 2-d VectorTuple.
+    """
+    pos = VectorTuple(5, 5)
+    grid = np.zeros((10, 10))
+    return lambda: list(pos.orthogonals(grid))
+
+
+@benchmark("vector_tuple.adjacencies")
+def vector_tuple_adjacencies(_):
+    """
+    Generate the unbounded adjacencies of a 3-d VectorTuple.
+    """
+    pos = VectorTuple(5, 5, 5)
+    return lambda: list(pos.adjacencies(None))
+
+
+@benchmark("grid_helpers.parse", GRID_SIZES)
+def grid_parse(size):
+    """
+    Parse a square grid of lines.
+    """
+    lines = _lines(size)
+    return lambda: parse(lines)
+
+
+@benchmark("grid_helpers.parse_compact", GRID_SIZES)
+def grid_parse_compact(size):
+    """
+    Parse a square grid of lines to a uint8 grid.
+    """
+    lines = _lines(size)
+    return lambda: parse(lines, compact=True)
+
+
+@benchmark("grid_helpers.parse_bytes", GRID_SIZES)
+def grid_parse_bytes(size):
+    """
+    Parse a square grid from a byte buffer.
+    """
+    buffer = "\n".join(_lines(size)).encode()
+    return lambda: parse_bytes(buffer)
+
+
+@benchmark("grid_helpers.hash_array", GRID_SIZES)
+def grid_hash_array(size):
+    """
+    Hash a square unicode grid.
+    """
+    grid = parse(_lines(size))
+    return lambda: hash_array(grid)
+
+
+@benchmark("grid_helpers.grid_str", GRID_SIZES)
+def grid_grid_str(size):
+    """
+    Render a square unicode grid.
+    """
+    grid = parse(_lines(size))
+    return lambda: grid_str(grid)
+
+
+@benchmark("serialization.pickle_loads", RUNS)
+def serialization_pickle_loads(size):
+    """
+    Unpickle an IntegerSet, for comparison with serialization.loads.
+    """
+    data = pickle.dumps(IntegerSet(*_runs(size)))
+    return lambda: pickle.loads(data)
+
+
+@benchmark("serialization.loads", RUNS)
+def serialization_loads(size):
+    """
+    Deserialize an IntegerSet from the binary format.
+    """
+    data = dumps(IntegerSet(*_runs(size)))
+    return lambda: loads(data)
+
+
+@benchmark("serialization.load_runs", RUNS)
+def serialization_load_runs(size):
+    """
+    Memory map the runs of a saved IntegerSet.  The file is removed at exit.
+    """
+    directory = tempfile.TemporaryDirectory()
+    atexit.register(directory.cleanup)
+    path = os.path.join(directory.name, "set.aocd")
+    save(path, IntegerSet(*_runs(size)))
+    return lambda: load_runs(path)
+
+
+@benchmark("run_helpers.union", RUNS)
+def run_helpers_union(size):
+    """
+    Union two interleaved run arrays, compare with integer_set.union.
+    """
+    runs_0 = as_runs(_runs(size, seed=0))
+    runs_1 = as_runs(_runs(size, seed=1))
+    return lambda: combine(runs_0, runs_1, "union")
+
+
+@benchmark("parallel.union", RUNS)
+def parallel_union(size):
+    """
+    Union two interleaved run arrays in a ShardPool using every core.  The
+    pool is started before timing, and inputs under the threshold run
+    serially.  The pool is closed at exit.
+    """
+    runs_0 = as_runs(_runs(size, seed=0))
+    runs_1 = as_runs(_runs(size, seed=1))
+    pool = ShardPool(threshold=0)
+    atexit.register(pool.close)
+    pool.union(runs_0[:10], runs_1[:10])
+    return lambda: pool.union(runs_0, runs_1)
@@ -0,0 +1,162 @@
+"""
+Registration, measurement, and comparison of benchmarks.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import time
+import timeit
+import tracemalloc
+from importlib import metadata
+
+REGISTRY = {}
+
+
+def benchmark(name, sizes=(None,)):
+    """
+    Register a benchmark.  The decorated function receives a size and returns
+    the zero argument callable to be timed, so setup work isn't measured.
+    Each size is registered as a separate benchmark named "name[size]".
+    """
+
+    def decorator(function):
+        for size in sizes:
+            key = name if size is None else f"{name}[{size}]"
+            REGISTRY[key] = (function, size)
+        return function
+
+    return decorator
+
+
+def measure(function, repeat=5, min_time=0.2):
+    """
+    Time function, returning a dict with the median and minimum seconds per
+    call and the peak memory allocated by a single call.
+    """
+    timer = timeit.Timer(function, timer=time.perf_counter)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+
+    gc.collect()
+    timings = [seconds / number for seconds in timer.repeat(repeat, number)]
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": statistics.median(timings),
+        "min_seconds": min(timings),
+        "calls": number * repeat,
+        "peak_bytes": peak,
+    }
+
+
+def run(pattern=None, repeat=5, min_time=0.2, max_size=None, log=print):
+    """
+    Run the registered benchmarks whose name contains pattern, skipping sizes
+    above max_size.  Return the results document.
+    """
+    results = {}
+
+    for name, (function, size) in REGISTRY.items():
+        if pattern is not None and pattern not in name:
+            continue
+        if max_size is not None and size is not None and size > max_size:
+            continue
+
+        results[name] = measure(function(size), repeat, min_time)
+        log(format_result(name, results[name]))
+
+    return {"meta": _metadata(), "results": results}
+
+
+def compare(results, baseline, threshold=1.1):
+    """
+    Compare results against a baseline results document.  Return a list of
+    (name, baseline seconds, current seconds, ratio, status) rows, where status
+    is "slower", "faster" or "same" based on threshold.
+    """
+    rows = []
+
+    for name, current in results["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+
+        ratio = current["seconds"] / previous["seconds"]
+        status = "same"
+        if ratio > threshold:
+            status = "slower"
+        elif ratio < 1 / threshold:
+            status = "faster"
+        rows.append((name, previous["seconds"], current["seconds"], ratio, status))
+
+    return rows
+
+
+def format_result(name, result):
+    """
+    Format a single result as a line of text.
+    """
+    return (
+        f"{name:<50} {_format_seconds(result['seconds']):>10}"
+        f" {result['peak_bytes'] / 1024:>12.1f} KiB"
+    )
+
+
+def format_comparison(rows):
+    """
+    Format comparison rows as lines of text.
+    """
+    lines = []
+    for name, previous, current, ratio, status in rows:
+        lines.append(
+            f"{name:<50} {_format_seconds(previous):>10} -> "
+            f"{_format_seconds(current):>10} {ratio:>7.2f}x {status}"
+        )
+    return lines
+
+
+def load(path):
+    """
+    Load a results document.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save(results, path):
+    """
+    Save a results document.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def _format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def _metadata():
+    versions = {}
+    for package in ("aoc-data-structures", "numpy", "sortedcontainers"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "versions": versions,
+    }